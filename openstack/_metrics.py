@@ -0,0 +1,408 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Asynchronous emission of the API request metrics.
+
+Reporting the metrics of a request only puts a small record in a bounded
+queue. A background thread drains the queue and emits the records in
+batches: one statsd pipeline (sent as multi-metric packets) per statsd
+client and one ``write_points`` call per InfluxDB client. When the queue is
+full the records are dropped and counted, so that a slow metrics backend
+never delays API requests.
+"""
+
+import atexit
+import bisect
+import json
+import queue
+import threading
+import time
+import typing as ty
+
+from openstack import _log
+
+#: Maximum number of records waiting to be emitted
+MAX_QUEUE_SIZE = 10000
+#: Maximum number of records emitted together
+MAX_BATCH_SIZE = 500
+
+
+class Record(ty.NamedTuple):
+    """The metrics of one API request"""
+
+    #: The Proxy which made the request, and holds the metrics clients
+    proxy: ty.Any
+    url: str
+    method: str
+    #: The status code of the response, None if the request failed
+    status_code: ty.Optional[int]
+    #: The duration of the request in seconds, None if it failed
+    elapsed: ty.Optional[float]
+    #: Whether the request failed without response
+    failed: bool
+    #: When the request completed, in seconds since the epoch
+    timestamp: float
+
+
+class Gauge(ty.NamedTuple):
+    """The current value of a metric of a service"""
+
+    #: The Proxy of the service, which holds the metrics clients
+    proxy: ty.Any
+    name: str
+    value: float
+    #: When the value was read, in seconds since the epoch
+    timestamp: float
+
+
+class MetricsPipeline:
+    """Bounded queue of metric records emitted by a background thread"""
+
+    def __init__(
+        self, max_queue_size=MAX_QUEUE_SIZE, max_batch_size=MAX_BATCH_SIZE
+    ):
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._max_batch_size = max_batch_size
+        self._lock = threading.Lock()
+        self._thread: ty.Optional[threading.Thread] = None
+        #: Number of records dropped because the queue was full
+        self.dropped = 0
+        self.log = _log.setup_logging('openstack.metrics')
+
+    def submit(self, record):
+        """Queue a record without blocking.
+
+        :param record: The :class:`Record` to emit.
+        :returns: Whether the record was queued.
+        """
+        self._start()
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+                dropped = self.dropped
+            if dropped == 1 or not dropped % 1000:
+                self.log.warning(
+                    "Metrics queue is full, %d records dropped so far",
+                    dropped,
+                )
+            return False
+        return True
+
+    def flush(self, timeout=None):
+        """Wait until the queued records are emitted.
+
+        :param timeout: The maximum number of seconds to wait, or None to
+            wait forever.
+        :returns: Whether all queued records were emitted.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def _start(self):
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name='openstacksdk-metrics', daemon=True
+                )
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self._max_batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._emit(batch)
+            except Exception:
+                # We do not want errors in metric reporting ever break client
+                self.log.exception("Exception reporting metrics")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _emit(self, batch):
+        statsd: ty.Dict[int, ty.Tuple[ty.Any, ty.List[Record]]] = {}
+        influxdb: ty.Dict[int, ty.Tuple[ty.Any, ty.List[Record]]] = {}
+        for record in batch:
+            proxy = record.proxy
+            if proxy._statsd_client:
+                client = proxy._statsd_client
+                statsd.setdefault(id(client), (client, []))[1].append(record)
+            if isinstance(record, Record) and (
+                proxy._prometheus_counter and proxy._prometheus_histogram
+            ):
+                try:
+                    proxy._report_stats_prometheus(record)
+                except Exception:
+                    self.log.exception("Exception reporting metrics")
+            if proxy._influxdb_client:
+                client = proxy._influxdb_client
+                influxdb.setdefault(id(client), (client, []))[1].append(record)
+
+        for client, records in statsd.values():
+            try:
+                with client.pipeline() as pipe:
+                    for record in records:
+                        try:
+                            record.proxy._report_stats_statsd(record, pipe)
+                        except Exception:
+                            self.log.exception("Exception reporting metrics")
+            except Exception:
+                self.log.exception("Exception reporting metrics")
+
+        for client, records in influxdb.values():
+            try:
+                client.write_points(
+                    [
+                        record.proxy._get_influxdb_point(record)
+                        for record in records
+                    ]
+                )
+            except Exception:
+                self.log.exception('Error writing statistics to InfluxDB')
+
+
+#: Upper bounds, in milliseconds, of the latency histogram buckets. They
+#: grow by a factor of 2 ** (1 / 4), from 0.1 ms to about 105 s, so that
+#: percentiles are estimated within 20%.
+LATENCY_BUCKETS = tuple(0.1 * 2 ** (i / 4) for i in range(81))
+
+
+class _Histogram:
+    __slots__ = ('count', 'errors', 'bytes', 'total', 'min', 'max', 'buckets')
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.bytes = 0
+        self.total = 0.0
+        self.min: ty.Optional[float] = None
+        self.max: ty.Optional[float] = None
+        # One more bucket for the values above the last bound
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def add(self, elapsed_ms, error, nbytes):
+        if elapsed_ms is not None:
+            self.count += 1
+            self.total += elapsed_ms
+            if self.min is None or elapsed_ms < self.min:
+                self.min = elapsed_ms
+            if self.max is None or elapsed_ms > self.max:
+                self.max = elapsed_ms
+            self.buckets[bisect.bisect_left(LATENCY_BUCKETS, elapsed_ms)] += 1
+        if error:
+            self.errors += 1
+        self.bytes += nbytes
+
+    def copy(self):
+        other = _Histogram()
+        for name in self.__slots__:
+            setattr(other, name, getattr(self, name))
+        other.buckets = list(self.buckets)
+        return other
+
+    def percentile(self, percent):
+        if self.min is None or self.max is None:
+            # Nothing recorded yet
+            return None
+        rank = percent / 100.0 * self.count
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if count and seen >= rank:
+                if index == len(LATENCY_BUCKETS):
+                    return self.max
+                # Report the bucket upper bound, within the observed range
+                return max(self.min, min(self.max, LATENCY_BUCKETS[index]))
+        return self.max
+
+
+class LatencyRecorder:
+    """In-process latency histograms of the API requests
+
+    Requests are accounted per service type, endpoint name (the metric name
+    built from the URL, as for statsd) and HTTP method. The histograms are
+    spread over several independently locked stripes, so that threads
+    recording different endpoints do not contend.
+    """
+
+    def __init__(self, stripes=16):
+        self._stripes: ty.List[
+            ty.Tuple[
+                ty.Dict[ty.Tuple[str, str, str], _Histogram], threading.Lock
+            ]
+        ] = [({}, threading.Lock()) for _ in range(stripes)]
+
+    def record(self, service_type, endpoint, method, elapsed, error, nbytes=0):
+        """Record a request.
+
+        :param service_type: The service type of the request.
+        :param endpoint: The metric name of the URL.
+        :param method: The HTTP method of the request.
+        :param elapsed: The duration of the request in seconds, or None if
+            it failed without a response.
+        :param error: Whether the request failed.
+        :param nbytes: The size of the response body.
+        """
+        key = (service_type, endpoint, method)
+        histograms, lock = self._stripes[hash(key) % len(self._stripes)]
+        with lock:
+            histogram = histograms.get(key)
+            if histogram is None:
+                histogram = histograms[key] = _Histogram()
+            histogram.add(
+                None if elapsed is None else elapsed * 1000, error, nbytes
+            )
+
+    def snapshot(self, reset=False):
+        """Get a consistent copy of the histograms.
+
+        :param reset: Whether to clear the histograms once copied.
+        :returns: A :class:`StatsSnapshot`.
+        """
+        entries = {}
+        for histograms, lock in self._stripes:
+            with lock:
+                if reset:
+                    entries.update(histograms)
+                    histograms.clear()
+                else:
+                    entries.update(
+                        (key, histogram.copy())
+                        for key, histogram in histograms.items()
+                    )
+        return StatsSnapshot(entries)
+
+    def reset(self):
+        """Clear the histograms."""
+        for histograms, lock in self._stripes:
+            with lock:
+                histograms.clear()
+
+
+class StatsSnapshot:
+    """Latency statistics of the API requests at a point in time
+
+    Latencies are in milliseconds. Percentiles are estimated from
+    histogram buckets growing by about 19%.
+    """
+
+    PERCENTILES = (50, 90, 99)
+
+    def __init__(self, entries):
+        self._entries = entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def as_dict(self):
+        """Return the statistics as a dict.
+
+        :returns: A dict keyed by ``<service type>.<method>.<endpoint>``,
+            the statsd metric name without prefix, of dicts with the
+            ``service_type``, ``endpoint``, ``method``, ``count``,
+            ``errors``, ``bytes``, ``mean_ms``, ``min_ms``, ``max_ms`` and
+            ``p50_ms``, ``p90_ms`` and ``p99_ms`` of the requests.
+        """
+        result = {}
+        for key in sorted(self._entries):
+            service_type, endpoint, method = key
+            histogram = self._entries[key]
+            entry = dict(
+                service_type=service_type,
+                endpoint=endpoint,
+                method=method,
+                count=histogram.count,
+                errors=histogram.errors,
+                bytes=histogram.bytes,
+                mean_ms=(
+                    histogram.total / histogram.count
+                    if histogram.count
+                    else None
+                ),
+                min_ms=histogram.min,
+                max_ms=histogram.max,
+            )
+            for percent in self.PERCENTILES:
+                entry[f'p{percent}_ms'] = histogram.percentile(percent)
+            result['.'.join([service_type, method, endpoint])] = entry
+        return result
+
+    def to_json(self, **kwargs):
+        """Return the statistics as a JSON document.
+
+        :param kwargs: Arguments of :func:`json.dumps`.
+        """
+        return json.dumps(self.as_dict(), **kwargs)
+
+    def to_text(self):
+        """Return the statistics as a human readable table."""
+        columns: ty.Tuple[str, ...] = ('count', 'errors', 'bytes', 'mean_ms')
+        columns += tuple(f'p{percent}_ms' for percent in self.PERCENTILES)
+        columns += ('max_ms',)
+        rows = [('name',) + columns]
+        for name, entry in self.as_dict().items():
+            row = [name]
+            for column in columns:
+                value = entry[column]
+                if value is None:
+                    row.append('-')
+                elif isinstance(value, float):
+                    row.append(f'{value:.1f}')
+                else:
+                    row.append(str(value))
+            rows.append(tuple(row))
+        widths = [
+            max(len(row[i]) for row in rows) for i in range(len(rows[0]))
+        ]
+        return '\n'.join(
+            '  '.join(
+                cell.ljust(width) if not i else cell.rjust(width)
+                for i, (cell, width) in enumerate(zip(row, widths))
+            )
+            for row in rows
+        )
+
+
+_pipeline: ty.Optional[MetricsPipeline] = None
+_pipeline_lock = threading.Lock()
+
+
+def get_pipeline():
+    """Get the metrics pipeline of the process."""
+    global _pipeline
+    if _pipeline is None:
+        with _pipeline_lock:
+            if _pipeline is None:
+                _pipeline = MetricsPipeline()
+    return _pipeline
+
+
+@atexit.register
+def _flush_at_exit():
+    if _pipeline is not None:
+        _pipeline.flush(timeout=1)
@@ -10,7 +10,6 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
-from openstack.accelerator.v2 import _proxy as _proxy_v2
 from openstack import service_description
 
 
@@ -18,5 +17,5 @@ class AcceleratorService(service_description.ServiceDescription):
     """The accelerator service."""
 
     supported_versions = {
-        '2': _proxy_v2.Proxy,
+        '2': 'openstack.accelerator.v2._proxy.Proxy',
     }
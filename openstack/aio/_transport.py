@@ -0,0 +1,133 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""HTTP transports of the asyncio connection.
+
+A transport sends fully prepared requests and returns
+:class:`requests.Response` objects, so that the responses are handled by the
+same code as the ones of the thread-based proxies.
+"""
+
+import asyncio
+import functools
+import ssl
+
+import requests
+from requests import structures
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+class ThreadTransport:
+    """Send the requests with :mod:`requests` from a thread pool
+
+    This is the fallback used when aiohttp is not installed: the number of
+    concurrent requests is bounded by the size of the executor.
+
+    :param session: The :class:`~keystoneauth1.session.Session` whose
+        connection pool and TLS settings are used.
+    :param executor: The :class:`concurrent.futures.Executor` running the
+        requests.
+    """
+
+    def __init__(self, session, executor):
+        self._session = session
+        self._executor = executor
+
+    async def send(self, method, url, headers, data=None):
+        kwargs = dict(headers=headers, data=data, verify=self._session.verify)
+        if self._session.cert:
+            kwargs['cert'] = self._session.cert
+        if self._session.timeout is not None:
+            kwargs['timeout'] = self._session.timeout
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor,
+            functools.partial(
+                self._session.session.request, method, url, **kwargs
+            ),
+        )
+
+    async def close(self):
+        pass
+
+
+class AiohttpTransport:
+    """Send the requests with aiohttp
+
+    :param session: The :class:`~keystoneauth1.session.Session` whose TLS
+        settings and timeout are used.
+    :param int limit: The maximum number of simultaneous connections.
+    """
+
+    def __init__(self, session, limit=100):
+        self._session = session
+        self._limit = limit
+        self._client = None
+
+    def _get_ssl_context(self):
+        verify = self._session.verify
+        if verify is False:
+            return False
+        context = ssl.create_default_context(
+            cafile=verify if isinstance(verify, str) else None
+        )
+        cert = self._session.cert
+        if isinstance(cert, (tuple, list)):
+            context.load_cert_chain(*cert)
+        elif cert:
+            context.load_cert_chain(cert)
+        return context
+
+    def _get_client(self):
+        if self._client is None:
+            self._client = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self._limit, ssl=self._get_ssl_context()
+                ),
+                timeout=aiohttp.ClientTimeout(total=self._session.timeout),
+            )
+        return self._client
+
+    async def send(self, method, url, headers, data=None):
+        async with self._get_client().request(
+            method, url, headers=headers, data=data
+        ) as resp:
+            content = await resp.read()
+        response = requests.Response()
+        response.status_code = resp.status
+        response.reason = resp.reason
+        response.headers = structures.CaseInsensitiveDict(resp.headers)
+        response.url = str(resp.url)
+        response.encoding = resp.charset
+        response._content = content
+        response.request = requests.Request(method, url).prepare()
+        return response
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+
+def get_transport(session, executor):
+    """Get the best transport available.
+
+    :returns: An :class:`AiohttpTransport` if aiohttp is installed, a
+        :class:`ThreadTransport` otherwise.
+    """
+    if aiohttp is not None:
+        return AiohttpTransport(session)
+    return ThreadTransport(session, executor)
@@ -0,0 +1,171 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import asyncio
+import concurrent.futures
+import functools
+
+from keystoneauth1 import exceptions as ks_exceptions
+
+from openstack.aio import _transport
+from openstack.aio import proxy as _proxy
+from openstack import connection as _connection
+from openstack import service_description
+from openstack import version as openstack_version
+
+#: Default number of threads running the blocking operations, such as
+#: authentication and version discovery
+DEFAULT_MAX_WORKERS = 8
+
+
+class Connection:
+    """Asynchronous connection to a cloud.
+
+    The services of the cloud are available as attributes, as on
+    :class:`openstack.connection.Connection`, and their
+    :class:`~openstack.aio.proxy.Proxy` offers coroutines to list, fetch,
+    create, update, delete and wait for resources::
+
+        async with openstack.aio.Connection(cloud='example') as conn:
+            async for server in conn.compute.list('server'):
+                print(server.name)
+
+    The configuration, authentication and service catalog come from an
+    :class:`openstack.connection.Connection`, created from the given
+    arguments unless passed as ``connection``. The few blocking operations,
+    such as fetching a token or discovering the versions of a service, run
+    in a small thread pool, while the API requests are sent with aiohttp
+    when it is installed.
+
+    :param connection: An existing :class:`openstack.connection.Connection`
+        to use. It is left open by :meth:`close`.
+    :param transport: The transport sending the requests, see
+        :mod:`openstack.aio._transport`.
+    :param int max_workers: The number of threads running the blocking
+        operations, and the requests when aiohttp is not installed.
+    :param kwargs: The arguments of :class:`openstack.connection.Connection`.
+    """
+
+    def __init__(
+        self,
+        connection=None,
+        transport=None,
+        max_workers=DEFAULT_MAX_WORKERS,
+        **kwargs,
+    ):
+        # Only close the connection when it was created here
+        self._owns_connection = connection is None
+        if connection is None:
+            connection = _connection.Connection(**kwargs)
+        #: The thread-based connection
+        self.connection = connection
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix='openstacksdk-aio'
+        )
+        self._transport = transport
+        self._proxies = {}
+        self._auth_headers = None
+        self._auth_lock = None
+
+    def __getattr__(self, name):
+        if name.startswith('_') or name == 'connection':
+            raise AttributeError(name)
+        if not isinstance(
+            getattr(type(self.connection), name, None),
+            service_description.ServiceDescription,
+        ):
+            raise AttributeError(name)
+        proxy = self._proxies.get(name)
+        if proxy is None:
+            proxy = self._proxies[name] = _proxy.Proxy(self, name)
+        return proxy
+
+    async def _run(self, fn, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(fn, *args, **kwargs)
+        )
+
+    def _get_transport(self):
+        if self._transport is None:
+            self._transport = _transport.get_transport(
+                self.connection.session, self._executor
+            )
+        return self._transport
+
+    def _get_user_agent(self):
+        session = self.connection.session
+        if session.user_agent:
+            return session.user_agent
+        agent = []
+        if session.app_name:
+            agent.append(
+                '/'.join(filter(None, [session.app_name, session.app_version]))
+            )
+        agent.extend('%s/%s' % item for item in session.additional_user_agent)
+        if not any(item.startswith('openstacksdk/') for item in agent):
+            agent.append('openstacksdk/%s' % openstack_version.__version__)
+        return ' '.join(agent)
+
+    async def _get_auth_headers(self, expired=None):
+        """Get the authentication headers, fetching a token when needed.
+
+        :param dict expired: The headers the service rejected. Unless
+            another task already replaced them, the token is invalidated and
+            a new one is fetched.
+        """
+        session = self.connection.session
+        auth = session.auth
+        if auth is None:
+            return {}
+        # Plugins which do not expire never need to authenticate again
+        needs_reauthenticate = getattr(
+            auth, '_needs_reauthenticate', lambda: False
+        )
+        if (
+            expired is None
+            and self._auth_headers is not None
+            and not needs_reauthenticate()
+        ):
+            return self._auth_headers
+        if self._auth_lock is None:
+            self._auth_lock = asyncio.Lock()
+        # Only one task fetches a new token, the others wait for it
+        async with self._auth_lock:
+            if expired is not None and expired == self._auth_headers:
+                await self._run(session.invalidate)
+                self._auth_headers = None
+            if self._auth_headers is None or needs_reauthenticate():
+                headers = await self._run(session.get_auth_headers)
+                if headers is None:
+                    raise ks_exceptions.AuthorizationFailure(
+                        'No valid authentication is available'
+                    )
+                self._auth_headers = headers
+            return self._auth_headers
+
+    async def close(self):
+        """Release the transport, the threads and the connection.
+
+        A connection passed to the constructor is not closed.
+        """
+        if self._transport is not None:
+            await self._transport.close()
+        self._executor.shutdown(wait=False)
+        if self._owns_connection:
+            self.connection.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
@@ -0,0 +1,474 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import asyncio
+import contextvars
+import json
+import time
+import urllib.parse
+
+from keystoneauth1 import session as ks_session
+
+from openstack import _log
+from openstack import exceptions
+from openstack import resource
+from openstack import utils
+
+# The delay requested by the last Retry-After header of the current task
+_retry_after: contextvars.ContextVar = contextvars.ContextVar(
+    'openstack_aio_retry_after', default=None
+)
+
+
+async def iterate_timeout(timeout, message, wait=2, backoff=None):
+    """Iterate and raise an exception on timeout, without blocking.
+
+    The asynchronous version of :func:`openstack.utils.iterate_timeout`,
+    honouring the ``Retry-After`` headers received by the current task.
+    """
+    if wait is None:
+        wait = 2
+    elif wait == 0:
+        wait = 0.1 if timeout is None else min(0.1, timeout)
+    backoff = utils.get_backoff(backoff)
+    delays = backoff.delays(float(wait))
+    _retry_after.set(None)
+
+    start = time.monotonic()
+    count = 0
+    while timeout is None or time.monotonic() < start + timeout:
+        count += 1
+        yield count
+        delay = next(delays)
+        if backoff.retry_after and _retry_after.get():
+            delay = max(delay, _retry_after.get())
+        _retry_after.set(None)
+        await asyncio.sleep(delay)
+    raise exceptions.ResourceTimeout(message)
+
+
+class Proxy:
+    """Asynchronous client of a service.
+
+    It wraps the thread-based :class:`~openstack.proxy.Proxy` of the service,
+    whose configuration, endpoint lookup and microversion negotiation are
+    reused, while the requests are sent by the transport of the
+    :class:`~openstack.aio.connection.Connection`. Resources are the usual
+    :class:`~openstack.resource.Resource` classes, given either as classes or
+    by their name in the ``_resource_registry`` of the service proxy, such
+    as ``'server'``.
+    """
+
+    def __init__(self, connection, service_name):
+        self._connection = connection
+        self._service_name = service_name
+        self._adapter = None
+        self._endpoint = None
+        self._microversions = {}
+        self.log = _log.setup_logging(f'openstack.aio.{service_name}')
+
+    async def get_adapter(self):
+        """Get the thread-based proxy of the service."""
+        if self._adapter is None:
+            self._adapter = await self._connection._run(
+                getattr, self._connection.connection, self._service_name
+            )
+        return self._adapter
+
+    async def get_endpoint(self):
+        """Get the endpoint of the service."""
+        if self._endpoint is None:
+            adapter = await self.get_adapter()
+            endpoint = await self._connection._run(adapter.get_endpoint)
+            if not endpoint:
+                raise exceptions.EndpointNotFound(
+                    f"No endpoint found for the {self._service_name} service"
+                )
+            self._endpoint = endpoint
+        return self._endpoint
+
+    async def _get_microversion(self, resource_type, action):
+        key = (resource_type, action)
+        if key not in self._microversions:
+            adapter = await self.get_adapter()
+            # Negotiating the microversion may need a version discovery
+            self._microversions[key] = await self._connection._run(
+                resource_type._get_microversion, adapter, action=action
+            )
+        return self._microversions[key]
+
+    async def _get_resource_type(self, resource_type):
+        if not isinstance(resource_type, str):
+            return resource_type
+        adapter = await self.get_adapter()
+        try:
+            return adapter._resource_registry[resource_type]
+        except KeyError:
+            raise exceptions.SDKException(
+                f"Unknown resource type {resource_type} of the "
+                f"{self._service_name} service"
+            )
+
+    async def _get_resource(self, resource_type, value, **attrs):
+        resource_type = await self._get_resource_type(resource_type)
+        adapter = await self.get_adapter()
+        return adapter._get_resource(resource_type, value, **attrs)
+
+    async def request(
+        self,
+        url,
+        method,
+        *,
+        json=None,
+        headers=None,
+        params=None,
+        microversion=None,
+    ):
+        """Send a request to the service.
+
+        :param str url: The URL, relative to the endpoint of the service.
+        :param str method: The HTTP method.
+        :param json: The body of the request, encoded as JSON.
+        :param dict headers: Additional headers.
+        :param dict params: The query parameters.
+        :param str microversion: The microversion of the request. Defaults
+            to the default microversion of the service, if any.
+        :returns: A :class:`requests.Response`, whatever its status code.
+        """
+        adapter = await self.get_adapter()
+        if not urllib.parse.urlparse(url).netloc:
+            url = utils.urljoin(await self.get_endpoint(), url)
+        params = {k: v for k, v in (params or {}).items() if v is not None}
+        if params:
+            url += '&' if '?' in url else '?'
+            url += urllib.parse.urlencode(params, doseq=True)
+
+        request_headers = {
+            'User-Agent': self._connection._get_user_agent(),
+            'Accept': 'application/json',
+        }
+        data = None
+        if json is not None:
+            request_headers['Content-Type'] = 'application/json'
+            data = _dumps(json)
+        request_headers.update(headers or {})
+        if microversion is None:
+            microversion = adapter.default_microversion
+        if microversion:
+            ks_session.Session._set_microversion_headers(
+                request_headers, microversion, adapter.service_type, None
+            )
+        global_request_id = self._connection.connection._global_request_id
+        if global_request_id:
+            request_headers['X-OpenStack-Request-ID'] = global_request_id
+
+        auth_headers = await self._connection._get_auth_headers()
+        request_headers.update(auth_headers)
+        transport = self._connection._get_transport()
+        response = await transport.send(method, url, request_headers, data)
+        if response.status_code == 401 and auth_headers:
+            # The token may have been revoked or expired early, try once
+            # more with a new one
+            request_headers.update(
+                await self._connection._get_auth_headers(expired=auth_headers)
+            )
+            response = await transport.send(method, url, request_headers, data)
+
+        self.log.debug("%s %s returned %s", method, url, response.status_code)
+        if 'Retry-After' in response.headers:
+            _retry_after.set(
+                utils.parse_retry_after(response.headers['Retry-After'])
+            )
+        return response
+
+    async def list(
+        self,
+        resource_type,
+        paginated=True,
+        base_path=None,
+        *,
+        microversion=None,
+        headers=None,
+        **params,
+    ):
+        """List resources, fetching the pages as they are consumed.
+
+        This is an asynchronous generator, taking the same parameters as
+        :meth:`openstack.resource.Resource.list`.
+        """
+        resource_type = await self._get_resource_type(resource_type)
+        if not resource_type.allow_list:
+            raise exceptions.MethodNotSupported(resource_type, 'list')
+        if microversion is None:
+            microversion = await self._get_microversion(resource_type, 'list')
+        if base_path is None:
+            base_path = resource_type.base_path
+        uri, query_params, uri_params, matches = resource_type._get_list_query(
+            base_path, params
+        )
+        limit = query_params.get('limit')
+        connection = (await self.get_adapter())._get_connection()
+
+        total_yielded = 0
+        while uri:
+            response = await self.request(
+                uri,
+                'GET',
+                headers=headers,
+                params=query_params.copy(),
+                microversion=microversion,
+            )
+            exceptions.raise_from_response(response)
+            last_marker = query_params.pop('marker', None)
+            query_params.pop('limit', None)
+
+            data = response.json()
+            if resource_type.resources_key:
+                resources = data[resource_type.resources_key]
+            else:
+                resources = data
+            if not isinstance(resources, list):
+                resources = [resources]
+
+            marker = None
+            for raw_resource in resources:
+                raw_resource.pop("self", None)
+                raw_resource.update(uri_params)
+                value = resource_type.existing(
+                    microversion=microversion,
+                    connection=connection,
+                    **raw_resource,
+                )
+                marker = value.id
+                total_yielded += 1
+                if matches is None or matches(value):
+                    yield value
+
+            if not resources or not paginated:
+                return
+            uri, next_params = resource_type._get_next_link(
+                uri, response, data, marker, limit, total_yielded
+            )
+            if next_params.get('marker', object()) == last_marker:
+                raise exceptions.SDKException(
+                    'Endless pagination loop detected, aborting'
+                )
+            query_params.update(next_params)
+
+    async def get(
+        self,
+        resource_type,
+        value,
+        requires_id=True,
+        base_path=None,
+        *,
+        microversion=None,
+        **attrs,
+    ):
+        """Fetch a resource.
+
+        :param resource_type: The resource class or its name.
+        :param value: The ID or an instance of the resource.
+        :returns: The resource.
+        :raises: :class:`~openstack.exceptions.ResourceNotFound` when no
+            resource can be found.
+        """
+        res = await self._get_resource(resource_type, value, **attrs)
+        return await self._fetch(
+            res, requires_id, base_path, microversion=microversion
+        )
+
+    async def _fetch(
+        self, res, requires_id=True, base_path=None, *, microversion=None
+    ):
+        if not res.allow_fetch:
+            raise exceptions.MethodNotSupported(res, 'fetch')
+        request = res._prepare_request(
+            requires_id=requires_id, base_path=base_path
+        )
+        if microversion is None:
+            microversion = await self._get_microversion(type(res), 'fetch')
+        response = await self.request(
+            request.url, 'GET', microversion=microversion
+        )
+        res.microversion = microversion
+        res._translate_response(response)
+        return res
+
+    async def create(
+        self,
+        resource_type,
+        base_path=None,
+        *,
+        microversion=None,
+        **attrs,
+    ):
+        """Create a resource.
+
+        :param resource_type: The resource class or its name.
+        :param attrs: The attributes of the new resource.
+        :returns: The created resource.
+        """
+        res = await self._get_resource(resource_type, None, **attrs)
+        request = res._prepare_create_request(base_path=base_path)
+        if microversion is None:
+            microversion = await self._get_microversion(type(res), 'create')
+        response = await self.request(
+            request.url,
+            res.create_method,
+            json=request.body,
+            headers=request.headers,
+            microversion=microversion,
+        )
+        has_body = (
+            res.has_body
+            if res.create_returns_body is None
+            else res.create_returns_body
+        )
+        res.microversion = microversion
+        res._translate_response(response, has_body=has_body)
+        if res.has_body and res.create_returns_body is False:
+            return await self._fetch(res)
+        return res
+
+    async def update(
+        self,
+        resource_type,
+        value,
+        base_path=None,
+        *,
+        microversion=None,
+        **attrs,
+    ):
+        """Update a resource with the changed attributes.
+
+        :param resource_type: The resource class or its name.
+        :param value: The ID or an instance of the resource.
+        :param attrs: The attributes to update.
+        :returns: The updated resource.
+        """
+        res = await self._get_resource(resource_type, value, **attrs)
+        request = res._prepare_commit_request(base_path=base_path)
+        if request is None:
+            return res
+        if microversion is None:
+            microversion = await self._get_microversion(type(res), 'commit')
+        response = await self.request(
+            request.url,
+            res.commit_method,
+            json=request.body,
+            headers=request.headers,
+            microversion=microversion,
+        )
+        res.microversion = microversion
+        res._translate_response(response)
+        return res
+
+    async def delete(
+        self,
+        resource_type,
+        value,
+        ignore_missing=True,
+        *,
+        microversion=None,
+        **attrs,
+    ):
+        """Delete a resource.
+
+        :param resource_type: The resource class or its name.
+        :param value: The ID or an instance of the resource.
+        :param bool ignore_missing: When set to ``False``
+            :class:`~openstack.exceptions.ResourceNotFound` will be raised
+            when the resource does not exist.
+        :returns: The deleted resource, or None if it did not exist.
+        """
+        res = await self._get_resource(resource_type, value, **attrs)
+        if not res.allow_delete:
+            raise exceptions.MethodNotSupported(res, 'delete')
+        request = res._prepare_request()
+        if microversion is None:
+            microversion = await self._get_microversion(type(res), 'delete')
+        response = await self.request(
+            request.url,
+            'DELETE',
+            headers=request.headers,
+            microversion=microversion,
+        )
+        try:
+            res._translate_response(response, has_body=False)
+        except exceptions.ResourceNotFound:
+            if ignore_missing:
+                return None
+            raise
+        return res
+
+    async def wait_for_status(
+        self,
+        res,
+        status,
+        failures=None,
+        interval=2,
+        wait=120,
+        attribute='status',
+        backoff=None,
+    ):
+        """Wait for a resource to be in a particular status.
+
+        Takes the same parameters as
+        :func:`openstack.resource.wait_for_status`, without the callback.
+
+        :returns: The updated resource.
+        """
+        current_status = getattr(res, attribute)
+        if resource._normalize_status(
+            current_status
+        ) == resource._normalize_status(status):
+            return res
+        failures = [f.lower() for f in (failures or ['ERROR'])]
+        name = f"{res.__class__.__name__}:{res.id}"
+        msg = f"Timeout waiting for {name} to transition to {status}"
+        backoff = resource._get_backoff(await self.get_adapter(), backoff)
+
+        async for _ in iterate_timeout(wait, msg, interval, backoff):
+            res = await self._fetch(res)
+            new_status = resource._normalize_status(getattr(res, attribute))
+            if new_status == resource._normalize_status(status):
+                return res
+            elif new_status in failures:
+                raise exceptions.ResourceFailure(
+                    f"{name} transitioned to failure state "
+                    f"{getattr(res, attribute)}"
+                )
+            self.log.debug(
+                'Still waiting for resource %s to reach state %s, '
+                'current state is %s',
+                name,
+                status,
+                new_status,
+            )
+
+    async def wait_for_delete(self, res, interval=2, wait=120, backoff=None):
+        """Wait for a resource to be deleted.
+
+        :returns: The resource, once it no longer exists.
+        """
+        msg = f"Timeout waiting for {res.__class__.__name__}:{res.id} delete"
+        backoff = resource._get_backoff(await self.get_adapter(), backoff)
+        async for _ in iterate_timeout(wait, msg, interval, backoff):
+            try:
+                await self._fetch(res)
+            except exceptions.ResourceNotFound:
+                return res
+
+
+def _dumps(body):
+    return json.dumps(body, default=str).encode('utf-8')
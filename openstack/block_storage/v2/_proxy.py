@@ -918,6 +918,7 @@ class Proxy(_base_proxy.BaseBlockStorageProxy):
         interval=2,
         wait=120,
         callback=None,
+        backoff=None,
     ):
         """Wait for a resource to be in a particular status.
 
@@ -933,6 +934,9 @@ class Proxy(_base_proxy.BaseBlockStorageProxy):
             Default to 120.
         :param callback: A callback function. This will be called with a single
             value, progress.
+        :param backoff: The polling strategy, see
+            :func:`~openstack.utils.get_backoff`. Defaults to the
+            ``polling_strategy`` of the cloud config.
 
         :returns: The resource is returned on success.
         :raises: :class:`~openstack.exceptions.ResourceTimeout` if transition
@@ -951,9 +955,77 @@ class Proxy(_base_proxy.BaseBlockStorageProxy):
             interval,
             wait,
             callback=callback,
+            backoff=backoff,
         )
 
-    def wait_for_delete(self, res, interval=2, wait=120, callback=None):
+    def wait_for_many(
+        self,
+        resources,
+        status='available',
+        failures=None,
+        interval=2,
+        wait=120,
+        callback=None,
+        backoff=None,
+    ):
+        """Wait for several resources to be in a particular status.
+
+        Resources of the same type are refreshed with a single list call per
+        check, using the ``detail`` listings and filtered by status and
+        project when all the pending resources share them. Only resources
+        missing from that listing are fetched one by one.
+
+        :param resources: The resources to wait on to reach the specified
+            status. The resources must have a ``status`` attribute. Values
+            which are not :class:`~openstack.resource.Resource` objects are
+            interpreted as volume IDs.
+        :param str status: Desired status.
+        :param list failures: Statuses that would be interpreted as failures.
+        :param interval: Number of seconds to wait before to consecutive
+            checks. Default to 2.
+        :param wait: Maximum number of seconds to wait before the change.
+            Default to 120.
+        :param callback: A callback function. This will be called with each
+            resource as soon as it reaches the desired status.
+        :param backoff: The polling strategy, see
+            :func:`~openstack.utils.get_backoff`. Defaults to the
+            ``polling_strategy`` of the cloud config.
+
+        :returns: A list with, in the order of ``resources``, either the
+            updated resource or the
+            :class:`~openstack.exceptions.ResourceFailure` explaining why it
+            did not reach the desired status.
+        :raises: :class:`~openstack.exceptions.ResourceTimeout` if transition
+            to the desired status failed to occur in specified seconds.
+        """
+        failures = ['error'] if failures is None else failures
+        resources = [
+            (
+                res
+                if isinstance(res, resource.Resource)
+                else self._get_resource(_volume.Volume, res)
+            )
+            for res in resources
+        ]
+        return resource.wait_for_many(
+            self,
+            resources,
+            status,
+            failures,
+            interval,
+            wait,
+            callback=callback,
+            list_base_path={
+                _volume.Volume: '/volumes/detail',
+                _snapshot.Snapshot: '/snapshots/detail',
+                _backup.Backup: '/backups/detail',
+            },
+            backoff=backoff,
+        )
+
+    def wait_for_delete(
+        self, res, interval=2, wait=120, callback=None, backoff=None
+    ):
         """Wait for a resource to be deleted.
 
         :param res: The resource to wait on to be deleted.
@@ -964,6 +1036,9 @@ class Proxy(_base_proxy.BaseBlockStorageProxy):
             Default to 120.
         :param callback: A callback function. This will be called with a single
             value, progress.
+        :param backoff: The polling strategy, see
+            :func:`~openstack.utils.get_backoff`. Defaults to the
+            ``polling_strategy`` of the cloud config.
 
         :returns: The resource is returned on success.
         :raises: :class:`~openstack.exceptions.ResourceTimeout` if transition
@@ -975,4 +1050,5 @@ class Proxy(_base_proxy.BaseBlockStorageProxy):
             interval,
             wait,
             callback=callback,
+            backoff=backoff,
         )
@@ -10,11 +10,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from openstack.accelerator.v2._proxy import Proxy
+import typing as ty
+
+if ty.TYPE_CHECKING:
+    from openstack.accelerator.v2._proxy import Proxy
 
 
 class AcceleratorCloudMixin:
-    accelerator: Proxy
+    accelerator: 'Proxy'
 
     def list_deployables(self, filters=None):
         """List all available deployables.
@@ -12,14 +12,17 @@
 
 import contextlib
 import sys
+import typing as ty
 import warnings
 
 import jsonpatch
 
-from openstack.baremetal.v1._proxy import Proxy
 from openstack import exceptions
 from openstack import warnings as os_warnings
 
+if ty.TYPE_CHECKING:
+    from openstack.baremetal.v1._proxy import Proxy
+
 
 def _normalize_port_list(nics):
     ports = []
@@ -42,7 +45,7 @@ def _normalize_port_list(nics):
 
 
 class BaremetalCloudMixin:
-    baremetal: Proxy
+    baremetal: 'Proxy'
 
     def list_nics(self):
         """Return a list of all bare metal ports."""
@@ -10,16 +10,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import typing as ty
 import warnings
 
-from openstack.block_storage.v3._proxy import Proxy
 from openstack.cloud import _utils
 from openstack import exceptions
 from openstack import warnings as os_warnings
 
+if ty.TYPE_CHECKING:
+    from openstack.block_storage.v3._proxy import Proxy
+
 
 class BlockStorageCloudMixin:
-    block_storage: Proxy
+    block_storage: 'Proxy'
 
     # TODO(stephenfin): Remove 'cache' in a future major version
     def list_volumes(self, cache=True):
@@ -688,8 +691,14 @@ class BlockStorageCloudMixin:
 
         :returns: A list of volume ``Volume`` objects, if any are found.
         """
-        volumes = self.list_volumes()
-        return _utils._filter_list(volumes, name_or_id, filters)
+        from openstack.block_storage.v3 import volume as _volume
+
+        def list_volumes(**query):
+            return list(self.block_storage.volumes(**query))
+
+        return _utils._search_resources(
+            list_volumes, _volume.Volume, name_or_id, filters
+        )
 
     def search_volume_snapshots(self, name_or_id=None, filters=None):
         """Search for one or more volume snapshots.
@@ -715,8 +724,14 @@ class BlockStorageCloudMixin:
 
         :returns: A list of volume ``Snapshot`` objects, if any are found.
         """
-        volumesnapshots = self.list_volume_snapshots()
-        return _utils._filter_list(volumesnapshots, name_or_id, filters)
+        from openstack.block_storage.v3 import snapshot as _snapshot
+
+        def list_volume_snapshots(**query):
+            return self.list_volume_snapshots(filters=query)
+
+        return _utils._search_resources(
+            list_volume_snapshots, _snapshot.Snapshot, name_or_id, filters
+        )
 
     def search_volume_backups(self, name_or_id=None, filters=None):
         """Search for one or more volume backups.
@@ -742,8 +757,14 @@ class BlockStorageCloudMixin:
 
         :returns: A list of volume ``Backup`` objects, if any are found.
         """
-        volume_backups = self.list_volume_backups()
-        return _utils._filter_list(volume_backups, name_or_id, filters)
+        from openstack.block_storage.v3 import backup as _backup
+
+        def list_volume_backups(**query):
+            return self.list_volume_backups(filters=query)
+
+        return _utils._search_resources(
+            list_volume_backups, _backup.Backup, name_or_id, filters
+        )
 
     # TODO(stephenfin): Remove 'get_extra' in a future major version
     def search_volume_types(
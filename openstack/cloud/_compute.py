@@ -14,17 +14,19 @@ import base64
 import functools
 import operator
 import time
+import typing as ty
 
 import iso8601
 
 from openstack.cloud import _utils
 from openstack.cloud import exc
 from openstack.cloud import meta
-from openstack.compute.v2._proxy import Proxy
-from openstack.compute.v2 import server as _server
 from openstack import exceptions
 from openstack import utils
 
+if ty.TYPE_CHECKING:
+    from openstack.compute.v2._proxy import Proxy
+
 
 _SERVER_FIELDS = (
     'accessIPv4',
@@ -69,7 +71,7 @@ def _pop_or_get(resource, key, default, strict):
 
 
 class ComputeCloudMixin:
-    compute: Proxy
+    compute: 'Proxy'
 
     @property
     def _compute_region(self):
@@ -165,10 +167,24 @@ class ComputeCloudMixin:
         :returns: A list of compute ``Server`` objects matching the search
             criteria.
         """
-        servers = self.list_servers(
-            detailed=detailed, all_projects=all_projects, bare=bare
+        from openstack.compute.v2 import server as _server
+
+        def list_servers(**query):
+            return self.list_servers(
+                detailed=detailed,
+                all_projects=all_projects,
+                bare=bare,
+                filters=query,
+            )
+
+        # The compute API matches the name as a regular expression
+        return _utils._search_resources(
+            list_servers,
+            _server.Server,
+            name_or_id,
+            filters,
+            name_is_regex=True,
         )
-        return _utils._filter_list(servers, name_or_id, filters)
 
     def search_server_groups(self, name_or_id=None, filters=None):
         """Search server groups.
@@ -361,12 +377,15 @@ class ComputeCloudMixin:
         if not filters:
             filters = {}
 
+        servers = self.compute.servers(
+            all_projects=all_projects,
+            **filters,
+        )
+        if detailed and not bare:
+            # Look up the details of all the servers at once
+            return meta.get_hostvars_from_servers(self, servers)
         return [
-            self._expand_server(server, detailed, bare)
-            for server in self.compute.servers(
-                all_projects=all_projects,
-                **filters,
-            )
+            self._expand_server(server, detailed, bare) for server in servers
         ]
 
     def list_server_groups(self):
@@ -1406,6 +1425,8 @@ class ComputeCloudMixin:
         if not wait:
             return True
 
+        from openstack.compute.v2 import server as _server
+
         if not isinstance(server, _server.Server):
             # We might come here with Munch object (at the moment).
             # If this is the case - convert it into real server to be able to
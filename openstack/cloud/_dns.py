@@ -10,14 +10,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import typing as ty
+
 from openstack.cloud import _utils
-from openstack.dns.v2._proxy import Proxy
 from openstack import exceptions
 from openstack import resource
 
+if ty.TYPE_CHECKING:
+    from openstack.dns.v2._proxy import Proxy
+
 
 class DnsCloudMixin:
-    dns: Proxy
+    dns: 'Proxy'
 
     def list_zones(self, filters=None):
         """List all available zones.
@@ -12,20 +12,23 @@
 
 import ipaddress
 import time
+import typing as ty
 import warnings
 
 from openstack.cloud import _utils
 from openstack.cloud import exc
 from openstack.cloud import meta
 from openstack import exceptions
-from openstack.network.v2._proxy import Proxy
 from openstack import proxy
 from openstack import utils
 from openstack import warnings as os_warnings
 
+if ty.TYPE_CHECKING:
+    from openstack.network.v2._proxy import Proxy
+
 
 class FloatingIPCloudMixin:
-    network: Proxy
+    network: 'Proxy'
 
     def __init__(self):
         self.private = self.config.config.get('private', False)
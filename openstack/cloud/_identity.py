@@ -10,17 +10,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import typing as ty
 import warnings
 
 from openstack.cloud import _utils
 from openstack import exceptions
-from openstack.identity.v3._proxy import Proxy
 from openstack import utils
 from openstack import warnings as os_warnings
 
+if ty.TYPE_CHECKING:
+    from openstack.identity.v3._proxy import Proxy
+
 
 class IdentityCloudMixin:
-    identity: Proxy
+    identity: 'Proxy'
 
     def _get_project_id_param_dict(self, name_or_id):
         if name_or_id:
@@ -131,8 +134,14 @@ class IdentityCloudMixin:
         :param domain_id: Domain ID to scope the searched projects.
         :returns: A list of identity ``Project`` objects.
         """
-        projects = self.list_projects(domain_id=domain_id, filters=filters)
-        return _utils._filter_list(projects, name_or_id, filters)
+        from openstack.identity.v3 import project as _project
+
+        def list_projects(**query):
+            return self.list_projects(domain_id=domain_id, filters=query)
+
+        return _utils._search_resources(
+            list_projects, _project.Project, name_or_id, filters
+        )
 
     def get_project(self, name_or_id, filters=None, domain_id=None):
         """Get exactly one project.
@@ -10,14 +10,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import typing as ty
+
 from openstack.cloud import _utils
 from openstack import exceptions
-from openstack.image.v2._proxy import Proxy
 from openstack import utils
 
+if ty.TYPE_CHECKING:
+    from openstack.image.v2._proxy import Proxy
+
 
 class ImageCloudMixin:
-    image: Proxy
+    image: 'Proxy'
 
     def __init__(self):
         self.image_api_use_tasks = self.config.config['image_api_use_tasks']
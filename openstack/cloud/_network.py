@@ -10,14 +10,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import typing as ty
+
 from openstack.cloud import _utils
 from openstack.cloud import exc
 from openstack import exceptions
-from openstack.network.v2._proxy import Proxy
+
+if ty.TYPE_CHECKING:
+    from openstack.network.v2._proxy import Proxy
 
 
 class NetworkCloudMixin:
-    network: Proxy
+    network: 'Proxy'
 
     def _neutron_extensions(self):
         extensions = set()
@@ -11,13 +11,16 @@
 # limitations under the License.
 
 import concurrent.futures
+import typing as ty
 import urllib.parse
 
 import keystoneauth1.exceptions
 
 from openstack.cloud import _utils
 from openstack import exceptions
-from openstack.object_store.v1._proxy import Proxy
+
+if ty.TYPE_CHECKING:
+    from openstack.object_store.v1._proxy import Proxy
 
 DEFAULT_OBJECT_SEGMENT_SIZE = 1073741824  # 1GB
 # This halves the current default for Swift
@@ -31,7 +34,7 @@ OBJECT_CONTAINER_ACLS = {
 
 
 class ObjectStoreCloudMixin:
-    object_store: Proxy
+    object_store: 'Proxy'
 
     # TODO(stephenfin): Remove 'full_listing' as it's a noop
     def list_containers(self, full_listing=True, prefix=None):
@@ -10,14 +10,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import typing as ty
+
 from openstack.cloud import _utils
 from openstack import exceptions
 from openstack.orchestration.util import event_utils
-from openstack.orchestration.v1._proxy import Proxy
+
+if ty.TYPE_CHECKING:
+    from openstack.orchestration.v1._proxy import Proxy
 
 
 class OrchestrationCloudMixin:
-    orchestration: Proxy
+    orchestration: 'Proxy'
 
     def get_template_contents(
         self,
@@ -10,26 +10,37 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import typing as ty
+
 from openstack.cloud import _utils
 from openstack.cloud import exc
 from openstack import exceptions
-from openstack.network.v2._proxy import Proxy
 from openstack import proxy
 from openstack import utils
 
+if ty.TYPE_CHECKING:
+    from openstack.network.v2._proxy import Proxy
+
 
 class SecurityGroupCloudMixin:
-    network: Proxy
+    network: 'Proxy'
 
     def __init__(self):
         self.secgroup_source = self.config.config['secgroup_source']
 
     def search_security_groups(self, name_or_id=None, filters=None):
+        from openstack.network.v2 import security_group as _security_group
+
+        def list_security_groups(**query):
+            return self.list_security_groups(filters=query)
+
         # `filters` could be a dict or a jmespath (str)
-        groups = self.list_security_groups(
-            filters=filters if isinstance(filters, dict) else None
+        return _utils._search_resources(
+            list_security_groups,
+            _security_group.SecurityGroup,
+            name_or_id,
+            filters,
         )
-        return _utils._filter_list(groups, name_or_id, filters)
 
     def list_security_groups(self, filters=None):
         """List all available security groups.
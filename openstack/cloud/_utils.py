@@ -12,8 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
 import contextlib
 import fnmatch
+import functools
 import inspect
 import re
 import uuid
@@ -24,6 +26,7 @@ import netifaces
 
 from openstack import _log
 from openstack import exceptions
+from openstack import resource
 
 
 def _dictify_resource(resource):
@@ -36,9 +39,119 @@ def _dictify_resource(resource):
             return resource
 
 
-def _filter_list(data, name_or_id, filters):
+#: Names which match themselves, and possibly others, as a regex
+_PLAIN_NAME = re.compile(r'[\w .:@/-]+')
+_HEX_PREFIX = re.compile(r'[0-9a-fA-F-]+')
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_pattern(name_or_id):
+    try:
+        return re.compile(fnmatch.translate(name_or_id))
+    except re.error:
+        # If the fnmatch re doesn't compile, then we don't care,
+        # but log it in case the user DID pass a pattern but did
+        # it poorly and wants to know what went wrong with their
+        # search
+        return None
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_jmespath(expression):
+    return jmespath.compile(expression)
+
+
+def _get_identifier_index(data):
+    """Get the positions of the elements of a list by ID and name.
+
+    The index is meant to be built once by the owner of a list which is
+    searched several times, and passed to :func:`_filter_list`.
+    """
+    index = collections.defaultdict(list)
+    for position, e in enumerate(data):
+        e_id = str(e.get('id', None))
+        e_name = str(e.get('name', None))
+        index[e_id].append(position)
+        if e_name != e_id:
+            index[e_name].append(position)
+    index.default_factory = None
+    return index
+
+
+def _match_identifier(e, name_or_id):
+    return (
+        str(e.get('id', None)) == name_or_id
+        or str(e.get('name', None)) == name_or_id
+    )
+
+
+def _compile_dict_filter(filters, log):
+    """Compile a dict of filters into a function matching one element."""
+    checks = []
+    for key, value in filters.items():
+        if isinstance(value, dict):
+            checks.append((key, _compile_dict_filter(value, log), None))
+        else:
+            checks.append((key, None, value))
+
+    def _dict_filter(d, e):
+        if not d:
+            return False
+        for key, nested, value in checks:
+            if key not in d:
+                log.warning(
+                    "Invalid filter: %s is not an attribute of %s.%s",
+                    key,
+                    e.__class__.__module__,
+                    e.__class__.__qualname__,
+                )
+                # we intentionally skip this since the user was trying to
+                # filter on _something_, but we don't know what that
+                # _something_ was
+                raise AttributeError(key)
+            if nested is not None:
+                if not nested(d.get(key, None), e):
+                    return False
+            elif d.get(key, None) != value:
+                return False
+        return True
+
+    return _dict_filter
+
+
+def _filter_pattern(data, name_or_id, log):
+    identifier_matches = []
+    bad_pattern = False
+    fn_reg = _compile_pattern(name_or_id)
+    for e in data:
+        e_id = str(e.get('id', None))
+        e_name = str(e.get('name', None))
+
+        if (e_id and e_id == name_or_id) or (e_name and e_name == name_or_id):
+            identifier_matches.append(e)
+        else:
+            # Only try fnmatch if we don't match exactly
+            if not fn_reg:
+                # If we don't have a pattern, skip this, but set the flag
+                # so that we log the bad pattern
+                bad_pattern = True
+                continue
+            if (e_id and fn_reg.match(e_id)) or (
+                e_name and fn_reg.match(e_name)
+            ):
+                identifier_matches.append(e)
+    if not identifier_matches and bad_pattern:
+        log.debug("Bad pattern passed to fnmatch: %s", name_or_id)
+    return identifier_matches
+
+
+def _filter_list(data, name_or_id, filters, index=None):
     """Filter a list by name/ID and arbitrary meta data.
 
+    A name or ID which is not a pattern is compared to the ID and name of
+    each element, or looked up in ``index`` when one is given. The patterns
+    and jmespath expressions are compiled once.
+
     :param list data: The list of dictionary data to filter. It is expected
         that each dictionary contains an 'id' and 'name' key if a value for
         name_or_id is given.
@@ -58,6 +171,8 @@ def _filter_list(data, name_or_id, filters):
 
         A string containing a jmespath expression for further filtering.
         Invalid filters will be ignored.
+    :param dict index: The index of ``data`` returned by
+        :func:`_get_identifier_index`, for a list searched several times.
     """
     # The logger is openstack.cloud.fmmatch to allow a user/operator to
     # configure logging not to communicate about fnmatch misses
@@ -66,72 +181,143 @@ def _filter_list(data, name_or_id, filters):
     if name_or_id:
         # name_or_id might already be unicode
         name_or_id = str(name_or_id)
-        identifier_matches = []
-        bad_pattern = False
-        try:
-            fn_reg = re.compile(fnmatch.translate(name_or_id))
-        except re.error:
-            # If the fnmatch re doesn't compile, then we don't care,
-            # but log it in case the user DID pass a pattern but did
-            # it poorly and wants to know what went wrong with their
-            # search
-            fn_reg = None
-        for e in data:
-            e_id = str(e.get('id', None))
-            e_name = str(e.get('name', None))
-
-            if (e_id and e_id == name_or_id) or (
-                e_name and e_name == name_or_id
-            ):
-                identifier_matches.append(e)
+        if isinstance(data, list) and not any(c in name_or_id for c in '*?['):
+            # Without any wildcard, the pattern only matches the exact name
+            # or ID
+            if index is None:
+                data = [e for e in data if _match_identifier(e, name_or_id)]
             else:
-                # Only try fnmatch if we don't match exactly
-                if not fn_reg:
-                    # If we don't have a pattern, skip this, but set the flag
-                    # so that we log the bad pattern
-                    bad_pattern = True
-                    continue
-                if (e_id and fn_reg.match(e_id)) or (
-                    e_name and fn_reg.match(e_name)
-                ):
-                    identifier_matches.append(e)
-        if not identifier_matches and bad_pattern:
-            log.debug("Bad pattern passed to fnmatch", exc_info=True)
-        data = identifier_matches
+                data = [
+                    data[position] for position in index.get(name_or_id, [])
+                ]
+        else:
+            data = _filter_pattern(data, name_or_id, log)
 
     if not filters:
         return data
 
     if isinstance(filters, str):
-        return jmespath.search(filters, data)
+        return _compile_jmespath(filters).search(data)
 
-    def _dict_filter(f, d):
-        if not d:
-            return False
-        for key in f.keys():
-            if key not in d:
-                log.warning(
-                    "Invalid filter: %s is not an attribute of %s.%s",
-                    key,
-                    e.__class__.__module__,
-                    e.__class__.__qualname__,
-                )
-                # we intentionally skip this since the user was trying to
-                # filter on _something_, but we don't know what that
-                # _something_ was
-                raise AttributeError(key)
-            if isinstance(f[key], dict):
-                if not _dict_filter(f[key], d.get(key, None)):
-                    return False
-            elif d.get(key, None) != f[key]:
-                return False
-        return True
+    dict_filter = _compile_dict_filter(filters, log)
+    return [e for e in data if dict_filter(e, e)]
 
-    filtered = []
-    for e in data:
-        if _dict_filter(filters, e):
-            filtered.append(e)
-    return filtered
+
+def _get_search_query(resource_type, filters, name_is_regex=False):
+    """Get the query parameters of the filters the API applies.
+
+    Only the scalar filters which are both an attribute and a query
+    parameter of the resource are sent, so the API returns the elements
+    matching them, and possibly others.
+
+    :param resource_type: The :class:`~openstack.resource.Resource` subclass
+        being listed.
+    :param filters: The filters given to a search method.
+    :param bool name_is_regex: Whether the API matches the name as a regular
+        expression, in which case only plain names are sent.
+    :returns: A dict of query parameters.
+    """
+    if not isinstance(filters, dict):
+        # jmespath expressions are only applied client side
+        return {}
+    query = {}
+    for key, value in filters.items():
+        if not isinstance(value, str):
+            continue
+        if key not in resource_type._query_mapping._mapping:
+            continue
+        if not isinstance(getattr(resource_type, key, None), resource.Body):
+            continue
+        if key == 'name' and name_is_regex and not _is_plain_name(value):
+            continue
+        query[key] = value
+    return query
+
+
+def _is_plain_name(name):
+    return _PLAIN_NAME.fullmatch(name) is not None
+
+
+def _get_name_query(name_or_id, name_is_regex=False):
+    """Get the name query parameter matching a name, ID or pattern.
+
+    :returns: The value of the name query parameter, or None when the API
+        cannot narrow the search.
+    """
+    if not any(c in name_or_id for c in '*?['):
+        if name_is_regex and not _is_plain_name(name_or_id):
+            return None
+        return name_or_id
+    prefix = name_or_id[:-1]
+    if (
+        name_is_regex
+        and name_or_id.endswith('*')
+        and prefix
+        and _is_plain_name(prefix)
+        and not _HEX_PREFIX.fullmatch(prefix)
+    ):
+        # A prefix pattern, such as 'web*', is a regular expression anchored
+        # at the start of the name. It is only sent when it cannot be the
+        # start of an ID, which the pattern matches too.
+        return '^' + prefix
+    return None
+
+
+def _search_resources(
+    list_function, resource_type, name_or_id, filters, name_is_regex=False
+):
+    """Search for resources, having the API filter them when it can.
+
+    The name and the filters supported by the query parameters of the
+    resource are sent to the API, and the rest are applied client side with
+    :func:`_filter_list`, which also applies all of them again to the
+    narrowed list. A name or ID is looked up both by name and by ID when the
+    API supports it, and in the whole listing when it is not found by name
+    otherwise.
+
+    :param list_function: The function listing the resources, called with
+        the query parameters as keyword arguments.
+    :param resource_type: The :class:`~openstack.resource.Resource` subclass
+        being listed.
+    :param string name_or_id: The name or ID of the resources. Can be a glob
+        pattern, such as 'nb01*'.
+    :param filters: A dictionary of meta data or a jmespath expression, as
+        accepted by :func:`_filter_list`.
+    :param bool name_is_regex: Whether the API matches the name as a regular
+        expression, like the compute API does, rather than exactly.
+    """
+    query = _get_search_query(resource_type, filters, name_is_regex)
+    mapping = resource_type._query_mapping._mapping
+    if name_or_id:
+        name_or_id = str(name_or_id)
+    name = None
+    if name_or_id and 'name' in mapping:
+        name = _get_name_query(name_or_id, name_is_regex)
+    by_id = name == name_or_id and 'id' in mapping
+    if name is None or (
+        name == name_or_id and not by_id and _is_uuid_like(name_or_id)
+    ):
+        # A UUID the API cannot look up is most likely an ID, which only the
+        # full listing finds
+        return _filter_list(list_function(**query), name_or_id, filters)
+
+    lookups = [{'name': name}]
+    if by_id:
+        # A UUID is most likely an ID, anything else a name
+        if _is_uuid_like(name_or_id):
+            lookups.insert(0, {'id': name_or_id})
+        else:
+            lookups.append({'id': name_or_id})
+    for lookup in lookups:
+        data = _filter_list(
+            list_function(**dict(query, **lookup)), name_or_id, filters
+        )
+        if data:
+            return data
+    if by_id or name != name_or_id:
+        return []
+    # Not a name, but it might be an ID the API cannot look up
+    return _filter_list(list_function(**query), name_or_id, filters)
 
 
 def _get_entity(cloud, resource, name_or_id, filters, **kwargs):
@@ -34,7 +34,9 @@ def output_format_dict(data, use_yaml):
 def parse_args():
     parser = argparse.ArgumentParser(description='OpenStack Inventory Module')
     parser.add_argument(
-        '--refresh', action='store_true', help='Refresh cached information'
+        '--refresh',
+        action='store_true',
+        help='Refresh cached information and rebuild the inventory snapshots',
     )
     group = parser.add_mutually_exclusive_group(required=True)
     group.add_argument(
@@ -50,6 +52,12 @@ def parse_args():
     parser.add_argument(
         '--cloud', default=None, help='Return data for one cloud only'
     )
+    parser.add_argument(
+        '--timeout',
+        type=float,
+        default=None,
+        help='Seconds to wait for the servers of each cloud',
+    )
     parser.add_argument(
         '--yaml',
         action='store_true',
@@ -70,10 +78,13 @@ def main():
     try:
         openstack.enable_logging(debug=args.debug)
         inventory = openstack.cloud.inventory.OpenStackInventory(
-            refresh=args.refresh, private=args.private, cloud=args.cloud
+            refresh=args.refresh,
+            private=args.private,
+            cloud=args.cloud,
+            incremental=True,
         )
         if args.list:
-            output = inventory.list_hosts()
+            output = inventory.list_hosts(timeout=args.timeout)
         elif args.host:
             output = inventory.get_host(args.host)
         print(output_format_dict(output, args.yaml))
@@ -12,15 +12,98 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import concurrent.futures
+import contextlib
 import functools
+import json
+import os
+import queue
+import tempfile
+import threading
+import time
 
+import iso8601
+
+from openstack import _log
 from openstack.cloud import _utils
 from openstack.config import loader
 from openstack import connection
 from openstack import exceptions
+from openstack import resource
+from openstack import utils
 
 __all__ = ['OpenStackInventory']
 
+#: Default maximum number of clouds listed concurrently
+DEFAULT_MAX_WORKERS = 8
+
+#: Default number of seconds after which an inventory snapshot is rebuilt
+#: from a full listing
+DEFAULT_SNAPSHOT_MAX_AGE = 3600
+
+#: Version of the format of the inventory snapshots
+_SNAPSHOT_VERSION = 1
+
+
+def _to_json(value):
+    # Nested resources are not always serializable through their dict
+    # interface
+    if isinstance(value, resource.Resource):
+        return value.to_dict()
+    elif isinstance(value, dict):
+        return {key: _to_json(item) for key, item in value.items()}
+    elif isinstance(value, (list, tuple)):
+        return [_to_json(item) for item in value]
+    return value
+
+
+def _latest(timestamp, other):
+    if not other:
+        return timestamp
+    if not timestamp or (
+        iso8601.parse_date(other) > iso8601.parse_date(timestamp)
+    ):
+        return other
+    return timestamp
+
+
+def _submit_all(calls, max_workers):
+    """Run calls on at most max_workers daemon threads
+
+    Unlike the workers of a ThreadPoolExecutor, which the interpreter joins
+    at exit, daemon threads let the process exit while a call which timed
+    out still runs.
+
+    :param calls: A list of (function, args) tuples.
+    :returns: The list of the futures of the calls.
+    """
+    work: queue.SimpleQueue = queue.SimpleQueue()
+    futures = []
+    for fn, args in calls:
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        work.put((future, fn, args))
+        futures.append(future)
+
+    def worker():
+        while True:
+            try:
+                future, fn, args = work.get_nowait()
+            except queue.Empty:
+                return
+            # Skip the calls cancelled before they started
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args))
+            except BaseException as e:
+                future.set_exception(e)
+
+    for index in range(max(1, min(max_workers, len(futures)))):
+        threading.Thread(
+            target=worker, name=f'openstack-inventory-{index}', daemon=True
+        ).start()
+    return futures
+
 
 class OpenStackInventory:
     # Put this here so the capability can be detected with hasattr on the class
@@ -35,7 +118,15 @@ class OpenStackInventory:
         config_defaults=None,
         cloud=None,
         use_direct_get=False,
+        max_workers=DEFAULT_MAX_WORKERS,
+        incremental=False,
+        snapshot_max_age=DEFAULT_SNAPSHOT_MAX_AGE,
     ):
+        self.log = _log.setup_logging('openstack')
+        self.max_workers = max_workers
+        self.incremental = incremental
+        self.snapshot_max_age = snapshot_max_age
+        self.private = private
         if config_files is None:
             config_files = []
         config = loader.OpenStackConfig(
@@ -61,29 +152,321 @@ class OpenStackInventory:
         if refresh:
             for cloud in self.clouds:
                 cloud._cache.invalidate()
+        # The clouds whose snapshot is rebuilt on the next listing
+        self._refresh = set(self.clouds) if refresh else set()
+        # The hosts of the last complete listing and their name and ID index,
+        # by expand and all_projects, searched until the hosts are listed
+        # again
+        self._hosts = {}
+
+    def _get_snapshot_path(self, cloud, settings):
+        name = '{}-{}-{}{}.json'.format(
+            cloud.name,
+            cloud.config.get_region_name() or 'default',
+            settings['project_id'] or 'default',
+            '-private' if settings['private'] else '',
+        )
+        return os.path.join(
+            cloud.config.get_cache_path(),
+            'inventory',
+            name.replace(os.sep, '_'),
+        )
+
+    def _load_snapshot(self, path, settings):
+        try:
+            with open(path) as f:
+                snapshot = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            self.log.debug(
+                "Ignoring the invalid inventory snapshot %s",
+                path,
+                exc_info=True,
+            )
+            return None
+        if (
+            snapshot.get('version') != _SNAPSHOT_VERSION
+            or any(
+                snapshot.get(key) != value for key, value in settings.items()
+            )
+            or not snapshot.get('changes_since')
+            or not isinstance(snapshot.get('created_at'), (int, float))
+        ):
+            return None
+        if (
+            self.snapshot_max_age is not None
+            and time.time() - snapshot['created_at'] > self.snapshot_max_age
+        ):
+            # Rebuild old snapshots, as the expanded information of the
+            # servers which did not change goes stale, and the servers
+            # deleted long ago may no longer be listed as such
+            self.log.debug("Rebuilding the old inventory snapshot %s", path)
+            return None
+        return snapshot
+
+    def _save_snapshot(self, path, snapshot):
+        directory = os.path.dirname(path)
+        temp_path = None
+        try:
+            os.makedirs(directory, exist_ok=True)
+            # Replace the snapshot atomically, so that concurrent runs never
+            # read a partial one
+            with tempfile.NamedTemporaryFile(
+                'w', dir=directory, suffix='.tmp', delete=False
+            ) as f:
+                temp_path = f.name
+                json.dump(_to_json(snapshot), f)
+            os.replace(temp_path, path)
+        except (OSError, TypeError, ValueError):
+            # The snapshot is only an optimization of the next listing
+            self.log.warning(
+                "Failed to save the inventory snapshot %s",
+                path,
+                exc_info=True,
+            )
+            if temp_path is not None:
+                with contextlib.suppress(OSError):
+                    os.unlink(temp_path)
+
+    def _sync_cloud_hosts(self, cloud, expand, all_projects):
+        """List the hosts of a cloud, updating its snapshot.
+
+        Only the servers changed since the last listing are listed and
+        expanded, the servers deleted since then being listed with the
+        ``DELETED`` status.
+        """
+        settings = {
+            'expand': expand,
+            'all_projects': all_projects,
+            'private': self.private,
+            'project_id': cloud.current_project_id,
+        }
+        path = self._get_snapshot_path(cloud, settings)
+        snapshot = None
+        if cloud in self._refresh:
+            self._refresh.discard(cloud)
+        else:
+            snapshot = self._load_snapshot(path, settings)
+
+        if snapshot is None:
+            hosts = {}
+            changes_since = None
+            created_at = time.time()
+            changed = cloud.list_servers(
+                detailed=expand, all_projects=all_projects
+            )
+        else:
+            hosts = {
+                host['id']: utils.munchify(host) for host in snapshot['hosts']
+            }
+            changes_since = snapshot['changes_since']
+            created_at = snapshot['created_at']
+            changed = cloud.list_servers(
+                detailed=expand,
+                all_projects=all_projects,
+                filters={'changes_since': changes_since},
+            )
+        self.log.debug(
+            "Listed %(count)d changed hosts of cloud %(cloud)s since "
+            "%(changes_since)s",
+            {
+                'count': len(changed),
+                'cloud': cloud.name,
+                'changes_since': changes_since or 'the beginning',
+            },
+        )
+
+        for host in changed:
+            if host['status'] == 'DELETED':
+                hosts.pop(host['id'], None)
+            else:
+                hosts[host['id']] = host
+            # The time of the cloud is used, so that its clock does not need
+            # to be in sync with the local one
+            changes_since = _latest(changes_since, host['updated_at'])
+
+        self._save_snapshot(
+            path,
+            dict(
+                settings,
+                version=_SNAPSHOT_VERSION,
+                created_at=created_at,
+                changes_since=changes_since,
+                hosts=list(hosts.values()),
+            ),
+        )
+        return list(hosts.values())
+
+    def _list_cloud_hosts(self, cloud, expand, all_projects, started):
+        started[cloud] = start = time.monotonic()
+        if self.incremental:
+            hosts = self._sync_cloud_hosts(cloud, expand, all_projects)
+        else:
+            hosts = cloud.list_servers(
+                detailed=expand, all_projects=all_projects
+            )
+        self.log.debug(
+            "Listed %(count)d hosts of cloud %(cloud)s in region %(region)s"
+            " in %(time).2f seconds",
+            {
+                'count': len(hosts),
+                'cloud': cloud.name,
+                'region': cloud.config.get_region_name(),
+                'time': time.monotonic() - start,
+            },
+        )
+        return hosts
 
     def list_hosts(
-        self, expand=True, fail_on_cloud_config=True, all_projects=False
+        self,
+        expand=True,
+        fail_on_cloud_config=True,
+        all_projects=False,
+        timeout=None,
     ):
-        hostvars = []
+        """List the servers of all the clouds.
 
-        for cloud in self.clouds:
-            try:
-                # Cycle on servers
-                for server in cloud.list_servers(
-                    detailed=expand, all_projects=all_projects
-                ):
-                    hostvars.append(server)
-            except exceptions.SDKException:
-                # Don't fail on one particular cloud as others may work
-                if fail_on_cloud_config:
-                    raise
+        The clouds are listed concurrently, by at most ``max_workers``
+        threads, and their hosts are returned in the order of the clouds.
+
+        With ``incremental``, the hosts of each cloud region and project are
+        kept in a snapshot in the cache directory. The following listings
+        only fetch and expand the servers which changed since the previous
+        one, unless the inventory was created with ``refresh`` or the
+        snapshot is older than ``snapshot_max_age`` seconds. The hosts
+        restored from a snapshot are plain dicts rather than server
+        resources.
 
+        The hosts listed from all the clouds are kept for
+        :meth:`search_hosts` and :meth:`get_host`, until they are listed
+        again.
+
+        :param expand: Whether to add the detailed information of the
+            servers.
+        :param fail_on_cloud_config: Whether to raise the error of a cloud
+            which cannot be listed, rather than returning the hosts of the
+            other clouds.
+        :param all_projects: Whether to list the servers of all the projects.
+        :param timeout: The number of seconds to wait for each cloud once its
+            listing started, or None to wait indefinitely. A cloud which takes
+            longer fails with :class:`~openstack.exceptions.ResourceTimeout`.
+        :returns: A list of hosts.
+        """
+        started = {}
+        calls = [
+            (self._list_cloud_hosts, (cloud, expand, all_projects, started))
+            for cloud in self.clouds
+        ]
+        futures = dict(zip(_submit_all(calls, self.max_workers), self.clouds))
+        results = {}
+        pending = set(futures)
+        try:
+            while pending:
+                wait = None
+                if timeout is not None:
+                    # Wake up when the first running listing times out, the
+                    # queued ones are checked again after a full timeout
+                    now = time.monotonic()
+                    deadlines = [
+                        started[futures[future]] + timeout
+                        for future in pending
+                        if futures[future] in started
+                    ]
+                    wait = max(0, min(deadlines, default=now + timeout) - now)
+                done, pending = concurrent.futures.wait(
+                    pending,
+                    timeout=wait,
+                    return_when=concurrent.futures.FIRST_COMPLETED,
+                )
+                for future in done:
+                    cloud = futures[future]
+                    try:
+                        results[cloud] = future.result()
+                    except exceptions.SDKException:
+                        # Don't fail on one particular cloud as others may
+                        # work
+                        if fail_on_cloud_config:
+                            raise
+                        self.log.debug(
+                            "Failed to list the hosts of cloud %(cloud)s",
+                            {'cloud': cloud.name},
+                            exc_info=True,
+                        )
+                if timeout is None:
+                    continue
+                now = time.monotonic()
+                for future in list(pending):
+                    cloud = futures[future]
+                    if cloud not in started or started[cloud] + timeout > now:
+                        continue
+                    pending.discard(future)
+                    message = (
+                        f"Timeout listing the hosts of cloud {cloud.name} "
+                        f"after {timeout} seconds"
+                    )
+                    if fail_on_cloud_config:
+                        raise exceptions.ResourceTimeout(message)
+                    self.log.warning(message)
+        finally:
+            # Don't start the listings left once failed, the ones which
+            # timed out keep running on daemon threads
+            for future in futures:
+                future.cancel()
+
+        hostvars = []
+        for cloud in self.clouds:
+            hostvars.extend(results.get(cloud, []))
+        key = (expand, all_projects)
+        if len(results) == len(self.clouds):
+            # Keep a copy, the caller may change the returned list
+            self._hosts[key] = (list(hostvars), None)
+        else:
+            self._hosts.pop(key, None)
         return hostvars
 
+    def _get_hosts(self, expand, indexed):
+        """Get the kept hosts and their index, listing them if needed.
+
+        :param expand: Whether the hosts have the detailed information of
+            the servers.
+        :param indexed: Whether to build the name and ID index of the hosts
+            if it does not exist yet.
+        :returns: A tuple of the hosts and their index, which is None unless
+            built.
+        """
+        key = (expand, False)
+        kept = self._hosts.get(key)
+        if kept is None:
+            hosts = self.list_hosts(expand=expand)
+            kept = self._hosts.get(key)
+            if kept is None:
+                # Some clouds could not be listed, nothing was kept
+                return hosts, None
+        hosts, index = kept
+        if index is None and indexed:
+            index = _utils._get_identifier_index(hosts)
+            # Unless the hosts were listed again meanwhile
+            if self._hosts.get(key) is kept:
+                self._hosts[key] = (hosts, index)
+        return hosts, index
+
     def search_hosts(self, name_or_id=None, filters=None, expand=True):
-        hosts = self.list_hosts(expand=expand)
-        return _utils._filter_list(hosts, name_or_id, filters)
+        """Search the hosts of all the clouds.
+
+        The hosts of the last :meth:`list_hosts` call are searched, the
+        names and IDs being looked up in an index built once per listing.
+        The hosts are only listed when they were not listed yet.
+
+        :param name_or_id: The name or ID of the hosts, or a glob pattern.
+        :param filters: A dict of meta data of the hosts, or a jmespath
+            expression.
+        :param expand: Whether to search the hosts with the detailed
+            information of the servers.
+        :returns: A list of hosts.
+        """
+        hosts, index = self._get_hosts(expand, indexed=bool(name_or_id))
+        return _utils._filter_list(hosts, name_or_id, filters, index=index)
 
     def get_host(self, name_or_id, filters=None, expand=True):
         if expand:
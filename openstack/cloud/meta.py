@@ -12,10 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
 import ipaddress
 import socket
 
 from openstack import _log
+from openstack.cloud import _utils
 from openstack import exceptions
 from openstack import utils
 
@@ -411,7 +413,15 @@ def _make_address_dict(fip, port):
     return address
 
 
-def _get_supplemental_addresses(cloud, server):
+def _get_server_floating_ips(cloud, server):
+    for port in cloud.search_ports(filters=dict(device_id=server['id'])):
+        # This SHOULD return one and only one FIP - but doing it as a
+        # search/list lets the logic work regardless
+        for fip in cloud.search_floating_ips(filters=dict(port_id=port['id'])):
+            yield fip, port
+
+
+def _get_supplemental_addresses(cloud, server, details=None):
     fixed_ip_mapping = {}
     for name, network in server['addresses'].items():
         for address in network:
@@ -429,29 +439,26 @@ def _get_supplemental_addresses(cloud, server):
             and cloud._has_floating_ips()
             and server['status'] == 'ACTIVE'
         ):
-            for port in cloud.search_ports(
-                filters=dict(device_id=server['id'])
-            ):
-                # This SHOULD return one and only one FIP - but doing it as a
-                # search/list lets the logic work regardless
-                for fip in cloud.search_floating_ips(
-                    filters=dict(port_id=port['id'])
-                ):
-                    fixed_net = fixed_ip_mapping.get(fip['fixed_ip_address'])
-                    if fixed_net is None:
-                        log = _log.setup_logging('openstack')
-                        log.debug(
-                            "The cloud returned floating ip %(fip)s attached"
-                            " to server %(server)s but the fixed ip associated"
-                            " with the floating ip in the neutron listing"
-                            " does not exist in the nova listing. Something"
-                            " is exceptionally broken.",
-                            dict(fip=fip['id'], server=server['id']),
-                        )
-                    else:
-                        server['addresses'][fixed_net].append(
-                            _make_address_dict(fip, port)
-                        )
+            if details is None:
+                floating_ips = _get_server_floating_ips(cloud, server)
+            else:
+                floating_ips = details.get_floating_ips(server)
+            for fip, port in floating_ips:
+                fixed_net = fixed_ip_mapping.get(fip['fixed_ip_address'])
+                if fixed_net is None:
+                    log = _log.setup_logging('openstack')
+                    log.debug(
+                        "The cloud returned floating ip %(fip)s attached"
+                        " to server %(server)s but the fixed ip associated"
+                        " with the floating ip in the neutron listing"
+                        " does not exist in the nova listing. Something"
+                        " is exceptionally broken.",
+                        dict(fip=fip['id'], server=server['id']),
+                    )
+                else:
+                    server['addresses'][fixed_net].append(
+                        _make_address_dict(fip, port)
+                    )
     except exceptions.SDKException:
         # If something goes wrong with a cloud call, that's cool - this is
         # an attempt to provide additional data and should not block forward
@@ -469,9 +476,13 @@ def add_server_interfaces(cloud, server):
     Ensures that public_v4, public_v6, private_v4, private_v6, interface_ip,
                  accessIPv4 and accessIPv6 are always set.
     """
+    return _add_server_interfaces(cloud, server)
+
+
+def _add_server_interfaces(cloud, server, details=None):
     # First, add an IP address. Set it to '' rather than None if it does
     # not exist to remain consistent with the pre-existing missing values
-    server['addresses'] = _get_supplemental_addresses(cloud, server)
+    server['addresses'] = _get_supplemental_addresses(cloud, server, details)
     server['public_v4'] = get_server_external_ipv4(cloud, server) or ''
     # If we're forcing IPv4, then don't report IPv6 interfaces which
     # are likely to be unconfigured.
@@ -511,13 +522,34 @@ def get_hostvars_from_server(cloud, server, mounts=None):
     expand_server_vars if caching is not set up. If caching is set up,
     the extra cost should be minimal.
     """
-    server_vars = obj_to_munch(add_server_interfaces(cloud, server))
+    return _get_hostvars_from_server(cloud, server, mounts=mounts)
+
+
+def get_hostvars_from_servers(cloud, servers):
+    """Expand additional server information for a list of servers.
+
+    The variables are the same as the ones of get_hostvars_from_server, but
+    the ports, floating IPs, flavors, images and volumes are each listed once
+    and joined to the servers, rather than queried for every server.
+    """
+    details = _ServerDetails(cloud)
+    return [
+        _get_hostvars_from_server(cloud, server, details=details)
+        for server in servers
+    ]
+
+
+def _get_hostvars_from_server(cloud, server, mounts=None, details=None):
+    # The details of a listing are looked up with the same interface as the
+    # cloud methods querying them for a single server
+    lookup = cloud if details is None else details
+    server_vars = obj_to_munch(_add_server_interfaces(cloud, server, details))
 
     flavor_id = server['flavor'].get('id')
     if flavor_id:
         # In newer nova, the flavor record can be kept around for flavors
         # that no longer exist. The id and name are not there.
-        flavor_name = cloud.get_flavor_name(flavor_id)
+        flavor_name = lookup.get_flavor_name(flavor_id)
         if flavor_name:
             server_vars['flavor']['name'] = flavor_name
     elif 'original_name' in server['flavor']:
@@ -525,7 +557,10 @@ def get_hostvars_from_server(cloud, server, mounts=None):
         # original_name.
         server_vars['flavor']['name'] = server['flavor']['original_name']
 
-    expand_server_security_groups(cloud, server)
+    if details is None:
+        # This only updates the given server, the security groups of the
+        # server listing are the ones returned in the variables
+        expand_server_security_groups(cloud, server)
 
     # OpenStack can return image as a string when you've booted from volume
     if str(server['image']) == server['image']:
@@ -534,7 +569,7 @@ def get_hostvars_from_server(cloud, server, mounts=None):
     else:
         image_id = server['image'].get('id', None)
     if image_id:
-        image_name = cloud.get_image_name(image_id)
+        image_name = lookup.get_image_name(image_id)
         if image_name:
             server_vars['image']['name'] = image_name
 
@@ -546,7 +581,10 @@ def get_hostvars_from_server(cloud, server, mounts=None):
     volumes = []
     if cloud.has_service('volume'):
         try:
-            for volume in cloud.get_volumes(server):
+            for volume in lookup.get_volumes(server):
+                # Volume resources do not accept arbitrary keys, and the
+                # volumes of a listing are shared between its servers
+                volume = obj_to_munch(volume)
                 # Make things easier to consume elsewhere
                 volume['device'] = volume['attachments'][0]['device']
                 volumes.append(volume)
@@ -563,6 +601,85 @@ def get_hostvars_from_server(cloud, server, mounts=None):
     return server_vars
 
 
+class _ServerDetails:
+    """The resources the servers of a listing are joined to.
+
+    Each kind of resource is listed the first time a server needs it and
+    indexed, so expanding a list of servers takes a constant number of calls
+    rather than several per server.
+    """
+
+    def __init__(self, cloud):
+        self.cloud = cloud
+        self._floating_ips = None
+        self._flavor_names = None
+        self._images = None
+        self._image_index = None
+        self._image_names = {}
+        self._volumes = None
+
+    def get_floating_ips(self, server):
+        """Get the floating IPs of the ports of a server.
+
+        :returns: A list of ``(floating_ip, port)`` tuples.
+        """
+        if self._floating_ips is None:
+            self._floating_ips = collections.defaultdict(list)
+            port_fips = collections.defaultdict(list)
+            try:
+                for fip in self.cloud.list_floating_ips():
+                    if fip.get('port_id'):
+                        port_fips[fip['port_id']].append(fip)
+                # Without any attached floating IP, the ports are not needed
+                if port_fips:
+                    for port in self.cloud.list_ports():
+                        for fip in port_fips.get(port['id'], []):
+                            self._floating_ips[port['device_id']].append(
+                                (fip, port)
+                            )
+            except exceptions.SDKException:
+                # As for a single server, this is additional data which
+                # should not block the listing
+                self._floating_ips.clear()
+        return self._floating_ips.get(server['id'], [])
+
+    def get_flavor_name(self, flavor_id):
+        if self._flavor_names is None:
+            self._flavor_names = {
+                flavor['id']: flavor['name']
+                for flavor in self.cloud.list_flavors(get_extra=False)
+            }
+        if flavor_id not in self._flavor_names:
+            # The flavor might not be listed, such as a private flavor of
+            # another project
+            self._flavor_names[flavor_id] = self.cloud.get_flavor_name(
+                flavor_id
+            )
+        return self._flavor_names[flavor_id]
+
+    def get_image_name(self, image_id):
+        if image_id not in self._image_names:
+            if self._images is None:
+                self._images = self.cloud.list_images()
+                self._image_index = _utils._get_identifier_index(self._images)
+            images = _utils._filter_list(
+                self._images, image_id, None, index=self._image_index
+            )
+            self._image_names[image_id] = images[0].name if images else None
+        return self._image_names[image_id]
+
+    def get_volumes(self, server):
+        if self._volumes is None:
+            self._volumes = collections.defaultdict(list)
+            try:
+                for volume in self.cloud.block_storage.volumes():
+                    for attach in volume['attachments']:
+                        self._volumes[attach['server_id']].append(volume)
+            except exceptions.SDKException:
+                self._volumes.clear()
+        return self._volumes.get(server['id'], [])
+
+
 def obj_to_munch(obj):
     """Turn an object with attributes into a dict suitable for serializing.
 
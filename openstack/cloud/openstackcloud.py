@@ -22,6 +22,7 @@ import requests.models
 import requestsexceptions
 
 from openstack import _log
+from openstack import _metrics
 from openstack.cloud import _object_store
 from openstack.cloud import _utils
 from openstack.cloud import meta
@@ -108,7 +109,9 @@ class _OpenStackCloudMixin:
         for expire_key in expirations.keys():
             self._cache_expirations[expire_key] = expirations[expire_key]
 
-        self._api_cache_keys = set()
+        self._api_cache_keys = utils.CacheKeyIndex()
+        self._api_cache_stats = utils.CacheStats()
+        self._api_inflight = utils.SingleFlight()
         self._container_cache = dict()
         self._file_hash_cache = dict()
 
@@ -296,6 +299,65 @@ class _OpenStackCloudMixin:
 
         return generate_key
 
+    def get_cache_stats(self):
+        """Get the counters of the API response cache.
+
+        :returns: A dict keyed by cache key prefix (for instance
+            ``compute.servers``) of dicts with the ``hits``, ``misses`` and
+            ``evictions`` counts of the prefix.
+        """
+        return self._api_cache_stats.get()
+
+    def stats(self, reset=False):
+        """Get the latency statistics of the API requests.
+
+        When the ``latency_stats`` setting or argument of the connection is
+        enabled, every request made through it is accounted per service
+        type, endpoint and HTTP method, with the same naming as the statsd
+        metrics. Otherwise the statistics are always empty.
+
+        :param reset: Whether to clear the statistics once returned, so
+            that the next call only covers the requests made in between.
+        :returns: A :class:`~openstack._metrics.StatsSnapshot`, which can
+            be exported with its ``as_dict``, ``to_json`` and ``to_text``
+            methods.
+        """
+        if self._latency_stats is None:
+            return _metrics.StatsSnapshot({})
+        return self._latency_stats.snapshot(reset=reset)
+
+    def get_concurrency_limits(self):
+        """Get the current adaptive concurrency limits.
+
+        :returns: A dict keyed by service type of the number of requests
+            currently allowed to run concurrently, for the services with
+            the ``adaptive_concurrency`` setting enabled which were used.
+        """
+        return {
+            service_type: limiter.limit
+            for service_type, limiter in (
+                self.config.get_concurrency_limiters().items()
+            )
+        }
+
+    def get_circuit_breakers(self):
+        """Get the state of the circuit breakers.
+
+        :returns: A dict keyed by tuples of region name, service type and
+            endpoint of dicts with the ``state`` of the circuit, one of
+            ``closed``, ``open`` or ``half-open``, the number of
+            consecutive ``failures`` and the number of seconds before an
+            open circuit is probed again, ``retry_after``.
+        """
+        return {
+            key: dict(
+                state=breaker.state,
+                failures=breaker.failures,
+                retry_after=breaker.retry_after,
+            )
+            for key, breaker in self.config.get_circuit_breakers().items()
+        }
+
     def pprint(self, resource):
         """Wrapper around pprint that groks munch objects"""
         # import late since this is a utility function
@@ -528,7 +590,8 @@ class _OpenStackCloudMixin:
         except exceptions.SDKException:
             return False
         if endpoint:
-            return True
+            # Skip the services whose endpoint keeps failing
+            return not self.config.is_circuit_open(service_key, endpoint)
         else:
             return False
 
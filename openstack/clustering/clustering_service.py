@@ -10,7 +10,6 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
-from openstack.clustering.v1 import _proxy
 from openstack import service_description
 
 
@@ -18,5 +17,5 @@ class ClusteringService(service_description.ServiceDescription):
     """The clustering service."""
 
     supported_versions = {
-        '1': _proxy.Proxy,
+        '1': 'openstack.clustering.v1._proxy.Proxy',
     }
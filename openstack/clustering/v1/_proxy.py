@@ -1047,7 +1047,7 @@ class Proxy(proxy.Proxy):
         return self._list(_event.Event, **query)
 
     def wait_for_status(
-        self, res, status, failures=None, interval=2, wait=120
+        self, res, status, failures=None, interval=2, wait=120, backoff=None
     ):
         """Wait for a resource to be in a particular status.
 
@@ -1061,6 +1061,9 @@ class Proxy(proxy.Proxy):
             checks. Default to 2.
         :param wait: Maximum number of seconds to wait before the change.
             Default to 120.
+        :param backoff: The polling strategy, see
+            :func:`~openstack.utils.get_backoff`. Defaults to the
+            ``polling_strategy`` of the cloud config.
         :returns: The resource is returned on success.
         :raises: :class:`~openstack.exceptions.ResourceTimeout` if transition
             to the desired status failed to occur in specified seconds.
@@ -1071,10 +1074,10 @@ class Proxy(proxy.Proxy):
         """
         failures = [] if failures is None else failures
         return resource.wait_for_status(
-            self, res, status, failures, interval, wait
+            self, res, status, failures, interval, wait, backoff=backoff
         )
 
-    def wait_for_delete(self, res, interval=2, wait=120):
+    def wait_for_delete(self, res, interval=2, wait=120, backoff=None):
         """Wait for a resource to be deleted.
 
         :param res: The resource to wait on to be deleted.
@@ -1083,11 +1086,16 @@ class Proxy(proxy.Proxy):
             checks. Default to 2.
         :param wait: Maximum number of seconds to wait before the change.
             Default to 120.
+        :param backoff: The polling strategy, see
+            :func:`~openstack.utils.get_backoff`. Defaults to the
+            ``polling_strategy`` of the cloud config.
         :returns: The resource is returned on success.
         :raises: :class:`~openstack.exceptions.ResourceTimeout` if transition
             to delete failed to occur in the specified seconds.
         """
-        return resource.wait_for_delete(self, res, interval, wait)
+        return resource.wait_for_delete(
+            self, res, interval, wait, backoff=backoff
+        )
 
     def services(self, **query):
         """Get a generator of services.
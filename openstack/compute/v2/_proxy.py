@@ -2602,6 +2602,7 @@ class Proxy(proxy.Proxy):
         interval=2,
         wait=120,
         callback=None,
+        backoff=None,
     ):
         """Wait for a server to be in a particular status.
 
@@ -2621,6 +2622,9 @@ class Proxy(proxy.Proxy):
         :param callback: A callback function. This will be called with a single
             value, progress, which is a percentage value from 0-100.
         :type callback: callable
+        :param backoff: The polling strategy, see
+            :func:`~openstack.utils.get_backoff`. Defaults to the
+            ``polling_strategy`` of the cloud config.
 
         :returns: The resource is returned on success.
         :raises: :class:`~openstack.exceptions.ResourceTimeout` if transition
@@ -2639,9 +2643,68 @@ class Proxy(proxy.Proxy):
             interval,
             wait,
             callback=callback,
+            backoff=backoff,
         )
 
-    def wait_for_delete(self, res, interval=2, wait=120, callback=None):
+    def wait_for_many(
+        self,
+        servers,
+        status='ACTIVE',
+        failures=None,
+        interval=2,
+        wait=120,
+        callback=None,
+        backoff=None,
+    ):
+        """Wait for several servers to be in a particular status.
+
+        Servers are refreshed with a single list call per check instead of
+        one request per server.
+
+        :param servers: The servers to wait on to reach the specified
+            status. Each can be the ID of a server or a
+            :class:`~openstack.compute.v2.server.Server` instance.
+        :param status: Desired status.
+        :type status: str
+        :param failures: Statuses that would be interpreted as failures.
+        :type failures: :py:class:`list`
+        :param interval: Number of seconds to wait before to consecutive
+            checks. Default to 2.
+        :type interval: int
+        :param wait: Maximum number of seconds to wait before the change.
+            Default to 120.
+        :type wait: int
+        :param callback: A callback function. This will be called with each
+            server as soon as it reaches the desired status.
+        :type callback: callable
+        :param backoff: The polling strategy, see
+            :func:`~openstack.utils.get_backoff`. Defaults to the
+            ``polling_strategy`` of the cloud config.
+
+        :returns: A list with, in the order of ``servers``, either the
+            updated server or the
+            :class:`~openstack.exceptions.ResourceFailure` explaining why it
+            did not reach the desired status.
+        :raises: :class:`~openstack.exceptions.ResourceTimeout` if transition
+            to the desired status failed to occur in specified seconds.
+        """
+        failures = ['ERROR'] if failures is None else failures
+        servers = [self._get_resource(_server.Server, s) for s in servers]
+        return resource.wait_for_many(
+            self,
+            servers,
+            status,
+            failures,
+            interval,
+            wait,
+            callback=callback,
+            list_base_path={_server.Server: '/servers/detail'},
+            backoff=backoff,
+        )
+
+    def wait_for_delete(
+        self, res, interval=2, wait=120, callback=None, backoff=None
+    ):
         """Wait for a resource to be deleted.
 
         :param res: The resource to wait on to be deleted.
@@ -2652,12 +2715,17 @@ class Proxy(proxy.Proxy):
             Default to 120.
         :param callback: A callback function. This will be called with a single
             value, progress, which is a percentage value from 0-100.
+        :param backoff: The polling strategy, see
+            :func:`~openstack.utils.get_backoff`. Defaults to the
+            ``polling_strategy`` of the cloud config.
 
         :returns: The resource is returned on success.
         :raises: :class:`~openstack.exceptions.ResourceTimeout` if transition
             to delete failed to occur in the specified seconds.
         """
-        return resource.wait_for_delete(self, res, interval, wait, callback)
+        return resource.wait_for_delete(
+            self, res, interval, wait, callback, backoff=backoff
+        )
 
     def _get_cleanup_dependencies(self):
         return {
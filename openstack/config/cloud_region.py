@@ -13,7 +13,9 @@
 # under the License.
 
 import copy
+import functools
 import os.path
+import threading
 import typing as ty
 from urllib import parse
 import warnings
@@ -48,6 +50,7 @@ from openstack.config import _util
 from openstack.config import defaults as config_defaults
 from openstack import exceptions
 from openstack import proxy
+from openstack import utils
 from openstack import version as openstack_version
 from openstack import warnings as os_warnings
 
@@ -317,6 +320,10 @@ class CloudRegion:
         self._influxdb_config = influxdb_config
         self._influxdb_client = None
         self._collector_registry = collector_registry
+        self._concurrency_limiters = {}
+        self._concurrency_limiters_lock = threading.Lock()
+        self._circuit_breakers = {}
+        self._circuit_breakers_lock = threading.Lock()
 
         self._service_type_manager = os_service_types.ServiceTypes()
 
@@ -601,6 +608,35 @@ class CloudRegion:
         except (keystoneauth1.exceptions.catalog.EndpointNotFound, ValueError):
             return None
 
+    def get_latency_stats(self):
+        """Whether to keep in-process latency statistics of the requests
+
+        :returns: The ``latency_stats`` setting, False by default.
+        """
+        value = self.config.get('latency_stats', False)
+        if isinstance(value, str):
+            return value.lower() == 'true'
+        return bool(value)
+
+    def get_polling_strategy(self):
+        """Get the polling strategy of resource waiters
+
+        :returns: The :class:`~openstack.utils.Backoff` built from the
+            ``polling_strategy`` setting, or None if it is not set.
+            See :func:`openstack.utils.get_backoff`.
+        :raises: :class:`~openstack.exceptions.SDKException` if the setting
+            is not a valid polling strategy.
+        """
+        spec = self.config.get('polling_strategy')
+        if spec is None:
+            return None
+        if not isinstance(spec, (str, dict)):
+            raise exceptions.SDKException(
+                f"Invalid polling_strategy {spec!r}: expected the name of a "
+                f"strategy or a dict with its name and arguments"
+            )
+        return utils.get_backoff(spec)
+
     def get_connect_retries(self, service_type):
         return self._get_config(
             'connect_retries',
@@ -849,6 +885,14 @@ class CloudRegion:
         )
         kwargs.setdefault('influxdb_config', self._influxdb_config)
         kwargs.setdefault('influxdb_client', self.get_influxdb_client())
+        kwargs.setdefault(
+            'concurrency_limiter', self.get_concurrency_limiter(service_type)
+        )
+        if self.get_circuit_breaker_failures(service_type):
+            kwargs.setdefault(
+                'circuit_breaker_factory',
+                functools.partial(self.get_circuit_breaker, service_type),
+            )
         endpoint_override = self.get_endpoint(service_type)
         version = version_request.version
         min_api_version = (
@@ -1142,6 +1186,117 @@ class CloudRegion:
             'concurrency', service_type=service_type
         )
 
+    def get_adaptive_concurrency(self, service_type=None):
+        return self._get_service_config(
+            'adaptive_concurrency', service_type=service_type
+        )
+
+    def get_concurrency_limiter(self, service_type):
+        """Get the adaptive concurrency limiter of a service.
+
+        Limiters are only created for the services with the
+        ``adaptive_concurrency`` setting enabled, and are shared by all the
+        clients of the service created from this CloudRegion. The setting
+        is either true or the maximum concurrency; it otherwise defaults to
+        the ``concurrency`` setting of the service, or to 100.
+
+        :returns: A :class:`~openstack.utils.AdaptiveConcurrencyLimiter` or
+            None.
+        """
+        adaptive = self.get_adaptive_concurrency(service_type)
+        if not adaptive or (
+            isinstance(adaptive, str)
+            and adaptive.lower() in ('false', 'no', 'off', '0')
+        ):
+            return None
+        with self._concurrency_limiters_lock:
+            limiter = self._concurrency_limiters.get(service_type)
+            if limiter is None:
+                try:
+                    maximum = int(adaptive)
+                except (TypeError, ValueError):
+                    maximum = 1
+                if isinstance(adaptive, bool) or maximum <= 1:
+                    maximum = int(self.get_concurrency(service_type) or 100)
+                limiter = utils.AdaptiveConcurrencyLimiter(
+                    initial=min(10, maximum), maximum=maximum
+                )
+                self._concurrency_limiters[service_type] = limiter
+        return limiter
+
+    def get_concurrency_limiters(self):
+        """Get the adaptive concurrency limiters created so far.
+
+        :returns: A dict of limiters keyed by service type.
+        """
+        with self._concurrency_limiters_lock:
+            return dict(self._concurrency_limiters)
+
+    def get_circuit_breaker_failures(self, service_type=None):
+        return self._get_service_config(
+            'circuit_breaker_failures', service_type=service_type
+        )
+
+    def get_circuit_breaker_cooldown(self, service_type=None):
+        return self._get_service_config(
+            'circuit_breaker_cooldown', service_type=service_type
+        )
+
+    def _get_circuit_key(self, service_type, endpoint):
+        service_type = (
+            self._service_type_manager.get_service_type(service_type)
+            or service_type
+        )
+        url = parse.urlsplit(endpoint)
+        if url.scheme and url.netloc:
+            endpoint = f'{url.scheme}://{url.netloc}'
+        return (self.region_name, service_type, endpoint)
+
+    def get_circuit_breaker(self, service_type, endpoint):
+        """Get the circuit breaker of a service endpoint.
+
+        Circuit breakers are only created for the services with the
+        ``circuit_breaker_failures`` setting, the number of consecutive
+        connection failures or server errors opening the circuit. They are
+        keyed by region, service type and the scheme and host of the
+        endpoint, and shared by all the clients created from this
+        CloudRegion.
+
+        :param service_type: The service type.
+        :param endpoint: The endpoint or a URL of the service.
+        :returns: A :class:`~openstack.utils.CircuitBreaker` or None.
+        """
+        failures = self.get_circuit_breaker_failures(service_type)
+        if not failures or int(failures) <= 0:
+            return None
+        key = self._get_circuit_key(service_type, endpoint)
+        with self._circuit_breakers_lock:
+            breaker = self._circuit_breakers.get(key)
+            if breaker is None:
+                cooldown = self.get_circuit_breaker_cooldown(service_type)
+                breaker = utils.CircuitBreaker(
+                    failure_threshold=int(failures),
+                    reset_timeout=float(cooldown or 30),
+                )
+                self._circuit_breakers[key] = breaker
+        return breaker
+
+    def get_circuit_breakers(self):
+        """Get the circuit breakers created so far.
+
+        :returns: A dict of circuit breakers keyed by tuples of region name,
+            service type and endpoint.
+        """
+        with self._circuit_breakers_lock:
+            return dict(self._circuit_breakers)
+
+    def is_circuit_open(self, service_type, endpoint):
+        """Check whether requests to a service endpoint are suspended."""
+        key = self._get_circuit_key(service_type, endpoint)
+        with self._circuit_breakers_lock:
+            breaker = self._circuit_breakers.get(key)
+        return breaker is not None and breaker.state == breaker.OPEN
+
     def get_statsd_client(self):
         if not statsd:
             if self._statsd_host:
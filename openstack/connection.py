@@ -280,6 +280,7 @@ import keystoneauth1.exceptions
 import requestsexceptions
 
 from openstack import _log
+from openstack import _metrics
 from openstack import _services_mixin
 from openstack.cloud import _accelerator
 from openstack.cloud import _baremetal
@@ -300,6 +301,7 @@ from openstack.cloud import openstackcloud as _cloud
 from openstack import config as _config
 from openstack.config import cloud_region
 from openstack import exceptions
+from openstack import resource
 from openstack import service_description
 
 __all__ = [
@@ -381,6 +383,9 @@ class Connection(
         global_request_id=None,
         strict_proxies=False,
         pool_executor=None,
+        find_cache_ttl=None,
+        find_cache_negative_ttl=None,
+        latency_stats=None,
         **kwargs
     ):
         """Create a connection to a cloud.
@@ -454,6 +459,21 @@ class Connection(
             A futurist ``Executor`` object to be used for concurrent background
             activities. Defaults to None in which case a ThreadPoolExecutor
             will be created if needed.
+        :param float find_cache_ttl:
+            Number of seconds names resolved by ``find`` calls are cached
+            for, ``-1`` to cache them until a resource of the same type is
+            created, updated or deleted through this connection. Defaults
+            to the ``find`` key of ``cache.expiration`` in the cloud
+            config, and to no caching.
+        :param float find_cache_negative_ttl:
+            Number of seconds names that ``find`` could not resolve are
+            cached for. Defaults to the ``find.missing`` key of
+            ``cache.expiration`` in the cloud config, or to
+            ``find_cache_ttl``.
+        :param bool latency_stats:
+            Whether to keep in-process latency statistics of the requests,
+            returned by :meth:`stats`. Defaults to the ``latency_stats``
+            setting of the cloud config, and to False.
         :param kwargs: If a config is not provided, the rest of the parameters
             provided are assumed to be arguments to be passed to the
             CloudRegion constructor.
@@ -501,6 +521,22 @@ class Connection(
         self._global_request_id = global_request_id
         self.use_direct_get = use_direct_get
         self.strict_mode = strict
+        if find_cache_ttl is None:
+            find_cache_ttl = self.config.get_cache_resource_expiration('find')
+        if find_cache_negative_ttl is None:
+            find_cache_negative_ttl = (
+                self.config.get_cache_resource_expiration('find.missing')
+            )
+        self._find_cache = None
+        if find_cache_ttl:
+            self._find_cache = resource._FindCache(
+                find_cache_ttl, find_cache_negative_ttl
+            )
+        if latency_stats is None:
+            latency_stats = self.config.get_latency_stats()
+        self._latency_stats = None
+        if latency_stats:
+            self._latency_stats = _metrics.LatencyRecorder()
         # Call the _*CloudMixin constructors while we work on
         # integrating things better.
         _cloud._OpenStackCloudMixin.__init__(self)
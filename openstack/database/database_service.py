@@ -10,7 +10,6 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
-from openstack.database.v1 import _proxy
 from openstack import service_description
 
 
@@ -18,5 +17,5 @@ class DatabaseService(service_description.ServiceDescription):
     """The database service."""
 
     supported_versions = {
-        '1': _proxy.Proxy,
+        '1': 'openstack.database.v1._proxy.Proxy',
     }
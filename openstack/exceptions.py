@@ -273,5 +273,9 @@ class ServiceDiscoveryException(SDKException):
     """The service cannot be discovered."""
 
 
+class CircuitOpenException(SDKException):
+    """Requests to an endpoint are suspended after repeated failures."""
+
+
 # Backwards compatibility
 OpenStackCloudException = SDKException
@@ -1901,7 +1901,58 @@ class Proxy(proxy.Proxy):
         return self._get(_si.Import, requires_id=False)
 
     # ====== UTILS ======
-    def wait_for_delete(self, res, interval=2, wait=120):
+    def wait_for_many(
+        self,
+        images,
+        status='active',
+        failures=None,
+        interval=2,
+        wait=120,
+        callback=None,
+        backoff=None,
+    ):
+        """Wait for several images to be in a particular status.
+
+        Images are refreshed with a single list call per check instead of
+        one request per image.
+
+        :param images: The images to wait on to reach the specified status.
+            Each can be the ID of an image or a
+            :class:`~openstack.image.v2.image.Image` instance.
+        :param status: Desired status.
+        :param failures: Statuses that would be interpreted as failures.
+            Default to ['killed'].
+        :type failures: :py:class:`list`
+        :param interval: Number of seconds to wait before to consecutive
+            checks. Default to 2.
+        :param wait: Maximum number of seconds to wait before the change.
+            Default to 120.
+        :param callback: A callback function. This will be called with each
+            image as soon as it reaches the desired status.
+        :param backoff: The polling strategy, see
+            :func:`~openstack.utils.get_backoff`. Defaults to the
+            ``polling_strategy`` of the cloud config.
+
+        :returns: A list with, in the order of ``images``, either the updated
+            image or the :class:`~openstack.exceptions.ResourceFailure`
+            explaining why it did not reach the desired status.
+        :raises: :class:`~openstack.exceptions.ResourceTimeout` if transition
+            to the desired status failed to occur in specified seconds.
+        """
+        failures = ['killed'] if failures is None else failures
+        images = [self._get_resource(_image.Image, i) for i in images]
+        return resource.wait_for_many(
+            self,
+            images,
+            status,
+            failures,
+            interval,
+            wait,
+            callback=callback,
+            backoff=backoff,
+        )
+
+    def wait_for_delete(self, res, interval=2, wait=120, backoff=None):
         """Wait for a resource to be deleted.
 
         :param res: The resource to wait on to be deleted.
@@ -1910,11 +1961,16 @@ class Proxy(proxy.Proxy):
             checks. Default to 2.
         :param wait: Maximum number of seconds to wait before the change.
             Default to 120.
+        :param backoff: The polling strategy, see
+            :func:`~openstack.utils.get_backoff`. Defaults to the
+            ``polling_strategy`` of the cloud config.
         :returns: The resource is returned on success.
         :raises: :class:`~openstack.exceptions.ResourceTimeout` if transition
             to delete failed to occur in the specified seconds.
         """
-        return resource.wait_for_delete(self, res, interval, wait)
+        return resource.wait_for_delete(
+            self, res, interval, wait, backoff=backoff
+        )
 
     def _get_cleanup_dependencies(self):
         return {'image': {'before': ['identity']}}
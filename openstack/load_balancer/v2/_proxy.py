@@ -154,6 +154,7 @@ class Proxy(proxy.Proxy):
         failures=['ERROR'],
         interval=2,
         wait=300,
+        backoff=None,
     ):
         """Wait for load balancer status
 
@@ -166,6 +167,9 @@ class Proxy(proxy.Proxy):
             checks. Defaults to 2.
         :param wait: Maximum number of seconds to wait before the status
             to be reached. Defaults to 300.
+        :param backoff: The polling strategy, see
+            :func:`~openstack.utils.get_backoff`. Defaults to the
+            ``polling_strategy`` of the cloud config.
         :returns: The load balancer is returned on success.
         :raises: :class:`~openstack.exceptions.ResourceTimeout` if transition
             to the desired status failed to occur within the specified wait
@@ -185,6 +189,65 @@ class Proxy(proxy.Proxy):
             interval,
             wait,
             attribute='provisioning_status',
+            backoff=backoff,
+        )
+
+    def wait_for_many(
+        self,
+        load_balancers,
+        status='ACTIVE',
+        failures=None,
+        interval=2,
+        wait=300,
+        callback=None,
+        backoff=None,
+    ):
+        """Wait for several load balancers to reach a provisioning status
+
+        Load balancers are refreshed with a single list call per check,
+        filtered by provisioning status and project when all the pending load
+        balancers share them. Only load balancers missing from that listing
+        are fetched one by one.
+
+        :param load_balancers: The load balancers to wait on. Each can be the
+            ID of a load balancer or a
+            :class:`~openstack.load_balancer.v2.load_balancer.LoadBalancer`
+            instance.
+        :param status: Desired status.
+        :param failures: Statuses that would be interpreted as failures.
+            Default to ['ERROR'].
+        :type failures: :py:class:`list`
+        :param interval: Number of seconds to wait between consecutive
+            checks. Defaults to 2.
+        :param wait: Maximum number of seconds to wait before the status
+            to be reached. Defaults to 300.
+        :param callback: A callback function. This will be called with each
+            load balancer as soon as it reaches the desired status.
+        :param backoff: The polling strategy, see
+            :func:`~openstack.utils.get_backoff`. Defaults to the
+            ``polling_strategy`` of the cloud config.
+        :returns: A list with, in the order of ``load_balancers``, either the
+            updated load balancer or the
+            :class:`~openstack.exceptions.ResourceFailure` explaining why it
+            did not reach the desired status.
+        :raises: :class:`~openstack.exceptions.ResourceTimeout` if transition
+            to the desired status failed to occur within the specified wait
+            time.
+        """
+        failures = ['ERROR'] if failures is None else failures
+        load_balancers = [
+            self._get_resource(_lb.LoadBalancer, lb) for lb in load_balancers
+        ]
+        return resource.wait_for_many(
+            self,
+            load_balancers,
+            status,
+            failures,
+            interval,
+            wait,
+            attribute='provisioning_status',
+            callback=callback,
+            backoff=backoff,
         )
 
     def failover_load_balancer(self, load_balancer, **attrs):
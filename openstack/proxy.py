@@ -10,7 +10,9 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+from collections.abc import Mapping
 import functools
+import time
 import typing as ty
 import urllib
 from urllib.parse import urlparse
@@ -24,10 +26,13 @@ except ImportError:
 import iso8601
 import jmespath
 from keystoneauth1 import adapter
+from keystoneauth1 import exceptions as ks_exceptions
 
 from openstack import _log
+from openstack import _metrics
 from openstack import exceptions
 from openstack import resource
+from openstack import utils
 
 
 ResourceType = ty.TypeVar('ResourceType', bound=resource.Resource)
@@ -74,6 +79,9 @@ def normalize_metric_name(name):
 class Proxy(adapter.Adapter):
     """Represents a service."""
 
+    overload_status_codes: ty.Tuple[int, ...] = (429, 503)
+    """HTTP status codes which shrink the adaptive concurrency limit."""
+
     retriable_status_codes: ty.Optional[ty.List[int]] = None
     """HTTP status codes that should be retried by default.
 
@@ -96,6 +104,8 @@ class Proxy(adapter.Adapter):
         prometheus_histogram=None,
         influxdb_config=None,
         influxdb_client=None,
+        concurrency_limiter=None,
+        circuit_breaker_factory=None,
         *args,
         **kwargs,
     ):
@@ -111,6 +121,9 @@ class Proxy(adapter.Adapter):
         self._prometheus_histogram = prometheus_histogram
         self._influxdb_client = influxdb_client
         self._influxdb_config = influxdb_config
+        self._concurrency_limiter = concurrency_limiter
+        self._circuit_breaker_factory = circuit_breaker_factory
+        self._circuit_breaker_endpoint = None
         if self.service_type:
             log_name = f'openstack.{self.service_type}'
         else:
@@ -127,10 +140,204 @@ class Proxy(adapter.Adapter):
 
     def _invalidate_cache(self, conn, key_prefix):
         """Invalidate all cache entries starting with given prefix"""
-        for k in set(conn._api_cache_keys):
-            if k.startswith(key_prefix):
-                conn._cache.delete(k)
-                conn._api_cache_keys.remove(k)
+        for k in conn._api_cache_keys.pop_prefix(key_prefix):
+            conn._cache.delete(k)
+            conn._api_cache_stats.record(k.rpartition('.')[0], 'evictions')
+
+    def _get_cached(self, conn, key, key_prefix, request_args):
+        """Get a response from the cache or from the API"""
+        # Get the object expiration time from config
+        # default to 0 to disable caching for this resource type
+        expiration_time = int(conn._cache_expirations.get(key_prefix, 0))
+        # Expired responses may be served for this much longer while they
+        # are refreshed in the background
+        stale_time = int(conn._cache_expirations.get(key_prefix + '.stale', 0))
+        if expiration_time > 0 and stale_time > 0:
+            cached = conn._cache.get_value_metadata(
+                key, ignore_expiration=True
+            )
+            if cached is not None and cached.age <= (
+                expiration_time + stale_time
+            ):
+                if cached.age > expiration_time:
+                    self._refresh_cache(
+                        conn, key, cached.payload, request_args
+                    )
+                conn._api_cache_stats.record(key_prefix, 'hits')
+                return cached.payload
+
+        # Track cache key for invalidating possibility
+        conn._api_cache_keys.add(key, key_prefix)
+        created = []
+
+        def creator(url, method, **kwargs):
+            cached = None
+            if expiration_time:
+                # Revalidate the expired response rather than fetching it
+                # again if the service told how to
+                cached = conn._cache.get_value_metadata(
+                    key, ignore_expiration=True
+                )
+            response, modified = self._revalidate(
+                cached.payload if cached else None, url, method, **kwargs
+            )
+            if modified:
+                created.append(True)
+            return response
+
+        # Get from cache or execute and cache
+        response = conn._cache.get_or_create(
+            key=key,
+            creator=creator,
+            creator_args=request_args,
+            expiration_time=expiration_time,
+        )
+        conn._api_cache_stats.record(
+            key_prefix, 'misses' if created else 'hits'
+        )
+        return response
+
+    def _get_circuit_breaker(self, url):
+        """Get the circuit breaker of the endpoint of a request, if any"""
+        if self._circuit_breaker_factory is None:
+            return None
+        if not urlparse(url).netloc:
+            if self._circuit_breaker_endpoint is None:
+                try:
+                    self._circuit_breaker_endpoint = self.get_endpoint()
+                except ks_exceptions.ClientException:
+                    # Let the request report the missing endpoint
+                    return None
+            if not self._circuit_breaker_endpoint:
+                return None
+            url = self._circuit_breaker_endpoint
+        return self._circuit_breaker_factory(url)
+
+    def _send(self, url, method, **kwargs):
+        """Send a request, unless the circuit of its endpoint is open"""
+        breaker = self._get_circuit_breaker(url)
+        if breaker is None:
+            return self._send_limited(url, method, **kwargs)
+        ticket = breaker.allow()
+        if not ticket:
+            raise exceptions.CircuitOpenException(
+                "Requests to the %s service are suspended for %.0f seconds "
+                "after %d consecutive failures"
+                % (self.service_type, breaker.retry_after, breaker.failures)
+            )
+        failed = True
+        try:
+            response = self._send_limited(url, method, **kwargs)
+            failed = response.status_code >= 500
+            return response
+        except ks_exceptions.HttpError as e:
+            failed = (e.http_status or 0) >= 500
+            raise
+        finally:
+            state = breaker.record(failed, ticket)
+            if state == breaker.OPEN:
+                self.log.warning(
+                    "Suspending requests to the %s service after %d "
+                    "consecutive failures",
+                    self.service_type,
+                    breaker.failures,
+                )
+            elif state == breaker.CLOSED:
+                self.log.info(
+                    "Resuming requests to the %s service", self.service_type
+                )
+
+    def _send_limited(self, url, method, **kwargs):
+        """Send a request, within the adaptive concurrency limit if any"""
+        limiter = self._concurrency_limiter
+        if limiter is None:
+            return super().request(url, method, **kwargs)
+        with limiter:
+            try:
+                response = super().request(url, method, **kwargs)
+            except ks_exceptions.HttpError as e:
+                self._adapt_concurrency(
+                    limiter,
+                    overloaded=e.http_status in self.overload_status_codes,
+                    response=e.response,
+                )
+                raise
+            except (
+                ks_exceptions.ConnectTimeout,
+                ks_exceptions.ConnectFailure,
+            ):
+                self._adapt_concurrency(limiter, overloaded=True)
+                raise
+            self._adapt_concurrency(
+                limiter,
+                overloaded=response.status_code in self.overload_status_codes,
+                response=response,
+            )
+        return response
+
+    def _adapt_concurrency(self, limiter, overloaded=False, response=None):
+        if overloaded:
+            retry_after = None
+            headers = getattr(response, 'headers', None)
+            if isinstance(headers, Mapping) and 'Retry-After' in headers:
+                retry_after = utils.parse_retry_after(headers['Retry-After'])
+            changed = limiter.overload(retry_after)
+        else:
+            changed = limiter.success()
+        if changed:
+            self.log.debug(
+                "Concurrency limit of %s is now %d",
+                self.service_type,
+                limiter.limit,
+            )
+            self._report_gauge('concurrency_limit', limiter.limit)
+
+    def _revalidate(self, cached, url, method, **kwargs):
+        """Send a request, conditional on a previous response if possible
+
+        When the previous response carries an ``ETag`` or a
+        ``Last-Modified`` header, the request is sent with the matching
+        ``If-None-Match`` or ``If-Modified-Since`` header, and the previous
+        response is reused if the service answers ``304 Not Modified``.
+
+        :returns: A tuple of the response and whether it is a new one.
+        """
+        conditions = {}
+        headers = getattr(cached, 'headers', None)
+        if isinstance(headers, Mapping):
+            if headers.get('ETag'):
+                conditions['If-None-Match'] = headers['ETag']
+            if headers.get('Last-Modified'):
+                conditions['If-Modified-Since'] = headers['Last-Modified']
+        if conditions:
+            kwargs['headers'] = dict(kwargs.get('headers') or {}, **conditions)
+        response = self._send(url, method, **kwargs)
+        if conditions and response.status_code == 304:
+            self._report_stats(response)
+            return cached, False
+        return response, True
+
+    def _refresh_cache(self, conn, key, cached, request_args):
+        """Refresh a cached response in the background"""
+        refresh_key = ('refresh', key)
+        if conn._api_inflight.running(refresh_key):
+            return
+
+        def refresh():
+            try:
+                response, modified = self._revalidate(
+                    cached, *request_args[0], **request_args[1]
+                )
+            except Exception as e:
+                self.log.debug("Failed to refresh cached %s: %s", key, e)
+                return
+            if modified:
+                self._report_stats(response)
+            # Do not resurrect an entry invalidated in the meantime
+            if response.status_code < 400 and key in conn._api_cache_keys:
+                conn._cache.set(key, response)
+
+        conn._pool_executor.submit(conn._api_inflight.do, refresh_key, refresh)
 
     def request(
         self,
@@ -152,53 +359,60 @@ class Proxy(adapter.Adapter):
         key_prefix = self._get_cache_key_prefix(url)
         # The caller might want to force cache bypass.
         skip_cache = kwargs.pop('skip_cache', False)
-        if conn.cache_enabled:
-            # Construct cache key. It consists of:
-            # service.name_parts.URL.str(kwargs)
-            key = '.'.join([key_prefix, url, str(kwargs)])
-
-            # Track cache key for invalidating possibility
-            conn._api_cache_keys.add(key)
+        # Streamed responses are read lazily and can not be cached.
+        stream = kwargs.get('stream', False)
+        cacheable = method == 'GET' and not skip_cache and not stream
+        if cacheable:
+            # Construct cache key. It consists of service.name_parts
+            # followed by a digest of the URL and the request arguments
+            key = utils.canonical_cache_key(key_prefix, url, kwargs)
+        request_args = (
+            [url, method],
+            dict(
+                connect_retries=connect_retries,
+                raise_exc=raise_exc,
+                global_request_id=global_request_id,
+                **kwargs,
+            ),
+        )
 
         try:
-            if conn.cache_enabled and not skip_cache and method == 'GET':
-                # Get the object expiration time from config
-                # default to 0 to disable caching for this resource type
-                expiration_time = int(
-                    conn._cache_expirations.get(key_prefix, 0)
+            if cacheable and conn.cache_enabled:
+                # Concurrent identical requests share a single lookup. The
+                # arguments which change how the response is handled are not
+                # part of the cache key but must match to share it.
+                flight_key = (
+                    key,
+                    error_message,
+                    raise_exc,
+                    connect_retries,
+                    global_request_id,
                 )
-                # Get from cache or execute and cache
-                response = conn._cache.get_or_create(
-                    key=key,
-                    creator=super().request,
-                    creator_args=(
-                        [url, method],
-                        dict(
-                            connect_retries=connect_retries,
-                            raise_exc=raise_exc,
-                            global_request_id=global_request_id,
-                            **kwargs,
-                        ),
-                    ),
-                    expiration_time=expiration_time,
+                response = conn._api_inflight.do(
+                    flight_key,
+                    self._get_cached,
+                    conn,
+                    key,
+                    key_prefix,
+                    request_args,
                 )
+            elif cacheable:
+                response = self._send(*request_args[0], **request_args[1])
             else:
                 # invalidate cache if we send modification request or user
                 # asked for cache bypass
-                self._invalidate_cache(conn, key_prefix)
+                if not stream:
+                    self._invalidate_cache(conn, key_prefix)
                 # Pass through the API request bypassing cache
-                response = super().request(
-                    url,
-                    method,
-                    connect_retries=connect_retries,
-                    raise_exc=raise_exc,
-                    global_request_id=global_request_id,
-                    **kwargs,
-                )
+                response = self._send(*request_args[0], **request_args[1])
 
             for h in response.history:
                 self._report_stats(h)
             self._report_stats(response)
+            headers = getattr(response, 'headers', None)
+            if isinstance(headers, Mapping) and 'Retry-After' in headers:
+                # Let waiters polling this API back off as requested
+                utils.note_retry_after(headers['Retry-After'])
             return response
         except Exception as e:
             # If we want metrics to be generated we also need to generate some
@@ -303,122 +517,190 @@ class Proxy(adapter.Adapter):
         return name_parts
 
     def _report_stats(self, response, url=None, method=None, exc=None):
-        if self._statsd_client:
-            self._report_stats_statsd(response, url, method, exc)
-        if self._prometheus_counter and self._prometheus_histogram:
-            self._report_stats_prometheus(response, url, method, exc)
-        if self._influxdb_client:
-            self._report_stats_influxdb(response, url, method, exc)
-
-    def _report_stats_statsd(self, response, url=None, method=None, exc=None):
-        try:
-            if response is not None and not url:
+        recorder = getattr(self._get_connection(), '_latency_stats', None)
+        if not isinstance(recorder, _metrics.LatencyRecorder):
+            recorder = None
+        backends = (
+            self._statsd_client
+            or (self._prometheus_counter and self._prometheus_histogram)
+            or self._influxdb_client
+        )
+        if not (recorder or backends):
+            return
+        status_code = None
+        elapsed = None
+        if response is not None:
+            if not url:
                 url = response.request.url
-            if response is not None and not method:
+            if not method:
                 method = response.request.method
-            name_parts = [
+            status_code = response.status_code
+            elapsed = response.elapsed.total_seconds()
+        if recorder:
+            self._record_latency(recorder, response, url, method, elapsed)
+        if not backends:
+            return
+        # The metrics are emitted by a background thread so that requests
+        # never wait for the metrics backends
+        _metrics.get_pipeline().submit(
+            _metrics.Record(
+                proxy=self,
+                url=url,
+                method=method,
+                status_code=status_code,
+                elapsed=elapsed,
+                failed=response is None and exc is not None,
+                timestamp=time.time(),
+            )
+        )
+
+    def _report_gauge(self, name, value):
+        if self._statsd_client or self._influxdb_client:
+            _metrics.get_pipeline().submit(
+                _metrics.Gauge(self, name, value, time.time())
+            )
+
+    def _record_latency(self, recorder, response, url, method, elapsed):
+        try:
+            endpoint = '_'.join(
                 normalize_metric_name(f)
                 for f in self._extract_name(
                     url, self.service_type, self.session.get_project_id()
                 )
-            ]
-            key = '.'.join(
-                [
-                    self._statsd_prefix,
-                    normalize_metric_name(self.service_type),
-                    method,
-                    '_'.join(name_parts),
-                ]
             )
-            with self._statsd_client.pipeline() as pipe:
-                if response is not None:
-                    duration = int(response.elapsed.total_seconds() * 1000)
-                    metric_name = '{}.{}'.format(
-                        key, str(response.status_code)
-                    )
-                    pipe.timing(metric_name, duration)
-                    pipe.incr(metric_name)
-                    if duration > 1000:
-                        pipe.incr('%s.over_1000' % key)
-                elif exc is not None:
-                    pipe.incr('%s.failed' % key)
-                pipe.incr('%s.attempted' % key)
+            nbytes = 0
+            if response is not None:
+                length = response.headers.get('Content-Length')
+                if length and length.isdigit():
+                    nbytes = int(length)
+                elif isinstance(getattr(response, '_content', None), bytes):
+                    # Never read the body of streamed responses here
+                    nbytes = len(response._content)
+            recorder.record(
+                self.service_type,
+                endpoint,
+                method,
+                elapsed,
+                response is None or response.status_code >= 400,
+                nbytes,
+            )
         except Exception:
             # We do not want errors in metric reporting ever break client
-            self.log.exception("Exception reporting metrics")
-
-    def _report_stats_prometheus(
-        self, response, url=None, method=None, exc=None
-    ):
-        if response is not None and not url:
-            url = response.request.url
-        if response is not None and not method:
-            method = response.request.method
-        parsed_url = urlparse(url)
+            self.log.exception("Exception recording request latency")
+
+    def _report_stats_statsd(self, record, pipe):
+        if isinstance(record, _metrics.Gauge):
+            pipe.gauge(
+                '.'.join(
+                    [
+                        self._statsd_prefix,
+                        normalize_metric_name(self.service_type),
+                        record.name,
+                    ]
+                ),
+                record.value,
+            )
+            return
+        name_parts = [
+            normalize_metric_name(f)
+            for f in self._extract_name(
+                record.url, self.service_type, self.session.get_project_id()
+            )
+        ]
+        key = '.'.join(
+            [
+                self._statsd_prefix,
+                normalize_metric_name(self.service_type),
+                record.method,
+                '_'.join(name_parts),
+            ]
+        )
+        if record.status_code is not None:
+            duration = int(record.elapsed * 1000)
+            metric_name = f'{key}.{record.status_code}'
+            pipe.timing(metric_name, duration)
+            pipe.incr(metric_name)
+            if duration > 1000:
+                pipe.incr('%s.over_1000' % key)
+        elif record.failed:
+            pipe.incr('%s.failed' % key)
+        pipe.incr('%s.attempted' % key)
+
+    def _report_stats_prometheus(self, record):
+        parsed_url = urlparse(record.url)
         endpoint = "{}://{}{}".format(
             parsed_url.scheme, parsed_url.netloc, parsed_url.path
         )
-        if response is not None:
+        if record.status_code is not None:
             labels = dict(
-                method=method,
+                method=record.method,
                 endpoint=endpoint,
                 service_type=self.service_type,
-                status_code=response.status_code,
+                status_code=record.status_code,
             )
             self._prometheus_counter.labels(**labels).inc()
             self._prometheus_histogram.labels(**labels).observe(
-                response.elapsed.total_seconds() * 1000
+                record.elapsed * 1000
             )
 
-    def _report_stats_influxdb(
-        self, response, url=None, method=None, exc=None
-    ):
+    def _get_influxdb_point(self, record):
+        measurement = (
+            self._influxdb_config.get('measurement', 'openstack_api')
+            if self._influxdb_config
+            else 'openstack_api'
+        )
+        # Note(gtema) append service name into the measurement name
+        measurement = f'{measurement}.{self.service_type}'
+        # Points written together without a time would all get the time of
+        # the write, and overwrite each other
+        timestamp = int(record.timestamp * 1e9)
+        if isinstance(record, _metrics.Gauge):
+            return dict(
+                measurement=measurement,
+                time=timestamp,
+                tags=dict(
+                    (self._influxdb_config or {}).get('additional_metric_tags')
+                    or {}
+                ),
+                fields={record.name: record.value},
+            )
         # NOTE(gtema): status_code is saved both as tag and field to give
         # ability showing it as a value and not only as a legend.
         # However Influx is not ok with having same name in tags and fields,
         # therefore use different names.
-        if response is not None and not url:
-            url = response.request.url
-        if response is not None and not method:
-            method = response.request.method
+        method = record.method
         tags = dict(
             method=method,
             name='_'.join(
                 [
                     normalize_metric_name(f)
                     for f in self._extract_name(
-                        url, self.service_type, self.session.get_project_id()
+                        record.url,
+                        self.service_type,
+                        self.session.get_project_id(),
                     )
                 ]
             ),
         )
         fields = dict(attempted=1)
-        if response is not None:
-            fields['duration'] = int(response.elapsed.total_seconds() * 1000)
-            tags['status_code'] = str(response.status_code)
+        if record.status_code is not None:
+            status_code = record.status_code
+            fields['duration'] = int(record.elapsed * 1000)
+            tags['status_code'] = str(status_code)
             # Note(gtema): emit also status_code as a value (counter)
-            fields[str(response.status_code)] = 1
-            fields[f'{method}.{response.status_code}'] = 1
+            fields[str(status_code)] = 1
+            fields[f'{method}.{status_code}'] = 1
             # Note(gtema): status_code field itself is also very helpful on the
             # graphs to show what was the code, instead of counting its
             # occurences
-            fields['status_code_val'] = response.status_code
-        elif exc:
+            fields['status_code_val'] = status_code
+        elif record.failed:
             fields['failed'] = 1
         if 'additional_metric_tags' in self._influxdb_config:
             tags.update(self._influxdb_config['additional_metric_tags'])
-        measurement = (
-            self._influxdb_config.get('measurement', 'openstack_api')
-            if self._influxdb_config
-            else 'openstack_api'
+        return dict(
+            measurement=measurement, time=timestamp, tags=tags, fields=fields
         )
-        # Note(gtema) append service name into the measurement name
-        measurement = f'{measurement}.{self.service_type}'
-        data = [dict(measurement=measurement, tags=tags, fields=fields)]
-        try:
-            self._influxdb_client.write_points(data)
-        except Exception:
-            self.log.exception('Error writing statistics to InfluxDB')
 
     def _get_connection(self):
         """Get the Connection object associated with this Proxy.
@@ -431,6 +713,15 @@ class Proxy(adapter.Adapter):
             self, '_connection', getattr(self.session, '_sdk_connection', None)
         )
 
+    def _invalidate_find_cache(self, resource_type):
+        """Drop cached name resolutions of a resource type
+
+        See :meth:`~openstack.resource.Resource.find`.
+        """
+        find_cache = getattr(self._get_connection(), '_find_cache', None)
+        if isinstance(find_cache, resource._FindCache):
+            find_cache.invalidate((self.service_type, resource_type))
+
     def _get_resource(
         self, resource_type: ty.Type[ResourceType], value, **attrs
     ) -> ResourceType:
@@ -572,6 +863,8 @@ class Proxy(adapter.Adapter):
             if ignore_missing:
                 return None
             raise
+        finally:
+            self._invalidate_find_cache(resource_type)
 
         return rv
 
@@ -604,7 +897,10 @@ class Proxy(adapter.Adapter):
         :rtype: :class:`~openstack.resource.Resource`
         """
         res = self._get_resource(resource_type, value, **attrs)
-        return res.commit(self, base_path=base_path)
+        try:
+            return res.commit(self, base_path=base_path)
+        finally:
+            self._invalidate_find_cache(resource_type)
 
     def _create(
         self,
@@ -640,7 +936,10 @@ class Proxy(adapter.Adapter):
             attrs.pop('__conflicting_attrs')
         conn = self._get_connection()
         res = resource_type.new(connection=conn, **attrs)
-        return res.create(self, base_path=base_path)
+        try:
+            return res.create(self, base_path=base_path)
+        finally:
+            self._invalidate_find_cache(resource_type)
 
     def _bulk_create(
         self,
@@ -665,7 +964,10 @@ class Proxy(adapter.Adapter):
         :returns: A generator of Resource objects.
         :rtype: :class:`~openstack.resource.Resource`
         """
-        return resource_type.bulk_create(self, data, base_path=base_path)
+        try:
+            return resource_type.bulk_create(self, data, base_path=base_path)
+        finally:
+            self._invalidate_find_cache(resource_type)
 
     @_check_resource(strict=False)
     def _get(
@@ -711,12 +1013,52 @@ class Proxy(adapter.Adapter):
             ),
         )
 
+    def _get_many(
+        self,
+        resource_type: ty.Type[ResourceType],
+        values,
+        concurrency=10,
+        base_path=None,
+        skip_cache=False,
+        **attrs,
+    ) -> ty.List[ty.Union[ResourceType, Exception]]:
+        """Fetch several resources concurrently
+
+        :param resource_type: The type of resource to get.
+        :type resource_type: :class:`~openstack.resource.Resource`
+        :param values: An iterable of resource IDs or
+            :class:`~openstack.resource.Resource` instances.
+        :param int concurrency: The maximum number of concurrent fetch
+            requests.
+        :param str base_path: Base part of the URI for fetching resources, if
+            different from
+            :data:`~openstack.resource.Resource.base_path`.
+        :param bool skip_cache: A boolean indicating whether optional API
+            cache should be skipped for this invocation.
+        :param dict attrs: Attributes to be passed onto the
+            :meth:`~openstack.resource.Resource.fetch_many` method.
+
+        :returns: A list with, in the order of ``values``, either the fetched
+            resource or the exception raised while fetching it.
+        """
+        return resource_type.fetch_many(
+            self,
+            values,
+            concurrency=concurrency,
+            base_path=base_path,
+            skip_cache=skip_cache,
+            **attrs,
+        )
+
     def _list(
         self,
         resource_type: ty.Type[ResourceType],
         paginated=True,
         base_path=None,
         jmespath_filters=None,
+        lazy=False,
+        prefetch=None,
+        stream=False,
         **attrs,
     ) -> ty.Generator[ResourceType, None, None]:
         """List a resource
@@ -733,6 +1075,14 @@ class Proxy(adapter.Adapter):
             :data:`~openstack.resource.Resource.base_path`.
         :param str jmespath_filters: A string containing a jmespath expression
             for further filtering.
+        :param bool lazy: When set to ``True``, yielded resources only parse
+            their body once an attribute other than ``id`` or ``name`` is
+            accessed. See :meth:`~openstack.resource.Resource.list`.
+        :param int prefetch: Number of pages to fetch in the background ahead
+            of the consumer. See :meth:`~openstack.resource.Resource.list`.
+        :param bool stream: When set to ``True``, pages are decoded
+            incrementally while they are received. See
+            :meth:`~openstack.resource.Resource.list`.
 
         :param dict attrs: Attributes to be passed onto the
             :meth:`~openstack.resource.Resource.list` method. These should
@@ -744,6 +1094,12 @@ class Proxy(adapter.Adapter):
             :class:`~openstack.resource.Resource` that doesn't match
             the ``resource_type``.
         """
+        if lazy:
+            attrs['lazy'] = True
+        if prefetch:
+            attrs['prefetch'] = prefetch
+        if stream:
+            attrs['stream'] = True
         data = resource_type.list(
             self, paginated=paginated, base_path=base_path, **attrs
         )
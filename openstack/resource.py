@@ -34,9 +34,15 @@ and then returned to the caller.
 
 import abc
 import collections
+import concurrent.futures
+import functools
 import inspect
 import itertools
 import operator
+import queue
+import re
+import threading
+import time
 import typing as ty
 import urllib.parse
 import warnings
@@ -320,6 +326,602 @@ class _ComponentManager(collections.abc.MutableMapping):
             self._dirty = set()
 
 
+def _build_lookup(mapping):
+    """Build the case insensitive lookup index of a component mapping
+
+    Returns the set of attribute names of the mapping together with a dict
+    of lowercased server-side and attribute names to the server-side names
+    they match, in mapping order.
+    """
+    index: ty.Dict[str, ty.List[str]] = {}
+    for map_key, map_value in mapping.items():
+        for name in {map_key.lower(), map_value.lower()}:
+            index.setdefault(name, []).append(map_key)
+    return frozenset(mapping.values()), index
+
+
+class _Schema:
+    """Precompiled attribute layout of a Resource class
+
+    Walking the MRO of a Resource class and rebuilding the component mappings
+    is expensive and the result only depends on the class itself, so it is
+    done once per class and cached on it. See
+    :meth:`~openstack.resource.Resource._get_schema`.
+    """
+
+    def __init__(self, cls):
+        #: All (attribute name, component) pairs in MRO order. Attributes
+        #: overridden in subclasses appear once per defining class.
+        self.attributes = [
+            (attr, component)
+            for klass in cls.__mro__
+            for attr, component in klass.__dict__.items()
+            if isinstance(component, _BaseComponent)
+        ]
+        #: Mapping of server-side Body names to attribute names.
+        self.body_names: ty.Dict[str, str] = {}
+        #: Names of the Body and URI attributes of the class.
+        self.body_attributes = frozenset(
+            attr
+            for attr, _ in self.attributes
+            if isinstance(getattr(cls, attr, None), Body)
+        )
+        self.uri_attributes = frozenset(
+            attr
+            for attr, _ in self.attributes
+            if isinstance(getattr(cls, attr, None), URI)
+        )
+        #: Mapping of "aka" aliases to attribute names.
+        self.aliases = {}
+        for attr, component in self.attributes:
+            if isinstance(component, Body):
+                self.body_names.setdefault(component.name, attr)
+            if component.aka:
+                self.aliases[component.aka] = attr
+        #: Server-side name of the first alternate_id Body defined directly
+        #: on the class, or an empty string.
+        self.alternate_id = next(
+            (
+                value.name
+                for value in cls.__dict__.values()
+                if isinstance(value, Body) and value.alternate_id
+            ),
+            "",
+        )
+        #: Whether the class has an untyped ``properties`` attribute which
+        #: can hold attributes that are otherwise unknown.
+        properties = getattr(cls, 'properties', None)
+        self.has_untyped_properties = (
+            isinstance(properties, _BaseComponent) and properties.type is None
+        )
+
+        self._iterators = {}
+        self._mappings = {}
+        self._lookups = {}
+        self._lazy_class = None
+        self._names = {}
+        self._dict_keys = {}
+
+    def iterate(self, components):
+        """Return (attribute name, component) pairs of the given types"""
+        try:
+            return self._iterators[components]
+        except KeyError:
+            pass
+        result = [
+            (attr, component)
+            for attr, component in self.attributes
+            if isinstance(component, components)
+        ]
+        self._iterators[components] = result
+        return result
+
+    def mapping(self, component):
+        """Return the server name to attribute name mapping of a component
+
+        The returned mapping is shared and must not be modified.
+        """
+        try:
+            return self._mappings[component]
+        except KeyError:
+            pass
+        mapping = component._map_cls()
+        ret = component._map_cls()
+        for key, value in self.iterate(component):
+            # Make sure base classes don't end up overwriting
+            # mappings we've found previously in subclasses.
+            if key not in mapping:
+                # Make it this way first, to get MRO stuff correct.
+                mapping[key] = value.name
+        for k, v in mapping.items():
+            ret[v] = k
+        self._mappings[component] = ret
+        self._lookups[id(ret)] = (ret, _build_lookup(ret))
+        return ret
+
+    def lookup(self, mapping):
+        """Return the lookup index of a mapping, see :func:`_build_lookup`
+
+        Indexes of mappings returned by :meth:`mapping` are precomputed, any
+        other mapping gets indexed on the fly.
+        """
+        try:
+            owner, lookup = self._lookups[id(mapping)]
+        except KeyError:
+            pass
+        else:
+            if owner is mapping:
+                return lookup
+        return _build_lookup(mapping)
+
+    def names(self, components, remote_names, include_aliases):
+        """Return the list of attribute names used by Resource._attributes"""
+        key = (components, remote_names, include_aliases)
+        try:
+            return self._names[key]
+        except KeyError:
+            pass
+        names = []
+        for attr, component in self.iterate(components):
+            names.append(attr if not remote_names else component.name)
+            if include_aliases and component.aka:
+                names.append(component.aka)
+        self._names[key] = names
+        return names
+
+    def dict_keys(self, components, original_names):
+        """Return (dict key, attribute name) pairs used by Resource.to_dict
+
+        Pairs are returned in the order they need to be evaluated. Repeated
+        pairs, resulting from attributes overridden in subclasses, are
+        dropped since they would always produce the same value.
+        """
+        key = (components, original_names)
+        try:
+            return self._dict_keys[key]
+        except KeyError:
+            pass
+        pairs: ty.List[ty.Tuple[str, str]] = []
+        seen: ty.Set[ty.Tuple[str, str]] = set()
+        dict_key: str
+        for attr, component in self.iterate(components):
+            name = component.name if original_names else attr
+            for dict_key in filter(None, (name, component.aka)):
+                if (dict_key, attr) not in seen:
+                    seen.add((dict_key, attr))
+                    pairs.append((dict_key, attr))
+        self._dict_keys[key] = pairs
+        return pairs
+
+    def lazy_class(self, cls):
+        """Return the class used for lazily listed instances of ``cls``
+
+        Returns ``None`` if instances of ``cls`` can not be built lazily,
+        which is the case when the class customizes how attributes are
+        consumed or read, since the raw body can not be trusted then.
+        """
+        if self._lazy_class is None:
+            self._lazy_class = _build_lazy_class(cls, self) or False
+        return self._lazy_class or None
+
+
+#: Attributes of lazily listed resources that are served from the raw body
+_LAZY_ATTRIBUTES = ('id', 'name')
+#: Resource methods that must not be overridden for lazy listing to be safe
+_LAZY_HOOKS = (
+    '__init__',
+    '__getattribute__',
+    '_collect_attrs',
+    '_consume_attrs',
+    '_consume_body_attrs',
+    '_consume_mapped_attrs',
+    '_compute_attributes',
+)
+
+
+def _build_lazy_class(cls, schema):
+    """Create the lazy variant of a Resource class, see _LazyResourceMixin"""
+    if getattr(cls.existing, '__func__') is not getattr(
+        Resource.existing, '__func__'
+    ):
+        return None
+    if any(
+        getattr(cls, hook) is not getattr(Resource, hook)
+        for hook in _LAZY_HOOKS
+    ):
+        return None
+
+    names, index = schema.lookup(schema.mapping(Body))
+    fast_path = set()
+    for attr in _LAZY_ATTRIBUTES:
+        component = getattr(cls, attr, None)
+        if (
+            isinstance(component, Body)
+            and component.name == attr
+            and component.type is None
+            and not component.alias
+            and not component.deprecated
+            # Nothing else is consumed into the same body key
+            and index.get(attr.lower()) == [attr]
+        ):
+            fast_path.add(attr)
+    if not fast_path:
+        return None
+
+    return type(
+        cls.__name__,
+        (_LazyResourceMixin, cls),
+        {
+            '__module__': cls.__module__,
+            '__qualname__': cls.__qualname__,
+            '_lazy_fast_path': frozenset(fast_path),
+            '_lazy_base': cls,
+        },
+    )
+
+
+def _materialize(lazy):
+    """Turn a lazily listed resource into a regular instance in place"""
+    cls = type(lazy)._lazy_base
+    state = object.__getattribute__(lazy, '__dict__')
+    raw = state.pop('_lazy_raw')
+    connection = state.pop('_lazy_connection')
+    microversion = state.pop('_lazy_microversion')
+    dict.clear(lazy)
+    object.__setattr__(lazy, '__class__', cls)
+    cls.__init__(
+        lazy,
+        _synchronized=True,
+        connection=connection,
+        microversion=microversion,
+        **raw,
+    )
+
+
+def _materializing(name):
+    def method(self, *args, **kwargs):
+        _materialize(self)
+        return getattr(self, name)(*args, **kwargs)
+
+    method.__name__ = name
+    return method
+
+
+class _LazyResourceMixin:
+    """Deferred-parse Resource returned by ``Resource.list(lazy=True)``
+
+    Instances only hold the raw body of the resource. Attributes listed in
+    ``_lazy_fast_path`` are read straight from it, anything else turns the
+    instance into a regular instance of the listed class, parsing the body
+    exactly like :meth:`Resource.existing` would.
+    """
+
+    __slots__ = ()
+
+    _lazy_fast_path: ty.FrozenSet[str]
+    _lazy_base: ty.Type['Resource']
+
+    @classmethod
+    def _from_raw(cls, connection, microversion, raw):
+        lazy = cls.__new__(cls)
+        state = object.__getattribute__(lazy, '__dict__')
+        state['_lazy_raw'] = raw
+        state['_lazy_connection'] = connection
+        state['_lazy_microversion'] = microversion
+        # Some C code, such as the json encoder, looks at the dict storage
+        # directly and skips empty dicts. Keep a placeholder there so that
+        # it falls back to items() which materializes the resource.
+        dict.__setitem__(ty.cast(ty.Dict[str, ty.Any], lazy), '_lazy', True)
+        return lazy
+
+    def __bool__(self):
+        # A resource always has keys, don't parse it just to find out
+        return True
+
+    def __getattribute__(self, name):
+        state = object.__getattribute__(self, '__dict__')
+        if name == '__class__' or '_lazy_raw' not in state:
+            return super().__getattribute__(name)
+        raw = state['_lazy_raw']
+        if name in type(self)._lazy_fast_path and name in raw:
+            return raw[name]
+        _materialize(self)
+        return getattr(self, name)
+
+    __setattr__ = _materializing('__setattr__')
+    __delattr__ = _materializing('__delattr__')
+    __repr__ = _materializing('__repr__')
+    __eq__ = _materializing('__eq__')
+    __ne__ = _materializing('__ne__')
+    __len__ = _materializing('__len__')
+    __iter__ = _materializing('__iter__')
+    __contains__ = _materializing('__contains__')
+    __getitem__ = _materializing('__getitem__')
+    __setitem__ = _materializing('__setitem__')
+    __delitem__ = _materializing('__delitem__')
+
+
+class ListFilter(abc.ABC):
+    """Base class of client-side filters accepted by :meth:`Resource.list`
+
+    Passing an instance of a subclass as the value of a list parameter
+    matches resources on more than equality. Filters are always evaluated
+    by the client, even if the server supports filtering on the same
+    parameter, and can only be used on :class:`Body` attributes.
+    """
+
+    @abc.abstractmethod
+    def __call__(self, value):
+        """Return whether ``value`` matches this filter"""
+
+    def __repr__(self):
+        args = ', '.join(repr(arg) for arg in self._args())
+        return f'{self.__class__.__name__}({args})'
+
+    def _args(self):
+        return ()
+
+
+class In(ListFilter):
+    """Match attributes equal to any of the given values"""
+
+    def __init__(self, values):
+        self.values = list(values)
+        self._lookup: ty.Collection[ty.Any]
+        try:
+            self._lookup = frozenset(self.values)
+        except TypeError:
+            # Unhashable values, such as dicts, can only be scanned
+            self._lookup = self.values
+
+    def __call__(self, value):
+        try:
+            return value in self._lookup
+        except TypeError:
+            return value in self.values
+
+    def _args(self):
+        return (self.values,)
+
+
+class Prefix(ListFilter):
+    """Match string attributes starting with the given prefix"""
+
+    def __init__(self, prefix):
+        self.prefix = prefix
+
+    def __call__(self, value):
+        return isinstance(value, str) and value.startswith(self.prefix)
+
+    def _args(self):
+        return (self.prefix,)
+
+
+class Range(ListFilter):
+    """Match attributes within ``[min, max]``
+
+    Either bound may be ``None`` to leave that side of the range open.
+    Attributes which are unset, or can not be compared with the bounds,
+    never match.
+    """
+
+    def __init__(self, min=None, max=None):
+        self.min = min
+        self.max = max
+
+    def __call__(self, value):
+        if value is None:
+            return False
+        try:
+            if self.min is not None and value < self.min:
+                return False
+            if self.max is not None and value > self.max:
+                return False
+        except TypeError:
+            return False
+        return True
+
+    def _args(self):
+        return (self.min, self.max)
+
+
+class Regex(ListFilter):
+    """Match string attributes containing a match of a regular expression
+
+    Use ``^`` and ``$`` to anchor the expression.
+    """
+
+    def __init__(self, pattern, flags=0):
+        self.pattern = re.compile(pattern, flags)
+
+    def __call__(self, value):
+        return isinstance(value, str) and bool(self.pattern.search(value))
+
+    def _args(self):
+        return (self.pattern.pattern,)
+
+
+def _match_dict(expected, actual):
+    """Match a dict of expected values against a (nested) dict attribute"""
+    if not actual:
+        return False
+    for key, value in expected.items():
+        if not _match_value(value, actual.get(key, None)):
+            return False
+    return True
+
+
+def _match_value(expected, actual):
+    if isinstance(expected, ListFilter):
+        return expected(actual)
+    if isinstance(expected, dict):
+        return _match_dict(expected, actual)
+    return actual == expected
+
+
+def _compile_filters(filters):
+    """Compile client-side list filters into a single predicate
+
+    :param dict filters: Mapping of attribute names to expected values,
+        which may be dicts, matched against nested dict attributes, or
+        :class:`ListFilter` instances.
+    :returns: A function taking a resource and returning whether it matches
+        all ``filters``, or ``None`` if there are no filters.
+    """
+    if not filters:
+        return None
+    checks = []
+    getter: ty.Callable[[ty.Any], ty.Any]
+    test: ty.Callable[[ty.Any], bool]
+    for key, expected in filters.items():
+        if key in _LAZY_ATTRIBUTES:
+            # Avoid parsing lazily listed resources if possible
+            getter = operator.attrgetter(key)
+        else:
+            getter = operator.methodcaller('get', key, None)
+        if isinstance(expected, ListFilter):
+            test = expected
+        elif isinstance(expected, dict):
+            test = functools.partial(_match_dict, expected)
+        else:
+            test = functools.partial(operator.eq, expected)
+        checks.append((getter, test))
+
+    def predicate(value):
+        for getter, test in checks:
+            if not test(getter(value)):
+                return False
+        return True
+
+    return predicate
+
+
+#: Size of the chunks read from streamed list responses
+_STREAM_CHUNK_SIZE = 64 * 1024
+#: Marker yielded by the page iterator of Resource.list after each page
+_PAGE_END = object()
+#: Marker put into the prefetch buffer once the page iterator is exhausted
+_PAGES_DONE = object()
+#: Default number of concurrent requests issued by Resource.fetch_many
+_FETCH_MANY_CONCURRENCY = 10
+#: Maximum number of IDs passed to a single list call by Resource.fetch_many
+_FETCH_MANY_LIST_SIZE = 100
+
+
+def _prefetch_pages(values, pages):
+    """Consume a Resource.list page iterator in a background thread
+
+    :param values: Generator yielding resources, and ``_PAGE_END`` after
+        each page.
+    :param int pages: Maximum number of pages fetched, or being fetched,
+        ahead of the consumer.
+    :returns: A generator yielding the same items in the same order.
+    """
+    buffer: queue.Queue = queue.Queue()
+    slots = threading.Semaphore(pages)
+    stop = threading.Event()
+
+    def _worker():
+        try:
+            while True:
+                # Wait until the consumer picked up enough pages
+                slots.acquire()
+                if stop.is_set():
+                    return
+                page = []
+                for value in values:
+                    page.append(value)
+                    if value is _PAGE_END:
+                        break
+                else:
+                    if page:
+                        buffer.put((page, None))
+                    return
+                buffer.put((page, None))
+        except Exception as e:
+            buffer.put((None, e))
+        finally:
+            buffer.put((_PAGES_DONE, None))
+            values.close()
+
+    # NOTE: A dedicated thread is used rather than the connection's pool
+    # executor, since the pool may be exhausted by the very callers that are
+    # waiting for the listing to proceed.
+    thread = threading.Thread(target=_worker, daemon=True)
+    thread.start()
+    try:
+        while True:
+            page, exc = buffer.get()
+            if exc is not None:
+                raise exc
+            if page is _PAGES_DONE:
+                return
+            slots.release()
+            yield from page
+    finally:
+        stop.set()
+        # Wake the worker up in case it waits for a free slot
+        slots.release()
+
+
+#: Returned by _FindCache.get when nothing is cached for a key
+_FIND_CACHE_MISS = object()
+
+
+class _FindCache:
+    """Per-connection cache of name to ID resolutions of Resource.find
+
+    Entries are grouped by service type and resource class so that creating,
+    updating or deleting a resource through a proxy can drop every entry
+    that may have become stale. A cached ID of ``None`` records that nothing
+    matched the name.
+
+    :param float ttl: Seconds a resolved ID is kept, ``-1`` to keep it until
+        invalidated.
+    :param float negative_ttl: Seconds a failed resolution is kept, ``-1``
+        to keep it until invalidated and ``0`` to not cache failures.
+        Defaults to ``ttl``.
+    """
+
+    def __init__(self, ttl, negative_ttl=None):
+        self.ttl = ttl
+        self.negative_ttl = ttl if negative_ttl is None else negative_ttl
+        self._lock = threading.Lock()
+        self._groups: ty.Dict[tuple, ty.Dict[tuple, tuple]] = {}
+
+    def get(self, group, key):
+        """Return the cached ID, ``None`` or :data:`_FIND_CACHE_MISS`"""
+        with self._lock:
+            entries = self._groups.get(group)
+            if not entries or key not in entries:
+                return _FIND_CACHE_MISS
+            resource_id, expires = entries[key]
+            if expires is not None and expires <= time.monotonic():
+                del entries[key]
+                return _FIND_CACHE_MISS
+            return resource_id
+
+    def set(self, group, key, resource_id):
+        ttl = self.ttl if resource_id is not None else self.negative_ttl
+        if not ttl:
+            return
+        expires = None if ttl < 0 else time.monotonic() + ttl
+        with self._lock:
+            self._groups.setdefault(group, {})[key] = (resource_id, expires)
+
+    def discard(self, group, key):
+        with self._lock:
+            self._groups.get(group, {}).pop(key, None)
+
+    def invalidate(self, group=None):
+        """Drop the entries of a group, or every entry"""
+        with self._lock:
+            if group is None:
+                self._groups.clear()
+            else:
+                self._groups.pop(group, None)
+
+
 class _Request:
     """Prepared components that go into a KSA request"""
 
@@ -525,6 +1127,8 @@ class Resource(dict):
 
     # Placeholder for aliases as dict of {__alias__:__original}
     _attr_aliases: ty.Dict[str, str] = {}
+    # Precompiled attribute schema, see _get_schema
+    _schema: ty.ClassVar[_Schema]
 
     def __init__(self, _synchronized=False, connection=None, **attrs):
         """The base resource
@@ -577,17 +1181,11 @@ class Resource(dict):
             # When storing of unknown attributes is requested - ensure
             # we have properties attribute (with type=None)
             self._store_unknown_attrs_as_properties = (
-                hasattr(self.__class__, 'properties')
-                and self.__class__.properties.type is None
+                self._get_schema().has_untyped_properties
             )
 
         self._update_location()
 
-        for attr, component in self._attributes_iterator():
-            if component.aka:
-                # Register alias for the attribute (local name)
-                self._attr_aliases[component.aka] = attr
-
         # TODO(mordred) This is terrible, but is a hack at the moment to ensure
         # json.dumps works. The json library does basically if not obj: and
         # obj.items() ... but I think the if not obj: is short-circuiting down
@@ -595,16 +1193,29 @@ class Resource(dict):
         # always False even if we override __len__ or __bool__.
         dict.update(self, self.to_dict())
 
+    @classmethod
+    def _get_schema(cls):
+        """Return the precompiled attribute schema of this class
+
+        The schema is built on first use and stored on the class itself, so
+        every subclass gets its own schema. Components must therefore not be
+        added to a class after instances of it have been created.
+        """
+        schema = cls.__dict__.get('_schema')
+        if schema is None:
+            schema = _Schema(cls)
+            # Register aliases for the attributes (local names)
+            cls._attr_aliases.update(schema.aliases)
+            cls._schema = schema
+        return schema
+
     @classmethod
     def _attributes_iterator(cls, components=tuple([Body, Header])):
         """Iterator over all Resource attributes"""
         # isinstance stricly requires this to be a tuple
         # Since we're looking at class definitions we need to include
-        # subclasses, so check the whole MRO.
-        for klass in cls.__mro__:
-            for attr, component in klass.__dict__.items():
-                if isinstance(component, components):
-                    yield attr, component
+        # subclasses, so the schema contains the whole MRO.
+        return iter(cls._get_schema().iterate(components))
 
     def __repr__(self):
         pairs = [
@@ -684,15 +1295,15 @@ class Resource(dict):
             # returning Munch (and server side names) and Resource object with
             # normalized attributes we can offer dict access via server side
             # names.
-            for attr, component in self._attributes_iterator(tuple([Body])):
-                if component.name == name:
-                    warnings.warn(
-                        "Access to '%s[%s]' is deprecated. "
-                        "Use '%s.%s' attribute instead"
-                        % (self.__class__, name, self.__class__, attr),
-                        os_warnings.LegacyAPIWarning,
-                    )
-                    return getattr(self, attr)
+            attr = self._get_schema().body_names.get(name)
+            if attr is not None:
+                warnings.warn(
+                    "Access to '%s[%s]' is deprecated. "
+                    "Use '%s.%s' attribute instead"
+                    % (self.__class__, name, self.__class__, attr),
+                    os_warnings.LegacyAPIWarning,
+                )
+                return getattr(self, attr)
             if self._allow_unknown_attrs_in_body:
                 if name in self._unknown_attrs_in_body:
                     return self._unknown_attrs_in_body[name]
@@ -723,18 +1334,12 @@ class Resource(dict):
         self, remote_names=False, components=None, include_aliases=True
     ):
         """Generate list of supported attributes"""
-        attributes = []
-
         if not components:
             components = tuple([Body, Header, Computed, URI])
 
-        for attr, component in self._attributes_iterator(components):
-            key = attr if not remote_names else component.name
-            attributes.append(key)
-            if include_aliases and component.aka:
-                attributes.append(component.aka)
-
-        return attributes
+        return list(
+            self._get_schema().names(components, remote_names, include_aliases)
+        )
 
     def keys(self):
         # NOTE(mordred) In python2, dict.keys returns a list. In python3 it
@@ -807,11 +1412,11 @@ class Resource(dict):
         if any([body, header, uri]):
             attrs = self._compute_attributes(body, header, uri)
 
-            body.update(self._consume_attrs(self._body_mapping(), attrs))
+            body.update(self._consume_mapped_attrs(Body, attrs))
 
-            header.update(self._consume_attrs(self._header_mapping(), attrs))
-            uri.update(self._consume_attrs(self._uri_mapping(), attrs))
-        computed = self._consume_attrs(self._computed_mapping(), attrs)
+            header.update(self._consume_mapped_attrs(Header, attrs))
+            uri.update(self._consume_mapped_attrs(URI, attrs))
+        computed = self._consume_mapped_attrs(Computed, attrs)
         # TODO(mordred) We should make a Location Resource and add it here
         # instead of just the dict.
         if self._connection:
@@ -869,7 +1474,7 @@ class Resource(dict):
         self._uri.clean()
 
     def _consume_mapped_attrs(self, mapping_cls, attrs):
-        mapping = self._get_mapping(mapping_cls)
+        mapping = self._get_schema().mapping(mapping_cls)
         return self._consume_attrs(mapping, attrs)
 
     def _consume_attrs(self, mapping, attrs):
@@ -884,19 +1489,18 @@ class Resource(dict):
         """
         relevant_attrs = {}
         consumed_keys = []
+        names, index = self._get_schema().lookup(mapping)
         for key, value in attrs.items():
             # We want the key lookup in mapping to be case insensitive if the
             # mapping is, thus the use of get. We want value to be exact.
-            # If we find a match, we then have to loop over the mapping for
-            # to find the key to return, as there isn't really a "get me the
-            # key that matches this other key". We lower() in the inner loop
-            # because we've already done case matching in the outer loop.
-            if key in mapping.values() or mapping.get(key):
-                for map_key, map_value in mapping.items():
-                    if key.lower() in (map_key.lower(), map_value.lower()):
-                        relevant_attrs[map_key] = value
-                        consumed_keys.append(key)
-                continue
+            # If we find a match, we then use the lowercased index to find
+            # the keys to return, as there isn't really a "get me the key
+            # that matches this other key". The index is case insensitive
+            # because we've already done case matching here.
+            if key in names or mapping.get(key):
+                for map_key in index.get(key.lower(), ()):
+                    relevant_attrs[map_key] = value
+                    consumed_keys.append(key)
 
         for key in consumed_keys:
             attrs.pop(key)
@@ -914,17 +1518,8 @@ class Resource(dict):
     @classmethod
     def _get_mapping(cls, component):
         """Return a dict of attributes of a given component on the class"""
-        mapping = component._map_cls()
-        ret = component._map_cls()
-        for key, value in cls._attributes_iterator(component):
-            # Make sure base classes don't end up overwriting
-            # mappings we've found previously in subclasses.
-            if key not in mapping:
-                # Make it this way first, to get MRO stuff correct.
-                mapping[key] = value.name
-        for k, v in mapping.items():
-            ret[v] = k
-        return ret
+        # Hand out a copy so that callers can not alter the schema
+        return cls._get_schema().mapping(component).copy()
 
     @classmethod
     def _body_mapping(cls):
@@ -956,11 +1551,7 @@ class Resource(dict):
         Returns an empty string if no name exists, as this method is
         consumed by _get_id and passed to getattr.
         """
-        for value in cls.__dict__.values():
-            if isinstance(value, Body):
-                if value.alternate_id:
-                    return value.name
-        return ""
+        return cls._get_schema().alternate_id
 
     @staticmethod
     def _get_id(value):
@@ -1107,22 +1698,20 @@ class Resource(dict):
         # and we're mapping names on this class to their actual stored
         # values.
         # NOTE: isinstance stricly requires components to be a tuple
-        for attr, component in self._attributes_iterator(tuple(components)):
-            if original_names:
-                key = component.name
-            else:
-                key = attr
-            for key in filter(None, (key, component.aka)):
-                # Make sure base classes don't end up overwriting
-                # mappings we've found previously in subclasses.
-                if key not in mapping:
-                    converted = self._attr_to_dict(
-                        attr,
-                        to_munch=_to_munch,
-                    )
-                    if ignore_none and converted is None:
-                        continue
-                    mapping[key] = converted
+        dict_keys = self._get_schema().dict_keys(
+            tuple(components), original_names
+        )
+        for key, attr in dict_keys:
+            # Make sure base classes don't end up overwriting
+            # mappings we've found previously in subclasses.
+            if key not in mapping:
+                converted = self._attr_to_dict(
+                    attr,
+                    to_munch=_to_munch,
+                )
+                if ignore_none and converted is None:
+                    continue
+                mapping[key] = converted
 
         return mapping
 
@@ -1470,32 +2059,17 @@ class Resource(dict):
         :raises: :exc:`~openstack.exceptions.MethodNotSupported` if
             :data:`Resource.allow_create` is not set to ``True``.
         """
-        if not self.allow_create:
-            raise exceptions.MethodNotSupported(self, 'create')
+        request = self._prepare_create_request(
+            prepend_key=prepend_key,
+            base_path=base_path,
+            resource_request_key=resource_request_key,
+        )
 
         session = self._get_session(session)
         if microversion is None:
             microversion = self._get_microversion(session, action='create')
-        requires_id = (
-            self.create_requires_id
-            if self.create_requires_id is not None
-            else self.create_method == 'PUT'
-        )
-
-        # Construct request arguments.
-        request_kwargs = {
-            "requires_id": requires_id,
-            "prepend_key": prepend_key,
-            "base_path": base_path,
-        }
-        if resource_request_key is not None:
-            request_kwargs['resource_request_key'] = resource_request_key
-
-        if self.create_exclude_id_from_body:
-            self._body._dirty.discard("id")
 
         if self.create_method == 'PUT':
-            request = self._prepare_request(**request_kwargs)
             response = session.put(
                 request.url,
                 json=request.body,
@@ -1503,8 +2077,7 @@ class Resource(dict):
                 microversion=microversion,
                 params=params,
             )
-        elif self.create_method == 'POST':
-            request = self._prepare_request(**request_kwargs)
+        else:
             response = session.post(
                 request.url,
                 json=request.body,
@@ -1512,10 +2085,6 @@ class Resource(dict):
                 microversion=microversion,
                 params=params,
             )
-        else:
-            raise exceptions.ResourceFailure(
-                "Invalid create method: %s" % self.create_method
-            )
 
         has_body = (
             self.has_body
@@ -1540,6 +2109,43 @@ class Resource(dict):
             return self.fetch(session, **fetch_kwargs)
         return self
 
+    def _prepare_create_request(
+        self, prepend_key=True, base_path=None, resource_request_key=None
+    ):
+        """Prepare the request creating this resource
+
+        :returns: A :class:`_Request` to send with :data:`create_method`.
+        :raises: :exc:`~openstack.exceptions.MethodNotSupported` if
+            :data:`Resource.allow_create` is not set to ``True``.
+        :raises: :exc:`~openstack.exceptions.ResourceFailure` if
+            :data:`Resource.create_method` is neither PUT nor POST.
+        """
+        if not self.allow_create:
+            raise exceptions.MethodNotSupported(self, 'create')
+        if self.create_method not in ('PUT', 'POST'):
+            raise exceptions.ResourceFailure(
+                "Invalid create method: %s" % self.create_method
+            )
+        requires_id = (
+            self.create_requires_id
+            if self.create_requires_id is not None
+            else self.create_method == 'PUT'
+        )
+
+        # Construct request arguments.
+        request_kwargs = {
+            "requires_id": requires_id,
+            "prepend_key": prepend_key,
+            "base_path": base_path,
+        }
+        if resource_request_key is not None:
+            request_kwargs['resource_request_key'] = resource_request_key
+
+        if self.create_exclude_id_from_body:
+            self._body._dirty.discard("id")
+
+        return self._prepare_request(**request_kwargs)
+
     @classmethod
     def bulk_create(
         cls,
@@ -1709,6 +2315,123 @@ class Resource(dict):
         self._translate_response(response, **kwargs)
         return self
 
+    @classmethod
+    def fetch_many(
+        cls,
+        session,
+        ids,
+        concurrency=_FETCH_MANY_CONCURRENCY,
+        base_path=None,
+        skip_cache=False,
+        **params,
+    ):
+        """Get several remote resources at once.
+
+        When the service allows filtering lists by ``id`` the resources are
+        first requested with a single :meth:`list` call per chunk of
+        :data:`_FETCH_MANY_LIST_SIZE` IDs, unless the service turns out to
+        ignore the filter. Any resource not returned that way is fetched
+        individually on a dedicated pool of at most ``concurrency``
+        threads.
+
+        :param session: The session to use for making this request.
+        :type session: :class:`~keystoneauth1.adapter.Adapter`
+        :param ids: An iterable of resource IDs or :class:`Resource`
+            instances.
+        :param int concurrency: The maximum number of concurrent fetch
+            requests.
+        :param str base_path: Base part of the URI for fetching resources, if
+            different from :data:`~openstack.resource.Resource.base_path`.
+        :param bool skip_cache: A boolean indicating whether optional API
+            cache should be skipped for this invocation.
+        :param dict params: Additional parameters, such as URI attributes of
+            the resources, passed to :meth:`new` and :meth:`list`.
+        :return: A list with one entry per item of ``ids``, in the same
+            order. Each entry is either the fetched :class:`Resource` or the
+            exception raised while fetching it.
+        :raises: :exc:`~openstack.exceptions.MethodNotSupported` if
+            :data:`Resource.allow_fetch` is not set to ``True``.
+        """
+        if not cls.allow_fetch:
+            raise exceptions.MethodNotSupported(cls, 'fetch')
+
+        session = cls._get_session(session)
+        ids = [cls._get_id(value) for value in ids]
+        unique_ids = list(dict.fromkeys(ids))
+        results: ty.Dict[str, ty.Any] = {}
+
+        if (
+            cls.allow_list
+            and 'id' in cls._query_mapping._mapping
+            and len(unique_ids) > 1
+        ):
+            for offset in range(0, len(unique_ids), _FETCH_MANY_LIST_SIZE):
+                chunk = unique_ids[offset : offset + _FETCH_MANY_LIST_SIZE]
+                wanted = set(chunk)
+                filtered = True
+                try:
+                    for res in cls.list(
+                        session,
+                        base_path=base_path,
+                        skip_cache=skip_cache,
+                        id=chunk,
+                        **params,
+                    ):
+                        if res.id not in wanted:
+                            # The service ignored the id filter, stop before
+                            # paging through the whole collection
+                            filtered = False
+                            break
+                        results.setdefault(res.id, res)
+                except exceptions.SDKException as e:
+                    # Not every service accepts several values for the id
+                    # filter; fall back to fetching the chunk one by one.
+                    LOG.debug(
+                        "Listing %s by id failed, fetching individually: %s",
+                        cls.__name__,
+                        e,
+                    )
+                if not filtered:
+                    LOG.debug(
+                        "Listing %s is not filtered by id, fetching "
+                        "individually",
+                        cls.__name__,
+                    )
+                    break
+
+        connection = session._get_connection()
+
+        def _fetch(resource_id):
+            res = cls.new(id=resource_id, connection=connection, **params)
+            try:
+                return res.fetch(
+                    session, base_path=base_path, skip_cache=skip_cache
+                )
+            except Exception as e:
+                return e
+
+        missing = [
+            resource_id
+            for resource_id in unique_ids
+            if resource_id not in results
+        ]
+        if len(missing) < 2 or concurrency <= 1:
+            for resource_id in missing:
+                results[resource_id] = _fetch(resource_id)
+        else:
+            # NOTE: A dedicated pool is used rather than the connection's pool
+            # executor, since the caller may itself be running on that pool
+            # and would then wait for requests that can never be scheduled.
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(concurrency, len(missing))
+            ) as executor:
+                for resource_id, result in zip(
+                    missing, executor.map(_fetch, missing)
+                ):
+                    results[resource_id] = result
+
+        return [results[resource_id] for resource_id in ids]
+
     def head(self, session, base_path=None, *, microversion=None):
         """Get headers from a remote resource based on this instance.
 
@@ -1775,37 +2498,56 @@ class Resource(dict):
         :raises: :exc:`~openstack.exceptions.MethodNotSupported` if
             :data:`Resource.allow_commit` is not set to ``True``.
         """
+        request = self._prepare_commit_request(
+            prepend_key=prepend_key, base_path=base_path, **kwargs
+        )
+        # Only try to update if we actually have anything to commit.
+        if request is None:
+            return self
+
+        if microversion is None:
+            microversion = self._get_microversion(session, action='commit')
+
+        return self._commit(
+            session,
+            request,
+            self.commit_method,
+            microversion,
+            has_body=has_body,
+            retry_on_conflict=retry_on_conflict,
+        )
+
+    def _prepare_commit_request(
+        self, prepend_key=True, base_path=None, **kwargs
+    ):
+        """Prepare the request committing the changes of this resource
+
+        :param dict kwargs: Parameters that will be passed to
+            _prepare_request()
+        :returns: A :class:`_Request` to send with :data:`commit_method`, or
+            None if there is nothing to commit.
+        :raises: :exc:`~openstack.exceptions.MethodNotSupported` if
+            :data:`Resource.allow_commit` is not set to ``True``.
+        """
         if not self.allow_commit:
             raise exceptions.MethodNotSupported(self, 'commit')
 
         # The id cannot be dirty for an commit
         self._body._dirty.discard("id")
 
-        # Only try to update if we actually have anything to commit.
         if not self.requires_commit:
-            return self
+            return None
 
         # Avoid providing patch unconditionally to avoid breaking subclasses
         # without it.
         if self.commit_jsonpatch:
             kwargs['patch'] = True
 
-        request = self._prepare_request(
+        return self._prepare_request(
             prepend_key=prepend_key,
             base_path=base_path,
             **kwargs,
         )
-        if microversion is None:
-            microversion = self._get_microversion(session, action='commit')
-
-        return self._commit(
-            session,
-            request,
-            self.commit_method,
-            microversion,
-            has_body=has_body,
-            retry_on_conflict=retry_on_conflict,
-        )
 
     def _commit(
         self,
@@ -1991,6 +2733,10 @@ class Resource(dict):
         *,
         microversion=None,
         headers=None,
+        lazy=False,
+        prefetch=None,
+        stream=False,
+        skip_cache=False,
         **params,
     ):
         """This method is a generator which yields resource objects.
@@ -2013,6 +2759,22 @@ class Resource(dict):
         :param str microversion: API version to override the negotiated one.
         :param dict headers: Additional headers to inject into the HTTP
             request.
+        :param bool lazy: When ``True``, yield resources which only keep the
+            raw response body and parse it on first access of an attribute
+            other than ``id`` or ``name``. This saves CPU and memory when
+            most of the listed resources are never looked at in detail.
+            Resource classes which customize attribute parsing are always
+            parsed eagerly.
+        :param int prefetch: When set, fetch following pages in a background
+            thread while the current one is being consumed, keeping at most
+            this many pages fetched ahead of the consumer.
+        :param bool stream: When ``True``, decode every page incrementally
+            while it is being received and yield its resources as soon as
+            they arrive, instead of buffering and decoding the whole page
+            first. Useful for pages with thousands of resources. Streamed
+            responses bypass the optional API cache.
+        :param bool skip_cache: A boolean indicating whether optional API
+            cache should be skipped for this invocation.
         :param dict params: These keyword arguments are passed through the
             :meth:`~openstack.resource.QueryParamter._transpose` method
             to find if any of them match expected query parameters to be sent
@@ -2023,7 +2785,9 @@ class Resource(dict):
             the contents of this argument.
             Parameters supported as filters by the server side are passed in
             the API call, remaining parameters are applied as filters to the
-            retrieved results.
+            retrieved results. Values may be :class:`ListFilter` instances,
+            such as :class:`In`, :class:`Prefix`, :class:`Range` or
+            :class:`Regex`, which are always applied on the client side.
 
         :return: A generator of :class:`Resource` objects.
         :raises: :exc:`~openstack.exceptions.MethodNotSupported` if
@@ -2042,128 +2806,204 @@ class Resource(dict):
         if base_path is None:
             base_path = cls.base_path
 
-        api_filters = cls._query_mapping._validate(
-            params,
-            base_path=base_path,
-            allow_unknown_params=True,
+        uri, query_params, uri_params, matches = cls._get_list_query(
+            base_path, params
         )
+        limit = query_params.get('limit')
+
+        headers_final = {"Accept": "application/json"}
+        if headers:
+            headers_final = {**headers_final, **headers}
+
+        lazy_class = cls._get_schema().lazy_class(cls) if lazy else None
+
+        request_kwargs = {}
+        if stream:
+            request_kwargs['stream'] = True
+        if skip_cache:
+            request_kwargs['skip_cache'] = True
+
+        def _values(uri):
+            """Fetch all pages and build their resources
+
+            The end of every page is signalled by yielding _PAGE_END.
+            """
+            # Track the total number of resources yielded so we can paginate
+            # swift objects
+            total_yielded = 0
+            while uri:
+                # Copy query_params due to weird mock unittest interactions
+                response = session.get(
+                    uri,
+                    headers=headers_final,
+                    params=query_params.copy(),
+                    microversion=microversion,
+                    **request_kwargs,
+                )
+                exceptions.raise_from_response(response)
+
+                # Discard any existing pagination keys
+                last_marker = query_params.pop('marker', None)
+                query_params.pop('limit', None)
+
+                resources: ty.Iterable[ty.Any]
+                if stream:
+                    page_stream = utils.JSONArrayStream(
+                        response.iter_content(chunk_size=_STREAM_CHUNK_SIZE),
+                        cls.resources_key,
+                    )
+                    resources = page_stream
+                else:
+                    data = response.json()
+
+                    if cls.resources_key:
+                        resources = data[cls.resources_key]
+                    else:
+                        resources = data
+
+                    if not isinstance(resources, list):
+                        resources = [resources]
+
+                marker = None
+                page_size = 0
+                try:
+                    for raw_resource in resources:
+                        # Do not allow keys called "self" through. Glance chose
+                        # to name a key "self", so we need to pop it out because
+                        # we can't send it through cls.existing and into the
+                        # Resource initializer. "self" is already the first
+                        # argument and is practically a reserved word.
+                        raw_resource.pop("self", None)
+                        # We want that URI props are available on the resource
+                        raw_resource.update(uri_params)
+
+                        if lazy_class is not None:
+                            value = lazy_class._from_raw(
+                                session._get_connection(),
+                                microversion,
+                                raw_resource,
+                            )
+                        else:
+                            value = cls.existing(
+                                microversion=microversion,
+                                connection=session._get_connection(),
+                                **raw_resource,
+                            )
+                        marker = value.id
+                        yield value
+                        page_size += 1
+                        total_yielded += 1
+                finally:
+                    if stream:
+                        # Release the connection even if the consumer
+                        # stopped before the end of the page
+                        response.close()
+
+                if stream:
+                    # Everything but the resources, such as links, is only
+                    # known once the whole page has been read
+                    data = page_stream.data
+
+                yield _PAGE_END
+
+                if page_size and paginated:
+                    uri, next_params = cls._get_next_link(
+                        uri, response, data, marker, limit, total_yielded
+                    )
+                    try:
+                        if next_params['marker'] == last_marker:
+                            # If next page marker is same as what we were
+                            # just asked something went terribly wrong. Some
+                            # ancient services had bugs.
+                            raise exceptions.SDKException(
+                                'Endless pagination loop detected, aborting'
+                            )
+                    except KeyError:
+                        # do nothing, exception handling is cheaper then "if"
+                        pass
+                    query_params.update(next_params)
+                else:
+                    return
+
+        values = _values(uri)
+        if prefetch:
+            values = _prefetch_pages(values, prefetch)
+
+        for value in values:
+            if value is _PAGE_END:
+                continue
+            if matches is None or matches(value):
+                yield value
+
+    @classmethod
+    def _get_list_query(cls, base_path, params):
+        """Split the parameters of a listing between server and client
+
+        :param str base_path: The base path of the listing.
+        :param dict params: The parameters given to :meth:`list`.
+        :returns: A tuple of the URI of the first page, the query
+            parameters to send, the URI parameters to set on the listed
+            resources and the client-side filter function, or None.
+        """
+        schema = cls._get_schema()
         client_filters = {}
+        server_params = params
         # Gather query parameters which are not supported by the server
         for k, v in params.items():
-            if (
-                # Known attr
-                hasattr(cls, k)
+            if isinstance(v, ListFilter):
+                if k not in schema.body_attributes:
+                    raise exceptions.InvalidResourceQuery(
+                        message="Filter %r can not be applied to %s.%s"
+                        % (v, cls.__name__, k),
+                        extra_data=[k],
+                    )
+                client_filters[k] = v
+            elif (
                 # Is real attr property
-                and isinstance(getattr(cls, k), Body)
+                k in schema.body_attributes
                 # not included in the query_params
-                and k not in cls._query_mapping._mapping.keys()
+                and k not in cls._query_mapping._mapping
             ):
                 client_filters[k] = v
+        if any(isinstance(v, ListFilter) for v in client_filters.values()):
+            # Never send filter objects to the server
+            server_params = {
+                k: v
+                for k, v in params.items()
+                if not isinstance(v, ListFilter)
+            }
+        api_filters = cls._query_mapping._validate(
+            server_params,
+            base_path=base_path,
+            allow_unknown_params=True,
+        )
         query_params = cls._query_mapping._transpose(api_filters, cls)
         uri = base_path % params
         uri_params = {}
 
-        limit = query_params.get('limit')
-
         for k, v in params.items():
             # We need to gather URI parts to set them on the resource later
-            if hasattr(cls, k) and isinstance(getattr(cls, k), URI):
+            if k in schema.uri_attributes:
                 uri_params[k] = v
 
-        def _dict_filter(f, d):
-            """Dict param based filtering"""
-            if not d:
-                return False
-            for key in f.keys():
-                if isinstance(f[key], dict):
-                    if not _dict_filter(f[key], d.get(key, None)):
-                        return False
-                elif d.get(key, None) != f[key]:
-                    return False
-            return True
-
-        headers_final = {"Accept": "application/json"}
-        if headers:
-            headers_final = {**headers_final, **headers}
-
-        # Track the total number of resources yielded so we can paginate
-        # swift objects
-        total_yielded = 0
-        while uri:
-            # Copy query_params due to weird mock unittest interactions
-            response = session.get(
-                uri,
-                headers=headers_final,
-                params=query_params.copy(),
-                microversion=microversion,
+        matches = _compile_filters(client_filters)
+        if params:
+            LOG.debug(
+                "Listing %s with server-side filters %s, client-side "
+                "filters %s, ignored parameters %s",
+                cls.__name__,
+                sorted(query_params),
+                sorted(client_filters),
+                sorted(set(params) - set(api_filters) - set(client_filters)),
             )
-            exceptions.raise_from_response(response)
-            data = response.json()
-
-            # Discard any existing pagination keys
-            last_marker = query_params.pop('marker', None)
-            query_params.pop('limit', None)
-
-            if cls.resources_key:
-                resources = data[cls.resources_key]
-            else:
-                resources = data
-
-            if not isinstance(resources, list):
-                resources = [resources]
-
-            marker = None
-            for raw_resource in resources:
-                # Do not allow keys called "self" through. Glance chose
-                # to name a key "self", so we need to pop it out because
-                # we can't send it through cls.existing and into the
-                # Resource initializer. "self" is already the first
-                # argument and is practically a reserved word.
-                raw_resource.pop("self", None)
-                # We want that URI props are available on the resource
-                raw_resource.update(uri_params)
-
-                value = cls.existing(
-                    microversion=microversion,
-                    connection=session._get_connection(),
-                    **raw_resource,
+            if client_filters and not set(query_params) - {'limit', 'marker'}:
+                LOG.debug(
+                    "Listing %s fetches every resource and filters them "
+                    "on the client side",
+                    cls.__name__,
                 )
-                marker = value.id
-                filters_matched = True
-                # Iterate over client filters and return only if matching
-                for key in client_filters.keys():
-                    if isinstance(client_filters[key], dict):
-                        if not _dict_filter(
-                            client_filters[key], value.get(key, None)
-                        ):
-                            filters_matched = False
-                            break
-                    elif value.get(key, None) != client_filters[key]:
-                        filters_matched = False
-                        break
 
-                if filters_matched:
-                    yield value
-                total_yielded += 1
-
-            if resources and paginated:
-                uri, next_params = cls._get_next_link(
-                    uri, response, data, marker, limit, total_yielded
-                )
-                try:
-                    if next_params['marker'] == last_marker:
-                        # If next page marker is same as what we were just
-                        # asked something went terribly wrong. Some ancient
-                        # services had bugs.
-                        raise exceptions.SDKException(
-                            'Endless pagination loop detected, aborting'
-                        )
-                except KeyError:
-                    # do nothing, exception handling is cheaper then "if"
-                    pass
-                query_params.update(next_params)
-            else:
-                return
+        return uri, query_params, uri_params, matches
 
     @classmethod
     def _get_next_link(cls, uri, response, data, marker, limit, total_yielded):
@@ -2336,6 +3176,34 @@ class Resource(dict):
         """
         session = cls._get_session(session)
 
+        find_cache = getattr(session._get_connection(), '_find_cache', None)
+        if isinstance(find_cache, _FindCache):
+            cache_group = (getattr(session, 'service_type', None), cls)
+            cache_key = (
+                name_or_id,
+                list_base_path,
+                all_projects,
+                tuple(sorted((k, repr(v)) for k, v in params.items())),
+            )
+            resource_id = find_cache.get(cache_group, cache_key)
+            if resource_id is None:
+                return cls._not_found(name_or_id, ignore_missing)
+            if resource_id is not _FIND_CACHE_MISS:
+                try:
+                    match = cls.existing(
+                        id=resource_id,
+                        connection=session._get_connection(),
+                        **params,
+                    )
+                    return match.fetch(
+                        session, microversion=microversion, **params
+                    )
+                except exceptions.NotFoundException:
+                    # Deleted behind our back, resolve the name again
+                    find_cache.discard(cache_group, cache_key)
+        else:
+            find_cache = None
+
         # Try to short-circuit by looking directly for a matching ID.
         try:
             match = cls.existing(
@@ -2371,9 +3239,19 @@ class Resource(dict):
         data = cls.list(session, **params)
 
         result = cls._get_one_match(name_or_id, data)
+        if find_cache is not None:
+            find_cache.set(
+                cache_group,
+                cache_key,
+                result.id if result is not None else None,
+            )
         if result is not None:
             return result
 
+        return cls._not_found(name_or_id, ignore_missing)
+
+    @classmethod
+    def _not_found(cls, name_or_id, ignore_missing):
         if ignore_missing:
             return None
 
@@ -2382,6 +3260,27 @@ class Resource(dict):
         )
 
 
+def _get_backoff(session, backoff):
+    """Return the polling strategy of a waiter
+
+    Unless given explicitly, the strategy comes from the cloud config, which
+    validates it.
+    """
+    if backoff is not None:
+        return utils.get_backoff(backoff)
+    get_connection = getattr(session, '_get_connection', None)
+    connection = get_connection() if get_connection else None
+    config = getattr(connection, 'config', None)
+    get_polling_strategy = getattr(config, 'get_polling_strategy', None)
+    if get_polling_strategy is None:
+        return None
+    backoff = get_polling_strategy()
+    # Sessions which are not bound to a cloud config have no strategy
+    if not isinstance(backoff, utils.Backoff):
+        return None
+    return backoff
+
+
 def _normalize_status(status):
     if status is not None:
         status = status.lower()
@@ -2397,6 +3296,7 @@ def wait_for_status(
     wait=None,
     attribute='status',
     callback=None,
+    backoff=None,
 ):
     """Wait for the resource to be in a particular status.
 
@@ -2416,6 +3316,9 @@ def wait_for_status(
     :param callback: A callback function. This will be called with a single
         value, progress. This is API specific but is generally a percentage
         value from 0-100.
+    :param backoff: The polling strategy, see
+        :func:`~openstack.utils.get_backoff`. Defaults to the
+        ``polling_strategy`` of the cloud config.
 
     :return: The updated resource.
     :raises: :class:`~openstack.exceptions.ResourceTimeout` transition
@@ -2440,7 +3343,10 @@ def wait_for_status(
     )
 
     for count in utils.iterate_timeout(
-        timeout=wait, message=msg, wait=interval
+        timeout=wait,
+        message=msg,
+        wait=interval,
+        backoff=_get_backoff(session, backoff),
     ):
         resource = resource.fetch(session, skip_cache=True)
         if not resource:
@@ -2474,7 +3380,9 @@ def wait_for_status(
             callback(progress)
 
 
-def wait_for_delete(session, resource, interval, wait, callback=None):
+def wait_for_delete(
+    session, resource, interval, wait, callback=None, backoff=None
+):
     """Wait for the resource to be deleted.
 
     :param session: The session to use for making this request.
@@ -2486,6 +3394,9 @@ def wait_for_delete(session, resource, interval, wait, callback=None):
     :param callback: A callback function. This will be called with a single
         value, progress. This is API specific but is generally a percentage
         value from 0-100.
+    :param backoff: The polling strategy, see
+        :func:`~openstack.utils.get_backoff`. Defaults to the
+        ``polling_strategy`` of the cloud config.
 
     :return: Method returns self on success.
     :raises: :class:`~openstack.exceptions.ResourceTimeout` transition
@@ -2498,6 +3409,7 @@ def wait_for_delete(session, resource, interval, wait, callback=None):
             res=resource.__class__.__name__, id=resource.id
         ),
         wait=interval,
+        backoff=_get_backoff(session, backoff),
     ):
         try:
             resource = resource.fetch(session, skip_cache=True)
@@ -2513,3 +3425,211 @@ def wait_for_delete(session, resource, interval, wait, callback=None):
         if callback:
             progress = getattr(resource, 'progress', None) or 0
             callback(progress)
+
+
+def wait_for_many(
+    session,
+    resources,
+    status,
+    failures,
+    interval=None,
+    wait=None,
+    attribute='status',
+    callback=None,
+    list_base_path=None,
+    backoff=None,
+):
+    """Wait for several resources to be in a particular status.
+
+    Rather than fetching every resource on every check, resources of the
+    same type are refreshed with a single list call per check, filtered by
+    ID. When the service cannot filter lists by ID, the collection is paged
+    through instead, filtered by ``project_id`` and by ``attribute`` when
+    all the pending resources share the same value. Resources missing from
+    the listing, for example because they belong to another project or
+    changed status, are fetched individually.
+
+    :param session: The session to use for making this request.
+    :type session: :class:`~keystoneauth1.adapter.Adapter`
+    :param resources: The resources to wait on to reach the status. The
+        resources must have a status attribute specified via ``attribute``.
+    :type resources: list of :class:`~openstack.resource.Resource`
+    :param status: Desired status of the resources.
+    :param list failures: Statuses that would indicate the transition
+        failed such as 'ERROR'. Defaults to ['ERROR'].
+    :param interval: Number of seconds to wait between checks.
+        Set to ``None`` to use the default interval.
+    :param wait: Maximum number of seconds to wait for all transitions.
+        Set to ``None`` to wait forever.
+    :param attribute: Name of the resource attribute that contains the status.
+    :param callback: A callback function. This will be called with each
+        resource as soon as it reaches the desired status.
+    :param list_base_path: Base path used to list the resources, if different
+        from their :data:`~openstack.resource.Resource.base_path`. Either a
+        string used for all resources or a dict mapping resource classes to
+        base paths, such as the ``detail`` variants of the listing API.
+    :param backoff: The polling strategy, see
+        :func:`~openstack.utils.get_backoff`. Defaults to the
+        ``polling_strategy`` of the cloud config.
+
+    :return: A list with, in the order of ``resources``, either the updated
+        resource or the :class:`~openstack.exceptions.ResourceFailure`
+        explaining why it did not reach the status.
+    :raises: :class:`~openstack.exceptions.ResourceTimeout` transition
+        to status failed to occur in wait seconds for some of the resources.
+    :raises: :class:`~AttributeError` if a resource does not have a status
+        attribute
+    """
+    resources = list(resources)
+    if failures is None:
+        failures = ['ERROR']
+
+    failures = [f.lower() for f in failures]
+    results: ty.List[ty.Any] = [None] * len(resources)
+    pending = {}
+
+    def _resolve(index, resource):
+        """Record the outcome of a resource, return whether it finished"""
+        original = resources[index]
+        name = f"{original.__class__.__name__}:{original.id}"
+        if resource is None:
+            results[index] = exceptions.ResourceFailure(
+                f"{name} went away while waiting for {status}"
+            )
+            return True
+        new_status = getattr(resource, attribute)
+        normalized_status = _normalize_status(new_status)
+        if normalized_status == _normalize_status(status):
+            results[index] = resource
+            if callback:
+                callback(resource)
+            return True
+        elif normalized_status in failures:
+            results[index] = exceptions.ResourceFailure(
+                "{name} transitioned to failure state {status}".format(
+                    name=name, status=new_status
+                )
+            )
+            return True
+        return False
+
+    for index, resource in enumerate(resources):
+        if not _resolve(index, resource):
+            pending[index] = resource
+
+    if not pending:
+        return results
+
+    msg = "Timeout waiting for resources to transition to {status}"
+    try:
+        for count in utils.iterate_timeout(
+            timeout=wait,
+            message=msg.format(status=status),
+            wait=interval,
+            backoff=_get_backoff(session, backoff),
+        ):
+            for index, resource in list(
+                _refresh_many(session, pending, list_base_path, attribute)
+            ):
+                if _resolve(index, resource):
+                    del pending[index]
+                else:
+                    pending[index] = resource
+
+            if not pending:
+                return results
+
+            LOG.debug(
+                'Still waiting for %d resources to reach state %s',
+                len(pending),
+                status,
+            )
+    except exceptions.ResourceTimeout:
+        # Name the resources still pending when the time ran out
+        names = ', '.join(
+            f"{resource.__class__.__name__}:{resource.id}"
+            for resource in pending.values()
+        )
+        raise exceptions.ResourceTimeout(
+            "Timeout waiting for {count} resources to transition to "
+            "{status}: {names}".format(
+                count=len(pending), status=status, names=names
+            )
+        ) from None
+
+
+def _refresh_many(session, pending, list_base_path, attribute='status'):
+    """Yield (index, refreshed resource or None) for pending resources"""
+    groups: ty.Dict[tuple, ty.Dict[ty.Any, ty.List[int]]] = {}
+    for index, resource in pending.items():
+        resource_type = type(resource)
+        # Resources nested under different parents are listed separately
+        uri_params = tuple(sorted(resource._uri.attributes.items()))
+        groups.setdefault((resource_type, uri_params), {}).setdefault(
+            resource.id, []
+        ).append(index)
+
+    for (resource_type, uri_params), indexes in groups.items():
+        listed = {}
+        query = dict(uri_params)
+        if isinstance(list_base_path, dict):
+            base_path = list_base_path.get(resource_type)
+        else:
+            base_path = list_base_path
+        if base_path:
+            query['base_path'] = base_path
+        query_mapping = resource_type._query_mapping._mapping
+        if resource_type.allow_list and 'id' in query_mapping:
+            ids = list(indexes)
+            for offset in range(0, len(ids), _FETCH_MANY_LIST_SIZE):
+                query['id'] = ids[offset : offset + _FETCH_MANY_LIST_SIZE]
+                filtered = True
+                for resource in resource_type.list(
+                    session, skip_cache=True, **query
+                ):
+                    if resource.id not in indexes:
+                        # The service ignored the id filter
+                        filtered = False
+                        break
+                    listed[resource.id] = resource
+                if not filtered:
+                    break
+        elif resource_type.allow_list and len(indexes) > 1:
+            # Without ID filtering, page through the collection once, narrowed
+            # down by the filters all the pending resources have in common.
+            # Resources which changed status meanwhile are fetched below.
+            for name in ('project_id', attribute):
+                if name not in query_mapping:
+                    continue
+                values = {
+                    getattr(pending[index], name, None)
+                    for resource_indexes in indexes.values()
+                    for index in resource_indexes
+                }
+                if len(values) == 1 and None not in values:
+                    query[name] = values.pop()
+            try:
+                for resource in resource_type.list(
+                    session, skip_cache=True, **query
+                ):
+                    if resource.id in indexes:
+                        listed[resource.id] = resource
+                        if len(listed) == len(indexes):
+                            break
+            except exceptions.SDKException as e:
+                LOG.debug(
+                    "Listing %s failed, fetching individually: %s",
+                    resource_type.__name__,
+                    e,
+                )
+
+        for resource_id, resource_indexes in indexes.items():
+            resource = listed.get(resource_id)
+            if resource is None:
+                resource = pending[resource_indexes[0]]
+                try:
+                    resource = resource.fetch(session, skip_cache=True)
+                except exceptions.NotFoundException:
+                    resource = None
+            for index in resource_indexes:
+                yield index, resource
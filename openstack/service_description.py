@@ -11,6 +11,8 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import collections.abc
+import importlib
 import typing as ty
 import warnings
 
@@ -43,9 +45,49 @@ class _ServiceDisabledProxyShim:
         )
 
 
+class _ProxyClasses(collections.abc.Mapping):
+    """Mapping of the supported versions to their proxy classes.
+
+    The proxy classes can be given as the dotted path of the class, in which
+    case the module defining it is only imported when the class is first
+    looked up. This keeps the proxy and resource modules of the services
+    which are never used from being imported with :mod:`openstack`.
+    """
+
+    _classes: ty.Dict[str, ty.Any]
+
+    def __init__(self, classes=None):
+        if isinstance(classes, _ProxyClasses):
+            classes = classes._classes
+        self._classes = dict(classes or {})
+
+    def __getitem__(self, version):
+        proxy_class = self._classes[version]
+        if isinstance(proxy_class, str):
+            module_name, _, class_name = proxy_class.rpartition('.')
+            proxy_class = getattr(
+                importlib.import_module(module_name), class_name
+            )
+            self._classes[version] = proxy_class
+        return proxy_class
+
+    def __iter__(self):
+        return iter(self._classes)
+
+    def __len__(self):
+        return len(self._classes)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self._classes!r})'
+
+
 class ServiceDescription:
-    #: Dictionary of supported versions and proxy classes for that version
-    supported_versions: ty.Dict[str, ty.Type[proxy_mod.Proxy]] = {}
+    #: Mapping of supported versions and proxy classes for that version. The
+    #: proxy classes can be given as dotted paths, such as
+    #: ``'openstack.compute.v2._proxy.Proxy'``, to import them on first use.
+    supported_versions: ty.Mapping[
+        str, ty.Union[str, ty.Type[proxy_mod.Proxy]]
+    ] = _ProxyClasses()
     #: main service_type to use to find this service in the catalog
     service_type: str
     #: list of aliases this service might be registered as
@@ -75,13 +117,17 @@ class ServiceDescription:
             be used to register the service in the catalog.
         """
         self.service_type = service_type or self.service_type
-        self.supported_versions = (
-            supported_versions or self.supported_versions or {}
+        self.supported_versions = _ProxyClasses(
+            supported_versions or self.supported_versions
         )
 
         self.aliases = aliases or self.aliases
         self.all_types = [service_type] + self.aliases
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.supported_versions = _ProxyClasses(cls.supported_versions)
+
     def __get__(self, instance, owner):
         if instance is None:
             return self
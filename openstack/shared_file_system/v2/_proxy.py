@@ -365,6 +365,7 @@ class Proxy(proxy.Proxy):
         interval=2,
         wait=120,
         status_attr_name='status',
+        backoff=None,
     ):
         """Wait for a resource to be in a particular status.
         :param res: The resource to wait on to reach the specified status.
@@ -379,6 +380,9 @@ class Proxy(proxy.Proxy):
             Default to 120.
         :param status_attr_name: name of the attribute to reach the desired
             status.
+        :param backoff: The polling strategy, see
+            :func:`~openstack.utils.get_backoff`. Defaults to the
+            ``polling_strategy`` of the cloud config.
         :returns: The resource is returned on success.
         :raises: :class:`~openstack.exceptions.ResourceTimeout` if transition
             to the desired status failed to occur in specified seconds.
@@ -396,6 +400,7 @@ class Proxy(proxy.Proxy):
             interval,
             wait,
             attribute=status_attr_name,
+            backoff=backoff,
         )
 
     def storage_pools(self, details=True, **query):
@@ -619,7 +624,7 @@ class Proxy(proxy.Proxy):
             ignore_missing=ignore_missing,
         )
 
-    def wait_for_delete(self, res, interval=2, wait=120):
+    def wait_for_delete(self, res, interval=2, wait=120, backoff=None):
         """Wait for a resource to be deleted.
 
         :param res: The resource to wait on to be deleted.
@@ -628,11 +633,16 @@ class Proxy(proxy.Proxy):
             checks. Default to 2.
         :param wait: Maximum number of seconds to wait before the change.
             Default to 120.
+        :param backoff: The polling strategy, see
+            :func:`~openstack.utils.get_backoff`. Defaults to the
+            ``polling_strategy`` of the cloud config.
         :returns: The resource is returned on success.
         :raises: :class:`~openstack.exceptions.ResourceTimeout` if transition
             to delete failed to occur in the specified seconds.
         """
-        return resource.wait_for_delete(self, res, interval, wait)
+        return resource.wait_for_delete(
+            self, res, interval, wait, backoff=backoff
+        )
 
     def share_snapshot_instances(self, details=True, **query):
         """Lists all share snapshot instances with details.
@@ -125,7 +125,28 @@ class TestVolume(TestVolumeProxy):
             self.proxy.wait_for_status,
             method_args=[value],
             expected_args=[self.proxy, value, 'available', ['error'], 2, 120],
-            expected_kwargs={'callback': None},
+            expected_kwargs={'callback': None, 'backoff': None},
+        )
+
+    def test_volume_wait_for_many(self):
+        value = volume.Volume(id='1234')
+        self.verify_wait_for_status(
+            self.proxy.wait_for_many,
+            mock_method="openstack.resource.wait_for_many",
+            method_args=[[value, '5678']],
+            expected_args=[
+                self.proxy,
+                [value, self.proxy._get_resource(volume.Volume, '5678')],
+                'available',
+                ['error'],
+                2,
+                120,
+            ],
+            expected_kwargs={
+                'callback': None,
+                'list_base_path': mock.ANY,
+                'backoff': None,
+            },
         )
 
 
@@ -15,7 +15,9 @@ from uuid import uuid4
 
 import testtools
 
+from openstack.block_storage.v3 import volume
 from openstack.cloud import _utils
+from openstack.compute.v2 import server
 from openstack import exceptions
 from openstack.tests.unit import base
 
@@ -164,6 +166,142 @@ class TestUtils(base.TestCase):
         )
         self.assertEqual([el2, el3], ret)
 
+    def test__filter_list_index(self):
+        data = [dict(id=i, name='server%d' % i) for i in range(100)]
+        index = _utils._get_identifier_index(data)
+        with mock.patch.object(
+            _utils, '_match_identifier', wraps=_utils._match_identifier
+        ) as match:
+            self.assertEqual(
+                [data[42]], _utils._filter_list(data, 42, None, index=index)
+            )
+            self.assertEqual(
+                [data[7]],
+                _utils._filter_list(data, 'server7', None, index=index),
+            )
+        # The elements are looked up in the index rather than compared
+        match.assert_not_called()
+
+    def test__filter_list_modified(self):
+        el1 = dict(id=100, name='donald')
+        el2 = dict(id=200, name='pluto')
+        data = [el1, el2]
+        self.assertEqual([el2], _utils._filter_list(data, 'pluto', None))
+        el3 = dict(id=300, name='pluto')
+        data.append(el3)
+        self.assertEqual([el2, el3], _utils._filter_list(data, 'pluto', None))
+        data[1] = dict(id=400, name='goofy')
+        self.assertEqual([el3], _utils._filter_list(data, 'pluto', None))
+        data.reverse()
+        self.assertEqual([el3], _utils._filter_list(data, 'pluto', None))
+
+    def test__filter_list_dict_invalid(self):
+        data = [dict(id=100, name='donald', other=dict(category='duck'))]
+        self.assertRaises(
+            AttributeError,
+            _utils._filter_list,
+            data,
+            None,
+            {'other': {'missing': 'duck'}},
+        )
+
+    def test__search_resources_name(self):
+        el1 = dict(id='1', name='vol1', status='available', other={'a': 1})
+        el2 = dict(id='2', name='vol1', status='available', other={'a': 2})
+        list_function = mock.Mock(return_value=[el1, el2])
+        ret = _utils._search_resources(
+            list_function,
+            volume.Volume,
+            'vol1',
+            {'status': 'available', 'other': {'a': 1}},
+        )
+        self.assertEqual([el1], ret)
+        # Only the filters the API supports are sent
+        list_function.assert_called_once_with(name='vol1', status='available')
+
+    def test__search_resources_id(self):
+        server_id = str(uuid4())
+        el1 = dict(id=server_id, name='mickey')
+        list_function = mock.Mock(return_value=[el1])
+        ret = _utils._search_resources(
+            list_function, server.Server, server_id, None, name_is_regex=True
+        )
+        self.assertEqual([el1], ret)
+        list_function.assert_called_once_with(id=server_id)
+
+    def test__search_resources_not_found(self):
+        el1 = dict(id='1', name='mickey')
+        list_function = mock.Mock(return_value=[])
+        ret = _utils._search_resources(
+            list_function, server.Server, 'pluto', None, name_is_regex=True
+        )
+        self.assertEqual([], ret)
+        self.assertEqual(
+            [mock.call(name='pluto'), mock.call(id='pluto')],
+            list_function.call_args_list,
+        )
+
+        # Without an ID query parameter, the whole list is searched
+        list_function = mock.Mock(side_effect=[[], [el1]])
+        ret = _utils._search_resources(list_function, volume.Volume, '1', None)
+        self.assertEqual([el1], ret)
+        self.assertEqual(
+            [mock.call(name='1'), mock.call()],
+            list_function.call_args_list,
+        )
+
+    def test__search_resources_uuid_no_id_filter(self):
+        volume_id = str(uuid4())
+        el1 = dict(id=volume_id, name='vol1')
+        list_function = mock.Mock(return_value=[el1])
+        ret = _utils._search_resources(
+            list_function, volume.Volume, volume_id, None
+        )
+        self.assertEqual([el1], ret)
+        # A UUID is not looked up as a name first
+        list_function.assert_called_once_with()
+
+    def test__search_resources_pattern(self):
+        el1 = dict(id='1', name='web1')
+        el2 = dict(id='2', name='db1')
+        list_function = mock.Mock(return_value=[el1, el2])
+        ret = _utils._search_resources(
+            list_function, server.Server, 'web*', None, name_is_regex=True
+        )
+        self.assertEqual([el1], ret)
+        list_function.assert_called_once_with(name='^web')
+
+        # The start of an ID, or a pattern which is not a prefix, is only
+        # matched client side
+        for name_or_id in ('abc*', '*web', 'w?b*'):
+            list_function.reset_mock()
+            _utils._search_resources(
+                list_function,
+                server.Server,
+                name_or_id,
+                None,
+                name_is_regex=True,
+            )
+            list_function.assert_called_once_with()
+
+        # The API without regular expressions matches the name exactly
+        list_function.reset_mock()
+        _utils._search_resources(list_function, volume.Volume, 'web*', None)
+        list_function.assert_called_once_with()
+
+    def test__search_resources_jmespath(self):
+        el1 = dict(id='1', name='web1', status='ACTIVE')
+        list_function = mock.Mock(return_value=[el1])
+        ret = _utils._search_resources(
+            list_function,
+            server.Server,
+            'web1',
+            "[?status=='ACTIVE']",
+            name_is_regex=True,
+        )
+        self.assertEqual([el1], ret)
+        list_function.assert_called_once_with(name='web1')
+
     def test_safe_dict_min_ints(self):
         """Test integer comparison"""
         data = [{'f1': 3}, {'f1': 2}, {'f1': 1}]
@@ -10,8 +10,10 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+from unittest import mock
 import uuid
 
+from openstack.cloud import meta
 from openstack import exceptions
 from openstack.tests import fakes
 from openstack.tests.unit import base
@@ -143,7 +145,6 @@ class TestNovaExtensions(base.TestCase):
 class TestServers(base.TestCase):
     def test_get_server(self):
         server1 = fakes.make_fake_server('123', 'mickey')
-        server2 = fakes.make_fake_server('345', 'mouse')
 
         self.register_uris(
             [
@@ -151,9 +152,12 @@ class TestServers(base.TestCase):
                 dict(
                     method='GET',
                     uri=self.get_mock_url(
-                        'compute', 'public', append=['servers', 'detail']
+                        'compute',
+                        'public',
+                        append=['servers', 'detail'],
+                        qs_elements=['name=mickey'],
                     ),
-                    json={'servers': [server1, server2]},
+                    json={'servers': [server1]},
                 ),
                 dict(
                     method='GET',
@@ -178,7 +182,20 @@ class TestServers(base.TestCase):
                 dict(
                     method='GET',
                     uri=self.get_mock_url(
-                        'compute', 'public', append=['servers', 'detail']
+                        'compute',
+                        'public',
+                        append=['servers', 'detail'],
+                        qs_elements=['name=doesNotExist'],
+                    ),
+                    json={'servers': []},
+                ),
+                dict(
+                    method='GET',
+                    uri=self.get_mock_url(
+                        'compute',
+                        'public',
+                        append=['servers', 'detail'],
+                        qs_elements=['uuid=doesNotExist'],
                     ),
                     json={'servers': []},
                 ),
@@ -190,6 +207,33 @@ class TestServers(base.TestCase):
 
         self.assert_calls()
 
+    def test_search_servers_pushdown(self):
+        server1 = fakes.make_fake_server('123', 'mickey')
+        server2 = fakes.make_fake_server('345', 'mickey2', status='ERROR')
+
+        self.register_uris(
+            [
+                self.get_nova_discovery_mock_dict(),
+                dict(
+                    method='GET',
+                    uri=self.get_mock_url(
+                        'compute',
+                        'public',
+                        append=['servers', 'detail'],
+                        qs_elements=['name=^mick', 'status=ACTIVE'],
+                    ),
+                    json={'servers': [server1, server2]},
+                ),
+            ]
+        )
+
+        r = self.cloud.search_servers(
+            'mick*', filters={'status': 'ACTIVE'}, bare=True
+        )
+        self.assertEqual(['123'], [server['id'] for server in r])
+
+        self.assert_calls()
+
     def test_list_servers(self):
         server_id = str(uuid.uuid4())
         server_name = self.getUniqueString('name')
@@ -221,6 +265,134 @@ class TestServers(base.TestCase):
 
         self.assert_calls()
 
+    def test_list_servers_detailed(self):
+        """This test verifies that the details of the servers are listed
+        once for the whole listing rather than queried for every server."""
+        image_id = str(uuid.uuid4())
+        fake_servers = [
+            fakes.make_fake_server(
+                'server%d' % i,
+                'name%d' % i,
+                addresses={
+                    'private': [
+                        {
+                            'OS-EXT-IPS-MAC:mac_addr': 'fa:16:3e:00:00:0%d'
+                            % i,
+                            'version': 4,
+                            'addr': '10.0.0.%d' % i,
+                            'OS-EXT-IPS:type': 'fixed',
+                        }
+                    ]
+                },
+                image={'id': image_id, 'links': []},
+                flavor={'id': fakes.FLAVOR_ID, 'links': []},
+            )
+            for i in range(3)
+        ]
+        fake_ports = [
+            {
+                'id': 'port%d' % i,
+                'device_id': 'server%d' % i,
+                'mac_address': 'fa:16:3e:00:00:0%d' % i,
+            }
+            for i in range(3)
+        ]
+        fake_fip = {
+            'id': 'fip0',
+            'port_id': 'port0',
+            'fixed_ip_address': '10.0.0.0',
+            'floating_ip_address': '172.24.4.10',
+            'floating_network_id': 'public',
+            'status': 'ACTIVE',
+        }
+        fake_volume = fakes.FakeVolume('volume0', 'in-use', 'volume')
+        fake_volume = dict(
+            meta.obj_to_munch(fake_volume),
+            attachments=[{'server_id': 'server1', 'device': '/dev/vdb'}],
+        )
+        self.register_uris(
+            [
+                self.get_nova_discovery_mock_dict(),
+                dict(
+                    method='GET',
+                    uri=self.get_mock_url(
+                        'compute', 'public', append=['servers', 'detail']
+                    ),
+                    json={'servers': fake_servers},
+                ),
+                dict(
+                    method='GET',
+                    uri=self.get_mock_url(
+                        'network', 'public', append=['v2.0', 'floatingips']
+                    ),
+                    json={'floatingips': [fake_fip]},
+                ),
+                dict(
+                    method='GET',
+                    uri=self.get_mock_url(
+                        'network', 'public', append=['v2.0', 'ports']
+                    ),
+                    json={'ports': fake_ports},
+                ),
+                dict(
+                    method='GET',
+                    uri=self.get_mock_url(
+                        'network', 'public', append=['v2.0', 'networks']
+                    ),
+                    json={'networks': []},
+                ),
+                dict(
+                    method='GET',
+                    uri='{endpoint}/flavors/detail?is_public=None'.format(
+                        endpoint=fakes.COMPUTE_ENDPOINT
+                    ),
+                    json={'flavors': fakes.FAKE_FLAVOR_LIST},
+                ),
+                self.get_glance_discovery_mock_dict(),
+                dict(
+                    method='GET',
+                    uri=self.get_mock_url(
+                        'image', append=['images'], base_url_append='v2'
+                    ),
+                    json={
+                        'images': [
+                            fakes.make_fake_image(
+                                image_id, image_name='cirros'
+                            )
+                        ]
+                    },
+                ),
+                self.get_cinder_discovery_mock_dict(),
+                dict(
+                    method='GET',
+                    uri=self.get_mock_url(
+                        'volumev3', 'public', append=['volumes', 'detail']
+                    ),
+                    json={'volumes': [fake_volume]},
+                ),
+            ]
+        )
+
+        # The legacy volume service is disabled in the default catalog
+        with mock.patch.object(self.cloud, 'has_service', return_value=True):
+            r = self.cloud.list_servers(detailed=True)
+
+        self.assertEqual(['name0', 'name1', 'name2'], [s['name'] for s in r])
+        self.assertEqual('172.24.4.10', r[0]['public_v4'])
+        self.assertEqual(['', ''], [s['public_v4'] for s in r[1:]])
+        self.assertEqual(['vanilla'] * 3, [s['flavor']['name'] for s in r])
+        self.assertEqual(['cirros'] * 3, [s['image']['name'] for s in r])
+        self.assertEqual(
+            [[], 1, []],
+            [
+                s['volumes'] if not s['volumes'] else len(s['volumes'])
+                for s in r
+            ],
+        )
+        self.assertEqual('/dev/vdb', r[1]['volumes'][0]['device'])
+
+        self.assert_calls()
+
     def test_list_server_private_ip(self):
         self.has_neutron = True
         fake_server = {
@@ -400,7 +572,12 @@ class TestServers(base.TestCase):
                 dict(
                     method='GET',
                     uri=self.get_mock_url(
-                        'compute', 'public', append=['servers', 'detail']
+                        'compute',
+                        'public',
+                        append=['servers', 'detail'],
+                        qs_elements=[
+                            'uuid=97fe35e9-756a-41a2-960a-1d057d2c9ee4'
+                        ],
                     ),
                     json={'servers': [fake_server]},
                 ),
@@ -181,14 +181,20 @@ class TestCreateServer(base.TestCase):
                 dict(
                     method='GET',
                     uri=self.get_mock_url(
-                        'compute', 'public', append=['servers', 'detail']
+                        'compute',
+                        'public',
+                        append=['servers', 'detail'],
+                        qs_elements=['name=1234'],
                     ),
                     json={'servers': [build_server]},
                 ),
                 dict(
                     method='GET',
                     uri=self.get_mock_url(
-                        'compute', 'public', append=['servers', 'detail']
+                        'compute',
+                        'public',
+                        append=['servers', 'detail'],
+                        qs_elements=['name=1234'],
                     ),
                     json={'servers': [error_server]},
                 ),
@@ -243,7 +249,10 @@ class TestCreateServer(base.TestCase):
                 dict(
                     method='GET',
                     uri=self.get_mock_url(
-                        'compute', 'public', append=['servers', 'detail']
+                        'compute',
+                        'public',
+                        append=['servers', 'detail'],
+                        qs_elements=['name=1234'],
                     ),
                     json={'servers': [fake_server]},
                 ),
@@ -775,14 +784,20 @@ class TestCreateServer(base.TestCase):
                 dict(
                     method='GET',
                     uri=self.get_mock_url(
-                        'compute', 'public', append=['servers', 'detail']
+                        'compute',
+                        'public',
+                        append=['servers', 'detail'],
+                        qs_elements=['name=1234'],
                     ),
                     json={'servers': [build_server]},
                 ),
                 dict(
                     method='GET',
                     uri=self.get_mock_url(
-                        'compute', 'public', append=['servers', 'detail']
+                        'compute',
+                        'public',
+                        append=['servers', 'detail'],
+                        qs_elements=['name=1234'],
                     ),
                     json={'servers': [fake_server]},
                 ),
@@ -43,7 +43,10 @@ class TestDeleteVolumeSnapshot(base.TestCase):
                 dict(
                     method='GET',
                     uri=self.get_mock_url(
-                        'volumev3', 'public', append=['snapshots', 'detail']
+                        'volumev3',
+                        'public',
+                        append=['snapshots', 'detail'],
+                        qs_elements=['name=1234'],
                     ),
                     json={'snapshots': [fake_snapshot_dict]},
                 ),
@@ -77,7 +80,10 @@ class TestDeleteVolumeSnapshot(base.TestCase):
                 dict(
                     method='GET',
                     uri=self.get_mock_url(
-                        'volumev3', 'public', append=['snapshots', 'detail']
+                        'volumev3',
+                        'public',
+                        append=['snapshots', 'detail'],
+                        qs_elements=['name=1234'],
                     ),
                     json={'snapshots': [fake_snapshot_dict]},
                 ),
@@ -115,7 +121,10 @@ class TestDeleteVolumeSnapshot(base.TestCase):
                 dict(
                     method='GET',
                     uri=self.get_mock_url(
-                        'volumev3', 'public', append=['snapshots', 'detail']
+                        'volumev3',
+                        'public',
+                        append=['snapshots', 'detail'],
+                        qs_elements=['name=1234'],
                     ),
                     json={'snapshots': [fake_snapshot_dict]},
                 ),
@@ -21,7 +21,7 @@ class TestDomainParams(base.TestCase):
             [
                 dict(
                     method='GET',
-                    uri='https://identity.example.com/v3/projects',
+                    uri='https://identity.example.com/v3/projects?name=projectName-2',
                     json=dict(
                         projects=[project_data.json_response['project']]
                     ),
@@ -10,10 +10,16 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import threading
+import time
 from unittest import mock
 
+import fixtures
+
+from openstack.cloud import _utils
 from openstack.cloud import inventory
 import openstack.config
+from openstack import exceptions
 from openstack.tests import fakes
 from openstack.tests.unit import base
 
@@ -145,3 +151,234 @@ class TestInventory(base.TestCase):
 
         ret = inv.get_host('server_id')
         self.assertEqual(server, ret)
+
+    @mock.patch("openstack.config.loader.OpenStackConfig")
+    @mock.patch("openstack.connection.Connection")
+    def test_get_host_indexed(self, mock_cloud, mock_config):
+        mock_config.return_value.get_all.return_value = [{}]
+
+        inv = inventory.OpenStackInventory()
+
+        hosts = [
+            dict(id='server_id%d' % i, name='server_name%d' % i)
+            for i in range(100)
+        ]
+        inv.clouds[0].list_servers.return_value = hosts
+        with mock.patch.object(
+            _utils,
+            '_get_identifier_index',
+            wraps=_utils._get_identifier_index,
+        ) as get_index, mock.patch.object(
+            _utils, '_match_identifier'
+        ) as match:
+            self.assertIs(hosts[42], inv.get_host('server_name42'))
+            self.assertIs(hosts[7], inv.get_host('server_id7'))
+
+            # The hosts are listed and indexed once
+            inv.clouds[0].list_servers.assert_called_once_with(
+                detailed=True, all_projects=False
+            )
+            self.assertEqual(1, get_index.call_count)
+            match.assert_not_called()
+
+            # Listing the hosts again replaces them and their index
+            hosts[7] = dict(id='server_id7', name='renamed')
+            inv.list_hosts()
+            self.assertEqual(hosts[7], inv.get_host('renamed'))
+            self.assertEqual(2, inv.clouds[0].list_servers.call_count)
+            self.assertEqual(2, get_index.call_count)
+
+    @mock.patch("openstack.config.loader.OpenStackConfig")
+    @mock.patch("openstack.connection.Connection")
+    def test_list_hosts_clouds_order(self, mock_cloud, mock_config):
+        mock_config.return_value.get_all.return_value = [{}, {}]
+        mock_cloud.side_effect = lambda config: mock.Mock()
+
+        inv = inventory.OpenStackInventory()
+
+        # The first cloud only answers once the second one has
+        second_listed = threading.Event()
+
+        def list_first(**kwargs):
+            self.assertTrue(second_listed.wait(5))
+            return [dict(id='server1')]
+
+        def list_second(**kwargs):
+            second_listed.set()
+            return [dict(id='server2')]
+
+        inv.clouds[0].list_servers.side_effect = list_first
+        inv.clouds[1].list_servers.side_effect = list_second
+
+        ret = inv.list_hosts()
+
+        self.assertEqual(['server1', 'server2'], [host['id'] for host in ret])
+
+    @mock.patch("openstack.config.loader.OpenStackConfig")
+    @mock.patch("openstack.connection.Connection")
+    def test_list_hosts_cloud_failure(self, mock_cloud, mock_config):
+        mock_config.return_value.get_all.return_value = [{}, {}]
+        mock_cloud.side_effect = lambda config: mock.Mock()
+
+        inv = inventory.OpenStackInventory()
+
+        inv.clouds[0].list_servers.side_effect = exceptions.SDKException()
+        inv.clouds[1].list_servers.return_value = [dict(id='server2')]
+
+        self.assertRaises(exceptions.SDKException, inv.list_hosts)
+        ret = inv.list_hosts(fail_on_cloud_config=False)
+        self.assertEqual([dict(id='server2')], ret)
+
+    @mock.patch("openstack.config.loader.OpenStackConfig")
+    @mock.patch("openstack.connection.Connection")
+    def test_list_hosts_timeout(self, mock_cloud, mock_config):
+        mock_config.return_value.get_all.return_value = [{}, {}]
+        mock_cloud.side_effect = lambda config: mock.Mock()
+
+        inv = inventory.OpenStackInventory()
+
+        released = threading.Event()
+        self.addCleanup(released.set)
+        daemon = []
+
+        def list_hung(**kwargs):
+            # Listings which time out do not keep the interpreter from
+            # exiting
+            daemon.append(threading.current_thread().daemon)
+            released.wait(5)
+            return []
+
+        inv.clouds[0].list_servers.side_effect = list_hung
+        inv.clouds[1].list_servers.return_value = [dict(id='server2')]
+
+        self.assertRaises(
+            exceptions.ResourceTimeout, inv.list_hosts, timeout=0.05
+        )
+        ret = inv.list_hosts(fail_on_cloud_config=False, timeout=0.05)
+        self.assertEqual([dict(id='server2')], ret)
+        self.assertEqual([True, True], daemon)
+
+    @mock.patch("openstack.config.loader.OpenStackConfig")
+    @mock.patch("openstack.connection.Connection")
+    def test_list_hosts_incremental(self, mock_cloud, mock_config):
+        mock_config.return_value.get_all.return_value = [{}]
+        cloud = mock_cloud.return_value
+        cloud.name = 'test'
+        cloud.current_project_id = 'project'
+        cloud.config.get_region_name.return_value = 'RegionOne'
+        cloud.config.get_cache_path.return_value = self.useFixture(
+            fixtures.TempDir()
+        ).path
+
+        def host(id, updated_at, status='ACTIVE', name=None):
+            return dict(
+                id=id, name=name or id, status=status, updated_at=updated_at
+            )
+
+        inv = inventory.OpenStackInventory(incremental=True)
+
+        cloud.list_servers.return_value = [
+            host('server1', '2024-01-01T00:00:01Z'),
+            host('server2', '2024-01-01T00:00:02Z'),
+        ]
+        ret = inv.list_hosts()
+        cloud.list_servers.assert_called_once_with(
+            detailed=True, all_projects=False
+        )
+        self.assertEqual(['server1', 'server2'], [h['id'] for h in ret])
+
+        # Only the changes are listed, including the deleted servers
+        cloud.list_servers.reset_mock()
+        cloud.list_servers.return_value = [
+            host('server1', '2024-01-01T00:00:03Z', name='renamed'),
+            host('server2', '2024-01-01T00:00:04Z', status='DELETED'),
+            host('server3', '2024-01-01T00:00:04Z'),
+        ]
+        ret = inv.list_hosts()
+        cloud.list_servers.assert_called_once_with(
+            detailed=True,
+            all_projects=False,
+            filters={'changes_since': '2024-01-01T00:00:02Z'},
+        )
+        self.assertEqual(['server1', 'server3'], [h['id'] for h in ret])
+        self.assertEqual('renamed', ret[0]['name'])
+
+        cloud.list_servers.reset_mock()
+        cloud.list_servers.return_value = []
+        ret = inv.list_hosts()
+        cloud.list_servers.assert_called_once_with(
+            detailed=True,
+            all_projects=False,
+            filters={'changes_since': '2024-01-01T00:00:04Z'},
+        )
+        self.assertEqual(['server1', 'server3'], [h['id'] for h in ret])
+
+        # A refresh rebuilds the snapshot from a full listing
+        cloud.list_servers.reset_mock()
+        cloud.list_servers.return_value = [
+            host('server3', '2024-01-01T00:00:04Z'),
+        ]
+        inv = inventory.OpenStackInventory(incremental=True, refresh=True)
+        ret = inv.list_hosts()
+        cloud.list_servers.assert_called_once_with(
+            detailed=True, all_projects=False
+        )
+        self.assertEqual(['server3'], [h['id'] for h in ret])
+
+        # The snapshot of the non-expanded hosts is a separate one
+        cloud.list_servers.reset_mock()
+        inv.list_hosts(expand=False)
+        cloud.list_servers.assert_called_once_with(
+            detailed=False, all_projects=False
+        )
+
+        # Another project or private addresses get their own snapshot
+        cloud.list_servers.reset_mock()
+        cloud.current_project_id = 'other'
+        inv.list_hosts()
+        cloud.list_servers.assert_called_once_with(
+            detailed=True, all_projects=False
+        )
+        cloud.list_servers.reset_mock()
+        cloud.current_project_id = 'project'
+        inv = inventory.OpenStackInventory(incremental=True, private=True)
+        inv.list_hosts()
+        cloud.list_servers.assert_called_once_with(
+            detailed=True, all_projects=False
+        )
+
+    @mock.patch("openstack.config.loader.OpenStackConfig")
+    @mock.patch("openstack.connection.Connection")
+    def test_list_hosts_incremental_max_age(self, mock_cloud, mock_config):
+        mock_config.return_value.get_all.return_value = [{}]
+        cloud = mock_cloud.return_value
+        cloud.name = 'test'
+        cloud.current_project_id = 'project'
+        cloud.config.get_region_name.return_value = 'RegionOne'
+        cloud.config.get_cache_path.return_value = self.useFixture(
+            fixtures.TempDir()
+        ).path
+        cloud.list_servers.return_value = [
+            dict(id='server1', status='ACTIVE', updated_at='2024-01-01T00:00Z')
+        ]
+        inv = inventory.OpenStackInventory(
+            incremental=True, snapshot_max_age=60
+        )
+
+        with mock.patch.object(time, 'time', return_value=1000):
+            inv.list_hosts()
+        with mock.patch.object(time, 'time', return_value=1060):
+            inv.list_hosts()
+        cloud.list_servers.assert_called_with(
+            detailed=True,
+            all_projects=False,
+            filters={'changes_since': '2024-01-01T00:00Z'},
+        )
+
+        # The snapshot is rebuilt once too old, even if it was updated
+        cloud.list_servers.reset_mock()
+        with mock.patch.object(time, 'time', return_value=1061):
+            inv.list_hosts()
+        cloud.list_servers.assert_called_once_with(
+            detailed=True, all_projects=False
+        )
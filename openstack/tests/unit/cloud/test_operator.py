@@ -132,6 +132,28 @@ class TestOperatorCloud(base.TestCase):
         get_session_mock.return_value = session_mock
         self.assertTrue(self.cloud.has_service("image"))
 
+    @mock.patch.object(cloud_region.CloudRegion, 'get_session')
+    def test_has_service_circuit_open(self, get_session_mock):
+        session_mock = mock.Mock()
+        session_mock.get_endpoint.return_value = 'http://fake.url/v2'
+        get_session_mock.return_value = session_mock
+        self.cloud.config.config['circuit_breaker_failures'] = 1
+        breaker = self.cloud.config.get_circuit_breaker(
+            'image', 'http://fake.url/v2/images'
+        )
+        breaker.record(failed=True)
+        self.assertFalse(self.cloud.has_service("image"))
+        self.assertEqual(
+            {
+                ('RegionOne', 'image', 'http://fake.url'): dict(
+                    state='open', failures=1, retry_after=mock.ANY
+                )
+            },
+            self.cloud.get_circuit_breakers(),
+        )
+        breaker.record(failed=False)
+        self.assertTrue(self.cloud.has_service("image"))
+
     def test_list_hypervisors(self):
         '''This test verifies that calling list_hypervisors results in a call
         to nova client.'''
@@ -233,12 +233,14 @@ class TestProject(base.TestCase):
         )
         self.register_uris(
             [
+                # The ID is looked up in the whole list
                 dict(
                     method='GET',
                     uri=self.get_mock_url(),
+                    complete_qs=True,
                     status_code=200,
                     json={'projects': [project_data.json_response['project']]},
-                )
+                ),
             ]
         )
         projects = self.cloud.search_projects(project_data.project_id)
@@ -117,7 +117,10 @@ class TestSecurityGroups(base.TestCase):
                 dict(
                     method='GET',
                     uri=self.get_mock_url(
-                        'network', 'public', append=['v2.0', 'security-groups']
+                        'network',
+                        'public',
+                        append=['v2.0', 'security-groups'],
+                        qs_elements=['name=1'],
                     ),
                     json={'security_groups': [neutron_grp_dict]},
                 ),
@@ -144,7 +147,7 @@ class TestSecurityGroups(base.TestCase):
             [
                 dict(
                     method='GET',
-                    uri='{endpoint}/os-security-groups'.format(
+                    uri='{endpoint}/os-security-groups?name=2'.format(
                         endpoint=fakes.COMPUTE_ENDPOINT
                     ),
                     json={'security_groups': nova_return},
@@ -167,10 +170,23 @@ class TestSecurityGroups(base.TestCase):
                 dict(
                     method='GET',
                     uri=self.get_mock_url(
-                        'network', 'public', append=['v2.0', 'security-groups']
+                        'network',
+                        'public',
+                        append=['v2.0', 'security-groups'],
+                        qs_elements=['name=10'],
                     ),
                     json={'security_groups': [neutron_grp_dict]},
-                )
+                ),
+                dict(
+                    method='GET',
+                    uri=self.get_mock_url(
+                        'network',
+                        'public',
+                        append=['v2.0', 'security-groups'],
+                        qs_elements=['id=10'],
+                    ),
+                    json={'security_groups': []},
+                ),
             ]
         )
         self.assertFalse(self.cloud.delete_security_group('10'))
@@ -376,7 +392,10 @@ class TestSecurityGroups(base.TestCase):
                 dict(
                     method='GET',
                     uri=self.get_mock_url(
-                        'network', 'public', append=['v2.0', 'security-groups']
+                        'network',
+                        'public',
+                        append=['v2.0', 'security-groups'],
+                        qs_elements=['name=1'],
                     ),
                     json={'security_groups': [neutron_grp_dict]},
                 ),
@@ -418,7 +437,7 @@ class TestSecurityGroups(base.TestCase):
             [
                 dict(
                     method='GET',
-                    uri='{endpoint}/os-security-groups'.format(
+                    uri='{endpoint}/os-security-groups?name=2'.format(
                         endpoint=fakes.COMPUTE_ENDPOINT
                     ),
                     json={'security_groups': nova_return},
@@ -474,7 +493,10 @@ class TestSecurityGroups(base.TestCase):
                 dict(
                     method='GET',
                     uri=self.get_mock_url(
-                        'network', 'public', append=['v2.0', 'security-groups']
+                        'network',
+                        'public',
+                        append=['v2.0', 'security-groups'],
+                        qs_elements=['name=1'],
                     ),
                     json={'security_groups': [neutron_grp_dict]},
                 ),
@@ -538,7 +560,10 @@ class TestSecurityGroups(base.TestCase):
                 dict(
                     method='GET',
                     uri=self.get_mock_url(
-                        'network', 'public', append=['v2.0', 'security-groups']
+                        'network',
+                        'public',
+                        append=['v2.0', 'security-groups'],
+                        qs_elements=['name=1'],
                     ),
                     json={'security_groups': [neutron_grp_dict]},
                 ),
@@ -586,7 +611,7 @@ class TestSecurityGroups(base.TestCase):
             [
                 dict(
                     method='GET',
-                    uri='{endpoint}/os-security-groups'.format(
+                    uri='{endpoint}/os-security-groups?name=2'.format(
                         endpoint=fakes.COMPUTE_ENDPOINT
                     ),
                     json={'security_groups': nova_return},
@@ -642,7 +667,7 @@ class TestSecurityGroups(base.TestCase):
             [
                 dict(
                     method='GET',
-                    uri='{endpoint}/os-security-groups'.format(
+                    uri='{endpoint}/os-security-groups?name=2'.format(
                         endpoint=fakes.COMPUTE_ENDPOINT
                     ),
                     json={'security_groups': nova_return},
@@ -744,10 +769,23 @@ class TestSecurityGroups(base.TestCase):
                 dict(
                     method='GET',
                     uri=self.get_mock_url(
-                        'network', 'public', append=['v2.0', 'security-groups']
+                        'network',
+                        'public',
+                        append=['v2.0', 'security-groups'],
+                        qs_elements=['name=doesNotExist'],
                     ),
                     json={'security_groups': [neutron_grp_dict]},
-                )
+                ),
+                dict(
+                    method='GET',
+                    uri=self.get_mock_url(
+                        'network',
+                        'public',
+                        append=['v2.0', 'security-groups'],
+                        qs_elements=['id=doesNotExist'],
+                    ),
+                    json={'security_groups': []},
+                ),
             ]
         )
         self.assertFalse(self.cloud.delete_security_group(rule_id))
@@ -760,11 +798,18 @@ class TestSecurityGroups(base.TestCase):
             [
                 dict(
                     method='GET',
-                    uri='{endpoint}/os-security-groups'.format(
+                    uri='{endpoint}/os-security-groups?name=doesNotExist'.format(
                         endpoint=fakes.COMPUTE_ENDPOINT
                     ),
                     json={'security_groups': [nova_grp_dict]},
                 ),
+                dict(
+                    method='GET',
+                    uri='{endpoint}/os-security-groups?id=doesNotExist'.format(
+                        endpoint=fakes.COMPUTE_ENDPOINT
+                    ),
+                    json={'security_groups': []},
+                ),
             ]
         )
         r = self.cloud.delete_security_group('doesNotExist')
@@ -779,7 +824,7 @@ class TestSecurityGroups(base.TestCase):
             [
                 dict(
                     method='GET',
-                    uri='{endpoint}/os-security-groups'.format(
+                    uri='{endpoint}/os-security-groups?name=nova-sec-group'.format(
                         endpoint=fakes.COMPUTE_ENDPOINT
                     ),
                     json={'security_groups': [nova_grp_dict]},
@@ -842,7 +887,7 @@ class TestSecurityGroups(base.TestCase):
             [
                 dict(
                     method='GET',
-                    uri='{endpoint}/os-security-groups'.format(
+                    uri='{endpoint}/os-security-groups?name=nova-sec-group'.format(
                         endpoint=fakes.COMPUTE_ENDPOINT,
                     ),
                     json={'security_groups': [nova_grp_dict]},
@@ -881,14 +926,20 @@ class TestSecurityGroups(base.TestCase):
                 dict(
                     method='GET',
                     uri=self.get_mock_url(
-                        'compute', 'public', append=['servers', 'detail']
+                        'compute',
+                        'public',
+                        append=['servers', 'detail'],
+                        qs_elements=['name=server-name'],
                     ),
                     json={'servers': [fake_server]},
                 ),
                 dict(
                     method='GET',
                     uri=self.get_mock_url(
-                        'network', 'public', append=['v2.0', 'security-groups']
+                        'network',
+                        'public',
+                        append=['v2.0', 'security-groups'],
+                        qs_elements=['name=neutron-sec-group'],
                     ),
                     json={'security_groups': [neutron_grp_dict]},
                 ),
@@ -921,7 +972,7 @@ class TestSecurityGroups(base.TestCase):
             [
                 dict(
                     method='GET',
-                    uri='{endpoint}/os-security-groups'.format(
+                    uri='{endpoint}/os-security-groups?name=nova-sec-group'.format(
                         endpoint=fakes.COMPUTE_ENDPOINT
                     ),
                     json={'security_groups': [nova_grp_dict]},
@@ -961,14 +1012,20 @@ class TestSecurityGroups(base.TestCase):
                 dict(
                     method='GET',
                     uri=self.get_mock_url(
-                        'compute', 'public', append=['servers', 'detail']
+                        'compute',
+                        'public',
+                        append=['servers', 'detail'],
+                        qs_elements=['name=server-name'],
                     ),
                     json={'servers': [fake_server]},
                 ),
                 dict(
                     method='GET',
                     uri=self.get_mock_url(
-                        'network', 'public', append=['v2.0', 'security-groups']
+                        'network',
+                        'public',
+                        append=['v2.0', 'security-groups'],
+                        qs_elements=['name=neutron-sec-group'],
                     ),
                     json={'security_groups': [neutron_grp_dict]},
                 ),
@@ -1000,18 +1057,25 @@ class TestSecurityGroups(base.TestCase):
                 self.get_nova_discovery_mock_dict(),
                 dict(
                     method='GET',
-                    uri='{endpoint}/servers/detail'.format(
+                    uri='{endpoint}/servers/detail?name=server-name'.format(
                         endpoint=fakes.COMPUTE_ENDPOINT
                     ),
                     json={'servers': [fake_server]},
                 ),
                 dict(
                     method='GET',
-                    uri='{endpoint}/os-security-groups'.format(
+                    uri='{endpoint}/os-security-groups?name=unknown-sec-group'.format(
                         endpoint=fakes.COMPUTE_ENDPOINT
                     ),
                     json={'security_groups': [nova_grp_dict]},
                 ),
+                dict(
+                    method='GET',
+                    uri='{endpoint}/os-security-groups?id=unknown-sec-group'.format(
+                        endpoint=fakes.COMPUTE_ENDPOINT
+                    ),
+                    json={'security_groups': []},
+                ),
             ]
         )
 
@@ -1035,17 +1099,33 @@ class TestSecurityGroups(base.TestCase):
                 dict(
                     method='GET',
                     uri=self.get_mock_url(
-                        'compute', 'public', append=['servers', 'detail']
+                        'compute',
+                        'public',
+                        append=['servers', 'detail'],
+                        qs_elements=['name=server-name'],
                     ),
                     json={'servers': [fake_server]},
                 ),
                 dict(
                     method='GET',
                     uri=self.get_mock_url(
-                        'network', 'public', append=['v2.0', 'security-groups']
+                        'network',
+                        'public',
+                        append=['v2.0', 'security-groups'],
+                        qs_elements=['name=unknown-sec-group'],
                     ),
                     json={'security_groups': [neutron_grp_dict]},
                 ),
+                dict(
+                    method='GET',
+                    uri=self.get_mock_url(
+                        'network',
+                        'public',
+                        append=['v2.0', 'security-groups'],
+                        qs_elements=['id=unknown-sec-group'],
+                    ),
+                    json={'security_groups': []},
+                ),
             ]
         )
         self.assertFalse(
@@ -1064,11 +1144,18 @@ class TestSecurityGroups(base.TestCase):
                 self.get_nova_discovery_mock_dict(),
                 dict(
                     method='GET',
-                    uri='{endpoint}/servers/detail'.format(
+                    uri='{endpoint}/servers/detail?name=unknown-server-name'.format(
                         endpoint=fakes.COMPUTE_ENDPOINT
                     ),
                     json={'servers': [fake_server]},
                 ),
+                dict(
+                    method='GET',
+                    uri='{endpoint}/servers/detail?uuid=unknown-server-name'.format(
+                        endpoint=fakes.COMPUTE_ENDPOINT
+                    ),
+                    json={'servers': []},
+                ),
             ]
         )
 
@@ -53,8 +53,8 @@ class TestServerConsole(base.TestCase):
                 self.get_nova_discovery_mock_dict(),
                 dict(
                     method='GET',
-                    uri='{endpoint}/servers/detail'.format(
-                        endpoint=fakes.COMPUTE_ENDPOINT
+                    uri='{endpoint}/servers/detail?uuid={id}'.format(
+                        endpoint=fakes.COMPUTE_ENDPOINT, id=self.server_id
                     ),
                     json={"servers": [self.server]},
                 ),
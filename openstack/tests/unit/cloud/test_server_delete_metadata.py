@@ -43,7 +43,10 @@ class TestServerDeleteMetadata(base.TestCase):
                 dict(
                     method='GET',
                     uri=self.get_mock_url(
-                        'compute', 'public', append=['servers', 'detail']
+                        'compute',
+                        'public',
+                        append=['servers', 'detail'],
+                        qs_elements=['name=%s' % self.server_name],
                     ),
                     json={'servers': [self.fake_server]},
                 ),
@@ -80,7 +83,10 @@ class TestServerDeleteMetadata(base.TestCase):
                 dict(
                     method='GET',
                     uri=self.get_mock_url(
-                        'compute', 'public', append=['servers', 'detail']
+                        'compute',
+                        'public',
+                        append=['servers', 'detail'],
+                        qs_elements=['uuid=%s' % self.server_id],
                     ),
                     json={'servers': [self.fake_server]},
                 ),
@@ -40,7 +40,10 @@ class TestServerSetMetadata(base.TestCase):
                 dict(
                     method='GET',
                     uri=self.get_mock_url(
-                        'compute', 'public', append=['servers', 'detail']
+                        'compute',
+                        'public',
+                        append=['servers', 'detail'],
+                        qs_elements=['name=%s' % self.server_name],
                     ),
                     json={'servers': [self.fake_server]},
                 ),
@@ -75,7 +78,10 @@ class TestServerSetMetadata(base.TestCase):
                 dict(
                     method='GET',
                     uri=self.get_mock_url(
-                        'compute', 'public', append=['servers', 'detail']
+                        'compute',
+                        'public',
+                        append=['servers', 'detail'],
+                        qs_elements=['uuid=%s' % self.server_id],
                     ),
                     json={'servers': [self.fake_server]},
                 ),
@@ -369,7 +369,10 @@ class TestVolume(base.TestCase):
                 dict(
                     method='GET',
                     uri=self.get_mock_url(
-                        'volumev3', 'public', append=['volumes', 'detail']
+                        'volumev3',
+                        'public',
+                        append=['volumes', 'detail'],
+                        qs_elements=['name=volume001'],
                     ),
                     json={'volumes': [avail_volume]},
                 ),
@@ -418,7 +421,10 @@ class TestVolume(base.TestCase):
                 dict(
                     method='GET',
                     uri=self.get_mock_url(
-                        'volumev3', 'public', append=['volumes', 'detail']
+                        'volumev3',
+                        'public',
+                        append=['volumes', 'detail'],
+                        qs_elements=['name=volume001'],
                     ),
                     json={'volumes': [errored_volume]},
                 ),
@@ -563,7 +569,10 @@ class TestVolume(base.TestCase):
                 dict(
                     method='GET',
                     uri=self.get_mock_url(
-                        'volumev3', 'public', append=['volumes', 'detail']
+                        'volumev3',
+                        'public',
+                        append=['volumes', 'detail'],
+                        qs_elements=['name=volume001'],
                     ),
                     json={'volumes': [volume]},
                 ),
@@ -595,7 +604,10 @@ class TestVolume(base.TestCase):
                 dict(
                     method='GET',
                     uri=self.get_mock_url(
-                        'volumev3', 'public', append=['volumes', 'detail']
+                        'volumev3',
+                        'public',
+                        append=['volumes', 'detail'],
+                        qs_elements=['name=volume001'],
                     ),
                     json={'volumes': [volume]},
                 ),
@@ -34,7 +34,10 @@ class TestVolumeBackups(base.TestCase):
                 dict(
                     method='GET',
                     uri=self.get_mock_url(
-                        'volumev3', 'public', append=['backups', 'detail']
+                        'volumev3',
+                        'public',
+                        append=['backups', 'detail'],
+                        qs_elements=['name=Volume1'],
                     ),
                     json={"backups": [vol1, vol2, vol3]},
                 )
@@ -58,7 +61,10 @@ class TestVolumeBackups(base.TestCase):
                 dict(
                     method='GET',
                     uri=self.get_mock_url(
-                        'volumev3', 'public', append=['backups', 'detail']
+                        'volumev3',
+                        'public',
+                        append=['backups', 'detail'],
+                        qs_elements=['name=Volume1'],
                     ),
                     json={"backups": [vol1, vol2, vol3]},
                 )
@@ -106,6 +112,7 @@ class TestVolumeBackups(base.TestCase):
                     uri=self.get_mock_url(
                         'volumev3', 'public', append=['backups', 'detail']
                     ),
+                    complete_qs=True,
                     json={"backups": [backup]},
                 ),
                 dict(
@@ -143,6 +150,7 @@ class TestVolumeBackups(base.TestCase):
                     uri=self.get_mock_url(
                         'volumev3', 'public', append=['backups', 'detail']
                     ),
+                    complete_qs=True,
                     json={"backups": [backup]},
                 ),
                 dict(
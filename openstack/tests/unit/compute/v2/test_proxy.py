@@ -992,8 +992,30 @@ class TestCompute(TestComputeProxy):
         self.verify_wait_for_status(
             self.proxy.wait_for_server,
             method_args=[value],
+            method_kwargs={'backoff': 'jitter'},
             expected_args=[self.proxy, value, 'ACTIVE', ['ERROR'], 2, 120],
-            expected_kwargs={'callback': None},
+            expected_kwargs={'callback': None, 'backoff': 'jitter'},
+        )
+
+    def test_server_wait_for_many(self):
+        value = server.Server(id='1234')
+        self.verify_wait_for_status(
+            self.proxy.wait_for_many,
+            mock_method="openstack.resource.wait_for_many",
+            method_args=[[value, '5678']],
+            expected_args=[
+                self.proxy,
+                [value, self.proxy._get_resource(server.Server, '5678')],
+                'ACTIVE',
+                ['ERROR'],
+                2,
+                120,
+            ],
+            expected_kwargs={
+                'callback': None,
+                'list_base_path': {server.Server: '/servers/detail'},
+                'backoff': None,
+            },
         )
 
     def test_server_resize(self):
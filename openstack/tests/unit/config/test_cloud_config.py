@@ -183,6 +183,65 @@ class TestCloudRegion(base.TestCase):
         self.assertEqual(1, cc.get_connect_retries('compute'))
         self.assertEqual(3, cc.get_connect_retries('baremetal'))
 
+    def test_get_concurrency_limiter(self):
+        cc = cloud_region.CloudRegion(
+            "test1",
+            "region-al",
+            {
+                'adaptive_concurrency': {'compute': True, 'image': 4},
+                'concurrency': {'compute': 20},
+            },
+        )
+        self.assertIsNone(cc.get_concurrency_limiter('network'))
+        limiter = cc.get_concurrency_limiter('compute')
+        self.assertIs(limiter, cc.get_concurrency_limiter('compute'))
+        self.assertEqual(10, limiter.limit)
+        self.assertEqual(20, limiter.maximum)
+        image = cc.get_concurrency_limiter('image')
+        self.assertEqual(4, image.limit)
+        self.assertEqual(4, image.maximum)
+        self.assertEqual(
+            {'compute': limiter, 'image': image},
+            cc.get_concurrency_limiters(),
+        )
+
+    def test_get_circuit_breaker(self):
+        cc = cloud_region.CloudRegion(
+            "test1",
+            "region-al",
+            {
+                'circuit_breaker_failures': {'volume': 3},
+                'circuit_breaker_cooldown': 10,
+            },
+        )
+        self.assertIsNone(
+            cc.get_circuit_breaker('compute', 'https://compute.example.com')
+        )
+        breaker = cc.get_circuit_breaker(
+            'block-storage', 'https://volume.example.com/v3/project'
+        )
+        self.assertIs(
+            breaker,
+            cc.get_circuit_breaker(
+                'volume', 'https://volume.example.com/v3/project/volumes'
+            ),
+        )
+        self.assertEqual(3, breaker.failure_threshold)
+        self.assertEqual(10, breaker.reset_timeout)
+        self.assertEqual(
+            {
+                (
+                    'region-al',
+                    'block-storage',
+                    'https://volume.example.com',
+                ): breaker
+            },
+            cc.get_circuit_breakers(),
+        )
+        self.assertFalse(
+            cc.is_circuit_open('volume', 'https://volume.example.com/v3')
+        )
+
     def test_rackspace_workaround(self):
         # We're skipping loader here, so we have to expand relevant
         # parts from the rackspace profile. The thing we're testing
@@ -456,6 +456,23 @@ class TestImage(TestImageProxy):
     def test_image_delete__ignore(self):
         self.verify_delete(self.proxy.delete_image, _image.Image, True)
 
+    def test_image_wait_for_many(self):
+        value = _image.Image(id='1234')
+        self.verify_wait_for_status(
+            self.proxy.wait_for_many,
+            mock_method="openstack.resource.wait_for_many",
+            method_args=[[value, '5678']],
+            expected_args=[
+                self.proxy,
+                [value, self.proxy._get_resource(_image.Image, '5678')],
+                'active',
+                ['killed'],
+                2,
+                120,
+            ],
+            expected_kwargs={'callback': None, 'backoff': None},
+        )
+
     def test_delete_image__from_store(self):
         store = _service_info.Store(id='fast', is_default=True)
         store.delete_image = mock.Mock()
@@ -102,6 +102,20 @@ class TestLoadBalancerProxy(test_proxy_base.TestProxyBase):
     def test_load_balancer_update(self):
         self.verify_update(self.proxy.update_load_balancer, lb.LoadBalancer)
 
+    def test_load_balancer_wait_for_many(self):
+        value = lb.LoadBalancer(id=self.LB_ID)
+        self.verify_wait_for_status(
+            self.proxy.wait_for_many,
+            mock_method="openstack.resource.wait_for_many",
+            method_args=[[value]],
+            expected_args=[self.proxy, [value], 'ACTIVE', ['ERROR'], 2, 300],
+            expected_kwargs={
+                'attribute': 'provisioning_status',
+                'callback': None,
+                'backoff': None,
+            },
+        )
+
     def test_load_balancer_failover(self):
         self.verify_update(
             self.proxy.failover_load_balancer,
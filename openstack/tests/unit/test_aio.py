@@ -0,0 +1,320 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import asyncio
+from unittest import mock
+
+from openstack import aio
+from openstack.aio import _transport
+from openstack.aio import proxy as aio_proxy
+from openstack.compute.v2 import server
+from openstack import exceptions
+from openstack import resource
+from openstack.tests import fakes
+from openstack.tests.unit import base
+
+
+class TestConnection(base.TestCase):
+    def setUp(self):
+        super().setUp()
+        # Send the requests with requests, which are mocked
+        patcher = mock.patch.object(_transport, 'aiohttp', None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.conn = aio.Connection(connection=self.cloud)
+        self.addCleanup(self.conn._executor.shutdown)
+        self.use_compute_discovery()
+
+    def _server_url(self, *append, qs_elements=None):
+        return self.get_mock_url(
+            'compute',
+            'public',
+            append=['servers'] + list(append),
+            qs_elements=qs_elements,
+        )
+
+    def test_services(self):
+        self.assertIs(self.conn.compute, self.conn.compute)
+        self.assertIsInstance(self.conn.compute, aio_proxy.Proxy)
+        self.assertRaises(AttributeError, getattr, self.conn, 'nothing')
+
+    def test_list_paginated(self):
+        servers = [
+            fakes.make_fake_server(str(i), 'server%d' % i) for i in range(3)
+        ]
+        self.register_uris(
+            [
+                dict(
+                    method='GET',
+                    uri=self._server_url('detail'),
+                    json={
+                        'servers': servers[:2],
+                        'servers_links': [
+                            {
+                                'rel': 'next',
+                                'href': self._server_url(
+                                    'detail', qs_elements=['marker=1']
+                                ),
+                            }
+                        ],
+                    },
+                ),
+                dict(
+                    method='GET',
+                    uri=self._server_url('detail', qs_elements=['marker=1']),
+                    json={'servers': servers[2:]},
+                ),
+            ]
+        )
+
+        async def list_servers():
+            return [
+                value
+                async for value in self.conn.compute.list(
+                    'server', base_path='/servers/detail'
+                )
+            ]
+
+        result = asyncio.run(list_servers())
+        self.assertEqual(['0', '1', '2'], [value.id for value in result])
+        self.assertIsInstance(result[0], server.Server)
+        self.assert_calls()
+
+    def test_list_client_filter(self):
+        servers = [
+            fakes.make_fake_server(str(i), 'server%d' % i) for i in range(3)
+        ]
+        self.register_uris(
+            [
+                dict(
+                    method='GET',
+                    uri=self._server_url('detail'),
+                    json={'servers': servers},
+                ),
+            ]
+        )
+
+        async def list_servers():
+            return [
+                value
+                async for value in self.conn.compute.list(
+                    server.Server,
+                    base_path='/servers/detail',
+                    name=resource.In(['server1', 'server2']),
+                )
+            ]
+
+        result = asyncio.run(list_servers())
+        self.assertEqual(['1', '2'], [value.id for value in result])
+        self.assert_calls()
+
+    def test_get(self):
+        fake_server = fakes.make_fake_server('1234', 'daffy')
+        self.register_uris(
+            [
+                dict(
+                    method='GET',
+                    uri=self._server_url('1234'),
+                    json={'server': fake_server},
+                ),
+                dict(
+                    method='GET',
+                    uri=self._server_url('5678'),
+                    status_code=404,
+                ),
+            ]
+        )
+        result = asyncio.run(self.conn.compute.get('server', '1234'))
+        self.assertEqual('daffy', result.name)
+        self.assertRaises(
+            exceptions.ResourceNotFound,
+            asyncio.run,
+            self.conn.compute.get('server', '5678'),
+        )
+        self.assert_calls()
+
+    def test_create_update_delete(self):
+        fake_server = fakes.make_fake_server('1234', 'daffy', 'BUILD')
+        self.register_uris(
+            [
+                dict(
+                    method='POST',
+                    uri=self._server_url(),
+                    json={'server': fake_server},
+                    validate=dict(
+                        json={
+                            'server': {
+                                'name': 'daffy',
+                                'flavorRef': 'flavor',
+                                'imageRef': 'image',
+                            }
+                        }
+                    ),
+                ),
+                dict(
+                    method='PUT',
+                    uri=self._server_url('1234'),
+                    json={'server': dict(fake_server, name='duck')},
+                    validate=dict(json={'server': {'name': 'duck'}}),
+                ),
+                dict(
+                    method='DELETE',
+                    uri=self._server_url('1234'),
+                ),
+                dict(
+                    method='DELETE',
+                    uri=self._server_url('1234'),
+                    status_code=404,
+                ),
+            ]
+        )
+
+        async def lifecycle():
+            compute = self.conn.compute
+            created = await compute.create(
+                'server', name='daffy', flavor_id='flavor', image_id='image'
+            )
+            updated = await compute.update('server', created, name='duck')
+            deleted = await compute.delete('server', updated)
+            missing = await compute.delete('server', '1234')
+            return created, updated, deleted, missing
+
+        created, updated, deleted, missing = asyncio.run(lifecycle())
+        self.assertEqual('1234', created.id)
+        self.assertEqual('duck', updated.name)
+        self.assertIs(updated, deleted)
+        self.assertIsNone(missing)
+        self.assert_calls()
+
+    def test_wait_for_status(self):
+        self.register_uris(
+            [
+                dict(
+                    method='GET',
+                    uri=self._server_url('1234'),
+                    json={
+                        'server': fakes.make_fake_server(
+                            '1234', 'daffy', 'BUILD'
+                        )
+                    },
+                ),
+                dict(
+                    method='GET',
+                    uri=self._server_url('1234'),
+                    json={
+                        'server': fakes.make_fake_server(
+                            '1234', 'daffy', 'ACTIVE'
+                        )
+                    },
+                ),
+            ]
+        )
+        res = server.Server(id='1234', status='BUILD')
+        result = asyncio.run(
+            self.conn.compute.wait_for_status(
+                res, 'ACTIVE', interval=0.01, wait=5
+            )
+        )
+        self.assertEqual('ACTIVE', result.status)
+        self.assert_calls()
+
+    def test_wait_for_status_failure(self):
+        self.register_uris(
+            [
+                dict(
+                    method='GET',
+                    uri=self._server_url('1234'),
+                    json={
+                        'server': fakes.make_fake_server(
+                            '1234', 'daffy', 'ERROR'
+                        )
+                    },
+                ),
+            ]
+        )
+        res = server.Server(id='1234', status='BUILD')
+        self.assertRaises(
+            exceptions.ResourceFailure,
+            asyncio.run,
+            self.conn.compute.wait_for_status(
+                res, 'ACTIVE', interval=0.01, wait=5
+            ),
+        )
+
+    def test_reauthenticate(self):
+        fake_server = fakes.make_fake_server('1234', 'daffy')
+        self.register_uris(
+            [
+                dict(
+                    method='GET',
+                    uri=self._server_url('1234'),
+                    status_code=401,
+                ),
+                dict(
+                    method='GET',
+                    uri=self._server_url('1234'),
+                    json={'server': fake_server},
+                ),
+            ]
+        )
+        with mock.patch.object(
+            self.cloud.session, 'invalidate', return_value=True
+        ) as invalidate:
+            result = asyncio.run(self.conn.compute.get('server', '1234'))
+        invalidate.assert_called_once_with()
+        self.assertEqual('daffy', result.name)
+        self.assert_calls()
+
+    def test_close_keeps_given_connection(self):
+        async def use():
+            async with self.conn:
+                pass
+
+        with mock.patch.object(self.cloud, 'close') as close:
+            asyncio.run(use())
+        close.assert_not_called()
+
+    def test_close_owned_connection(self):
+        with mock.patch.object(
+            aio.connection._connection, 'Connection'
+        ) as connection_class:
+            conn = aio.Connection(cloud='example')
+            asyncio.run(conn.close())
+        connection_class.assert_called_once_with(cloud='example')
+        connection_class.return_value.close.assert_called_once_with()
+
+
+class TestIterateTimeout(base.TestCase):
+    def test_retry_after(self):
+        delays = []
+
+        async def sleep(delay):
+            delays.append(delay)
+
+        async def poll():
+            with mock.patch.object(asyncio, 'sleep', sleep):
+                async for count in aio_proxy.iterate_timeout(
+                    10, 'Timeout', wait=1, backoff='retry-after'
+                ):
+                    if count == 1:
+                        aio_proxy._retry_after.set(5)
+                    elif count == 3:
+                        return delays
+
+        self.assertEqual([5, 1], asyncio.run(poll()))
+
+    def test_timeout(self):
+        async def poll():
+            async for _ in aio_proxy.iterate_timeout(0.05, 'Timeout', 0.01):
+                pass
+
+        self.assertRaises(exceptions.ResourceTimeout, asyncio.run, poll())
@@ -11,6 +11,8 @@
 # under the License.
 
 import os
+import subprocess
+import sys
 from unittest import mock
 
 import fixtures
@@ -124,6 +126,26 @@ class TestConnection(_TestConnectionBase):
         conn = connection.Connection(cloud='sample-cloud', cert='cert')
         self.assertEqual(conn.session.cert, 'cert')
 
+    def test_find_cache_disabled(self):
+        conn = connection.Connection(cloud='sample-cloud')
+        self.assertIsNone(conn._find_cache)
+
+    def test_find_cache_parameters(self):
+        conn = connection.Connection(
+            cloud='sample-cloud', find_cache_ttl=60, find_cache_negative_ttl=0
+        )
+        self.assertEqual(60, conn._find_cache.ttl)
+        self.assertEqual(0, conn._find_cache.negative_ttl)
+
+    def test_find_cache_config(self):
+        cloud_region = openstack.config.OpenStackConfig().get_one(
+            "sample-cloud"
+        )
+        cloud_region._cache_expirations = {'find': 300, 'find.missing': 10}
+        conn = connection.Connection(config=cloud_region)
+        self.assertEqual(300, conn._find_cache.ttl)
+        self.assertEqual(10, conn._find_cache.negative_ttl)
+
     def test_session_provided(self):
         mock_session = mock.Mock(spec=session.Session)
         mock_session.auth = mock.Mock()
@@ -498,6 +520,100 @@ class TestNewService(base.TestCase):
         # ensure dns service responds as we expect from replacement
         self.assertFalse(conn.dns.dummy())
 
+    def test_add_service_lazy_proxy(self):
+        svc = self.os_fixture.v3_token.add_service('fake')
+        svc.add_endpoint(
+            interface='public',
+            region='RegionOne',
+            url=f'https://fake.example.com/v2/{fakes.PROJECT_ID}',
+        )
+        self.use_keystone_v3()
+        conn = self.cloud
+
+        self.register_uris(
+            [
+                dict(
+                    method='GET',
+                    uri='https://fake.example.com',
+                    status_code=404,
+                ),
+                dict(
+                    method='GET',
+                    uri='https://fake.example.com/v2/',
+                    status_code=404,
+                ),
+                dict(
+                    method='GET',
+                    uri=self.get_mock_url('fake'),
+                    status_code=404,
+                ),
+            ]
+        )
+
+        service = service_description.ServiceDescription(
+            'fake',
+            supported_versions={
+                '2': 'openstack.tests.unit.fake.v2._proxy.Proxy',
+            },
+        )
+        self.assertEqual(['2'], list(service.supported_versions))
+
+        conn.add_service(service)
+
+        self.assertEqual(
+            'openstack.tests.unit.fake.v2._proxy',
+            conn.fake.__class__.__module__,
+        )
+        self.assertFalse(conn.fake.dummy())
+
+
+class TestImportTime(base.TestCase):
+    # The number of modules rather than the time is checked, which does not
+    # depend on the speed of the node. Importing every service eagerly loads
+    # over 400 of them.
+    MAX_MODULES = 150
+
+    def _import(self, code):
+        return subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', code],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+
+    def test_import_connection(self):
+        result = self._import('import openstack.connection')
+        # Lines look like "import time:  self [us] | cumulative | module"
+        modules = [
+            line.rsplit('|', 1)[1].strip()
+            for line in result.stderr.splitlines()
+            if line.startswith('import time:') and '|' in line
+        ]
+        openstack_modules = [
+            name
+            for name in modules
+            if name == 'openstack' or name.startswith('openstack.')
+        ]
+        self.assertIn('openstack.connection', openstack_modules)
+        self.assertEqual(
+            [],
+            [
+                name
+                for name in openstack_modules
+                if name.rsplit('.', 1)[-1].startswith('_proxy')
+            ],
+        )
+        self.assertLess(len(openstack_modules), self.MAX_MODULES)
+
+    def test_proxy_imported_on_access(self):
+        result = self._import(
+            'import openstack.connection\n'
+            'from openstack.compute.v2 import _proxy\n'
+            'conn = openstack.connection.Connection\n'
+            "print(conn.compute.supported_versions['2'] is _proxy.Proxy)"
+        )
+        self.assertEqual('True', result.stdout.strip())
+
 
 def vendor_hook(conn):
     setattr(conn, 'test', 'test_val')
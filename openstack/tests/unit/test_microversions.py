@@ -75,7 +75,10 @@ class TestMicroversions(base.TestCase):
                 dict(
                     method='GET',
                     uri=self.get_mock_url(
-                        'compute', 'public', append=['servers', 'detail']
+                        'compute',
+                        'public',
+                        append=['servers', 'detail'],
+                        qs_elements=['name=mickey'],
                     ),
                     request_headers={'OpenStack-API-Version': 'compute 2.42'},
                     json={'servers': [server1, server2]},
@@ -100,7 +103,10 @@ class TestMicroversions(base.TestCase):
                 dict(
                     method='GET',
                     uri=self.get_mock_url(
-                        'compute', 'public', append=['servers', 'detail']
+                        'compute',
+                        'public',
+                        append=['servers', 'detail'],
+                        qs_elements=['name=mickey'],
                     ),
                     request_headers={'OpenStack-API-Version': 'compute 2.42'},
                     json={'servers': [server1, server2]},
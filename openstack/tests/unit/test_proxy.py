@@ -12,8 +12,10 @@
 
 import copy
 import queue
+import threading
 from unittest import mock
 
+from keystoneauth1 import exceptions as ks_exceptions
 from keystoneauth1 import session
 from testscenarios import load_tests_apply_scenarios as load_tests  # noqa
 
@@ -479,6 +481,26 @@ class TestProxyGet(base.TestCase):
             self.res,
         )
 
+    def test_get_many(self):
+        with mock.patch.object(
+            RetrieveableResource,
+            'fetch_many',
+            return_value=[self.fake_result],
+        ) as fetch_many:
+            rv = self.sot._get_many(
+                RetrieveableResource, [self.fake_id], concurrency=3, key='v'
+            )
+
+        fetch_many.assert_called_once_with(
+            self.sot,
+            [self.fake_id],
+            concurrency=3,
+            base_path=None,
+            skip_cache=False,
+            key='v',
+        )
+        self.assertEqual([self.fake_result], rv)
+
 
 class TestProxyList(base.TestCase):
     def setUp(self):
@@ -516,6 +538,26 @@ class TestProxyList(base.TestCase):
     def test_list_override_base_path(self):
         self._test_list(False, base_path='dummy')
 
+    def test_list_lazy(self):
+        rv = self.sot._list(
+            ListableResource, paginated=True, lazy=True, **self.args
+        )
+
+        self.assertEqual(self.fake_response, rv)
+        ListableResource.list.assert_called_once_with(
+            self.sot, paginated=True, base_path=None, lazy=True, **self.args
+        )
+
+    def test_list_prefetch(self):
+        rv = self.sot._list(
+            ListableResource, paginated=True, prefetch=2, **self.args
+        )
+
+        self.assertEqual(self.fake_response, rv)
+        ListableResource.list.assert_called_once_with(
+            self.sot, paginated=True, base_path=None, prefetch=2, **self.args
+        )
+
     def test_list_filters_jmespath(self):
         fake_response = [
             FilterableResource(a='a1', b='b1', c='c'),
@@ -584,6 +626,138 @@ class TestProxyHead(base.TestCase):
         self.assertEqual(rv, self.fake_result)
 
 
+class TestProxyConcurrency(base.TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.session = mock.Mock(spec=session.Session)
+        self.session._sdk_connection = self.cloud
+        self.session.get_project_id = mock.Mock(return_value='fake_prj')
+        self.response = mock.Mock()
+        self.response.status_code = 200
+        self.response.history = []
+        self.response.headers = {}
+        self.session.request = mock.Mock(return_value=self.response)
+
+        self.limiter = utils.AdaptiveConcurrencyLimiter(initial=8)
+        self.sot = proxy.Proxy(self.session, concurrency_limiter=self.limiter)
+        self.sot._connection = self.cloud
+        self.sot.service_type = 'srv'
+
+    def test_success(self):
+        with mock.patch.object(self.limiter, 'success') as success:
+            self.sot.get('fake/1')
+        success.assert_called_once_with()
+        self.assertEqual(0, self.limiter.in_flight)
+
+    def test_overloaded(self):
+        self.response.status_code = 429
+        self.response.headers = {'Retry-After': '7'}
+        with mock.patch.object(
+            self.limiter, 'overload', return_value=True
+        ) as overload, mock.patch.object(self.sot, '_report_gauge') as gauge:
+            self.sot.get('fake/1', raise_exc=False)
+        overload.assert_called_once_with(7)
+        gauge.assert_called_once_with('concurrency_limit', 8)
+
+    def test_http_error(self):
+        self.session.request.side_effect = ks_exceptions.ServiceUnavailable(
+            response=self.response
+        )
+        self.assertRaises(
+            ks_exceptions.ServiceUnavailable, self.sot.get, 'fake/1'
+        )
+        self.assertEqual(4, self.limiter.limit)
+        self.assertEqual(0, self.limiter.in_flight)
+
+    def test_not_found(self):
+        self.session.request.side_effect = ks_exceptions.NotFound(
+            response=self.response
+        )
+        self.assertRaises(ks_exceptions.NotFound, self.sot.get, 'fake/1')
+        self.assertEqual(8, self.limiter.limit)
+
+    def test_connect_timeout(self):
+        self.session.request.side_effect = ks_exceptions.ConnectTimeout()
+        self.assertRaises(ks_exceptions.ConnectTimeout, self.sot.get, 'fake/1')
+        self.assertEqual(4, self.limiter.limit)
+
+    def test_no_limiter(self):
+        self.sot._concurrency_limiter = None
+        self.sot.get('fake/1')
+        self.session.request.assert_called_once()
+
+
+class TestProxyCircuitBreaker(base.TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.session = mock.Mock(spec=session.Session)
+        self.session._sdk_connection = self.cloud
+        self.session.get_project_id = mock.Mock(return_value='fake_prj')
+        self.response = mock.Mock()
+        self.response.status_code = 500
+        self.response.history = []
+        self.response.headers = {}
+        self.session.request = mock.Mock(return_value=self.response)
+
+        self.breaker = utils.CircuitBreaker(failure_threshold=2)
+        self.factory = mock.Mock(return_value=self.breaker)
+        self.sot = proxy.Proxy(
+            self.session, circuit_breaker_factory=self.factory
+        )
+        self.sot._connection = self.cloud
+        self.sot.service_type = 'srv'
+        self.sot.get_endpoint = mock.Mock(
+            return_value='https://srv.example.com/v1'
+        )
+
+    def test_fail_fast(self):
+        self.sot.get('fake/1')
+        self.sot.get('fake/1')
+        self.assertEqual(self.breaker.OPEN, self.breaker.state)
+        self.assertRaises(
+            exceptions.CircuitOpenException, self.sot.get, 'fake/1'
+        )
+        self.assertEqual(2, self.session.request.call_count)
+        self.factory.assert_called_with('https://srv.example.com/v1')
+        self.sot.get_endpoint.assert_called_once_with()
+
+    def test_connect_failure(self):
+        self.session.request.side_effect = ks_exceptions.ConnectFailure()
+        for _ in range(2):
+            self.assertRaises(
+                ks_exceptions.ConnectFailure, self.sot.get, 'fake/1'
+            )
+        self.assertEqual(self.breaker.OPEN, self.breaker.state)
+
+    def test_client_error(self):
+        self.response.status_code = 404
+        for _ in range(3):
+            self.sot.get('fake/1')
+        self.session.request.side_effect = ks_exceptions.NotFound(
+            response=self.response
+        )
+        self.assertRaises(ks_exceptions.NotFound, self.sot.get, 'fake/1')
+        self.assertEqual(self.breaker.CLOSED, self.breaker.state)
+
+    def test_success_resets(self):
+        self.sot.get('fake/1')
+        self.response.status_code = 200
+        self.sot.get('fake/1')
+        self.response.status_code = 500
+        self.sot.get('fake/1')
+        self.assertEqual(self.breaker.CLOSED, self.breaker.state)
+
+    def test_absolute_url(self):
+        self.response.status_code = 200
+        self.sot.get('https://other.example.com/v1/fake/1')
+        self.factory.assert_called_once_with(
+            'https://other.example.com/v1/fake/1'
+        )
+        self.sot.get_endpoint.assert_not_called()
+
+
 class TestExtractName(base.TestCase):
     scenarios = [
         ('slash_servers_bare', dict(url='/servers', parts=['servers'])),
@@ -638,7 +812,9 @@ class TestProxyCache(base.TestCase):
         self.sot.service_type = 'srv'
 
     def _get_key(self, id):
-        return "srv.fake.fake/%s.{'microversion': None, 'params': {}}" % id
+        return utils.canonical_cache_key(
+            'srv.fake', 'fake/%s' % id, {'microversion': None, 'params': {}}
+        )
 
     def test_get_not_in_cache(self):
         self.cloud._cache_expirations['srv.fake'] = 5
@@ -692,6 +868,201 @@ class TestProxyCache(base.TestCase):
         self.sot._get(self.Res, '3')
         self.session.request.assert_called()
 
+    def test_modify_keeps_other_keys(self):
+        key = self._get_key(3)
+        other = utils.canonical_cache_key('srv.other', 'other/3', {})
+        self.cloud._api_cache_keys.add(key, 'srv.fake')
+        self.cloud._api_cache_keys.add(other, 'srv.other')
+        self.cloud._cache.set(other, self.response)
+
+        rs = self.Res.existing(id='3')
+        self.sot._update(self.Res, rs, foo='bar')
+
+        self.assertNotIn(key, self.cloud._api_cache_keys)
+        self.assertIn(other, self.cloud._api_cache_keys)
+        self.assertIs(self.response, self.cloud._cache.get(other))
+
+    def test_cache_stats(self):
+        self.cloud._cache_expirations['srv.fake'] = 5
+
+        self.sot._get(self.Res, '7')
+        self.sot._get(self.Res, '7')
+        self.sot._get(self.Res, '7')
+        self.assertEqual(
+            {'srv.fake': {'hits': 2, 'misses': 1, 'evictions': 0}},
+            self.cloud.get_cache_stats(),
+        )
+
+        self.sot._update(self.Res, self.Res.existing(id='7'), foo='bar')
+        self.assertEqual(
+            {'srv.fake': {'hits': 2, 'misses': 1, 'evictions': 1}},
+            self.cloud.get_cache_stats(),
+        )
+
+    def test_get_coalesced(self):
+        release = threading.Event()
+        joined = threading.Condition()
+        followers = []
+
+        class Done(threading.Event):
+            def wait(self, timeout=None):
+                with joined:
+                    followers.append(self)
+                    joined.notify_all()
+                return super().wait(timeout)
+
+        class Flight(utils._Flight):
+            def __init__(self):
+                super().__init__()
+                self.done = Done()
+
+        def request(*args, **kwargs):
+            release.wait(10)
+            return self.response
+
+        self.session.request.side_effect = request
+        responses = []
+        threads = [
+            threading.Thread(
+                target=lambda: responses.append(self.sot._get(self.Res, '8'))
+            )
+            for _ in range(4)
+        ]
+        with mock.patch.object(utils, '_Flight', Flight):
+            for thread in threads:
+                thread.start()
+            # Answer once the three other requests wait for the first one
+            with joined:
+                self.assertTrue(
+                    joined.wait_for(lambda: len(followers) == 3, timeout=10)
+                )
+            release.set()
+            for thread in threads:
+                thread.join(10)
+                self.assertFalse(thread.is_alive())
+
+        self.session.request.assert_called_once()
+        self.assertEqual(4, len(responses))
+
+    def test_get_not_coalesced_with_other_arguments(self):
+        inflight = self.cloud._api_inflight
+        with mock.patch.object(inflight, 'do', wraps=inflight.do) as do:
+            self.sot.request('fake/12', 'GET', global_request_id='req-1')
+            self.sot.request('fake/12', 'GET', global_request_id='req-2')
+            self.sot.request('fake/12', 'GET', raise_exc=True)
+
+        keys = [c.args[0] for c in do.call_args_list]
+        self.assertEqual(3, len(set(keys)))
+
+    def test_get_stale_while_revalidate(self):
+        key = self._get_key(9)
+        self.cloud._cache_expirations['srv.fake'] = 5
+        self.cloud._cache_expirations['srv.fake.stale'] = 60
+        stale = copy.deepcopy(self.response)
+        stale.body = {'foo': 'stale'}
+        stale.json = mock.Mock(return_value=stale.body)
+        self.response.body['foo'] = 'fresh'
+        cached = self.cloud._cache._value(stale)
+        cached.metadata['ct'] -= 10
+        self.cloud._cache.backend.set(key, cached)
+        self.cloud._api_cache_keys.add(key, 'srv.fake')
+
+        executor = mock.Mock()
+        executor.submit.side_effect = lambda fn, *args: fn(*args)
+        with mock.patch.object(
+            type(self.cloud),
+            '_pool_executor',
+            new_callable=mock.PropertyMock,
+            return_value=executor,
+        ):
+            res = self.sot._get(self.Res, '9')
+
+        # The stale value is served while the refresh happens in the
+        # background
+        self.assertEqual('stale', res.foo)
+        executor.submit.assert_called_once()
+        self.session.request.assert_called_once()
+        self.assertIs(self.response, self.cloud._cache.get(key))
+
+        self.assertEqual('fresh', self.sot._get(self.Res, '9').foo)
+        self.session.request.assert_called_once()
+
+    def _cache_expired(self, key, headers):
+        cached_response = copy.deepcopy(self.response)
+        cached_response.headers = headers
+        cached_response.body = {'foo': 'cached'}
+        cached_response.json = mock.Mock(return_value=cached_response.body)
+        cached = self.cloud._cache._value(cached_response)
+        cached.metadata['ct'] -= 10
+        self.cloud._cache.backend.set(key, cached)
+        self.cloud._cache_expirations['srv.fake'] = 5
+        return cached_response
+
+    def test_get_revalidated(self):
+        key = self._get_key(11)
+        cached = self._cache_expired(
+            key,
+            {
+                'ETag': '"abc"',
+                'Last-Modified': 'Mon, 01 Jan 2024 00:00:00 GMT',
+            },
+        )
+        self.response.status_code = 304
+
+        res = self.sot._get(self.Res, '11')
+
+        self.assertEqual('cached', res.foo)
+        headers = self.session.request.call_args[1]['headers']
+        self.assertEqual('"abc"', headers['If-None-Match'])
+        self.assertEqual(
+            'Mon, 01 Jan 2024 00:00:00 GMT', headers['If-Modified-Since']
+        )
+        # The revalidated response is cached again
+        self.assertIs(cached, self.cloud._cache.get(key))
+        self.assertEqual(
+            {'srv.fake': {'hits': 1, 'misses': 0, 'evictions': 0}},
+            self.cloud.get_cache_stats(),
+        )
+
+    def test_get_revalidated_modified(self):
+        key = self._get_key(12)
+        self._cache_expired(key, {'ETag': '"abc"'})
+        self.response.body['foo'] = 'new'
+
+        res = self.sot._get(self.Res, '12')
+
+        self.assertEqual('new', res.foo)
+        headers = self.session.request.call_args[1]['headers']
+        self.assertEqual('"abc"', headers['If-None-Match'])
+        self.assertNotIn('If-Modified-Since', headers)
+        self.assertIs(self.response, self.cloud._cache.get(key))
+
+    def test_get_expired_without_validators(self):
+        key = self._get_key(13)
+        self._cache_expired(key, {})
+        self.response.body['foo'] = 'new'
+
+        self.assertEqual('new', self.sot._get(self.Res, '13').foo)
+        headers = self.session.request.call_args[1]['headers']
+        self.assertNotIn('If-None-Match', headers)
+
+    def test_get_stale_expired(self):
+        key = self._get_key(10)
+        self.cloud._cache_expirations['srv.fake'] = 5
+        self.cloud._cache_expirations['srv.fake.stale'] = 60
+        cached = self.cloud._cache._value(copy.deepcopy(self.response))
+        cached.metadata['ct'] -= 100
+        self.cloud._cache.backend.set(key, cached)
+
+        with mock.patch.object(
+            type(self.cloud), '_pool_executor', new_callable=mock.PropertyMock
+        ) as executor:
+            self.sot._get(self.Res, '10')
+
+        executor.assert_not_called()
+        self.session.request.assert_called_once()
+        self.assertIs(self.response, self.cloud._cache.get(key))
+
     def test_get_bypass_cache(self):
         key = self._get_key(4)
 
@@ -709,6 +1080,26 @@ class TestProxyCache(base.TestCase):
         self.assertNotIn(key, self.cloud._api_cache_keys)
         self.assertEqual('NoValue', type(self.cloud._cache.get(key)).__name__)
 
+    def test_get_stream_bypass_cache(self):
+        key = self._get_key(5)
+
+        self.cloud._api_cache_keys.add(key)
+        self.cloud._cache.set(key, self.response)
+        self.cloud._cache_expirations['srv.fake'] = 5
+
+        self.sot.get('fake/5', stream=True)
+        self.session.request.assert_called_once()
+        self.assertTrue(self.session.request.call_args[1]['stream'])
+        # Streaming does not invalidate what is cached
+        self.assertIn(key, self.cloud._api_cache_keys)
+        self.assertIs(self.response, self.cloud._cache.get(key))
+
+    def test_retry_after_noted(self):
+        self.response.headers = {'Retry-After': '7'}
+        with mock.patch.object(utils, 'note_retry_after') as note:
+            self.sot.get('fake/6')
+        note.assert_called_once_with('7')
+
 
 class TestProxyCleanup(base.TestCase):
     def setUp(self):
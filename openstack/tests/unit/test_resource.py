@@ -10,17 +10,22 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import concurrent.futures
 import itertools
 import json
 import logging
+import time
 from unittest import mock
 
+import fixtures
 from keystoneauth1 import adapter
 import requests
 
-from openstack import dns
+from openstack.block_storage.v3 import volume
+from openstack.dns.v2 import _base as dns_base
 from openstack import exceptions
 from openstack import format
+from openstack.load_balancer.v2 import load_balancer
 from openstack import resource
 from openstack.tests.unit import base
 from openstack import utils
@@ -581,6 +586,28 @@ class TestResource(base.TestCase):
             {serverside_key1: value1, serverside_key2: value2}, result
         )
 
+    def test__consume_attrs_case_insensitive(self):
+        class Test(resource.Resource):
+            foo = resource.Header("X-Foo")
+            bar = resource.Body("someBar")
+
+        sot = Test()
+
+        attrs = {"x-foo": "header", "somebar": "lower", "other": "other"}
+        result = sot._consume_header_attrs(attrs)
+        self.assertDictEqual({"X-Foo": "header"}, dict(result))
+
+        # Body mappings are only case insensitive once an exact match was
+        # found, so the lowercase server-side name is left alone.
+        result = sot._consume_body_attrs(attrs)
+        self.assertDictEqual({}, result)
+        self.assertDictEqual({"somebar": "lower", "other": "other"}, attrs)
+
+        attrs = {"bar": "client", "someBar": "server"}
+        result = sot._consume_body_attrs(attrs)
+        self.assertDictEqual({"someBar": "server"}, result)
+        self.assertDictEqual({}, attrs)
+
     def test__mapping_defaults(self):
         # Check that even on an empty class, we get the expected
         # built-in attributes.
@@ -634,6 +661,30 @@ class TestResource(base.TestCase):
         self.assertIn("y", Test._uri_mapping())
         self.assertIn("z", Test._uri_mapping())
 
+    def test__get_schema_cached_per_class(self):
+        class Parent(resource.Resource):
+            x = resource.Body("x")
+
+        class Child(Parent):
+            y = resource.Body("y")
+
+        parent_schema = Parent._get_schema()
+        self.assertIs(parent_schema, Parent._get_schema())
+
+        child_schema = Child._get_schema()
+        self.assertIsNot(parent_schema, child_schema)
+        self.assertNotIn("y", parent_schema.mapping(resource.Body))
+        self.assertIn("x", child_schema.mapping(resource.Body))
+        self.assertIn("y", child_schema.mapping(resource.Body))
+
+    def test__get_mapping_returns_copy(self):
+        class Test(resource.Resource):
+            x = resource.Body("x")
+
+        Test._body_mapping().pop("x")
+
+        self.assertIn("x", Test._body_mapping())
+
     def test__getattribute__id_in_body(self):
         id = "lol"
         sot = resource.Resource(id=id)
@@ -2290,6 +2341,60 @@ class TestResourceActions(base.TestCase):
         self.assertEqual(id_value, results[0].id)
         self.assertIsInstance(results[0], self.test_class)
 
+    def test_list_lazy(self):
+        class Test(self.test_class):
+            status = resource.Body("status")
+
+        mock_response = mock.Mock()
+        mock_response.status_code = 200
+        mock_response.links = {}
+        mock_response.json.return_value = {
+            "resources": [
+                {"id": "1", "name": "one", "status": "ACTIVE"},
+                {"id": "2", "name": "two", "status": "ERROR"},
+            ]
+        }
+        self.session.get.return_value = mock_response
+
+        results = list(Test.list(self.session, lazy=True))
+
+        self.assertEqual(2, len(results))
+        for result in results:
+            self.assertIsInstance(result, Test)
+            self.assertIsNot(Test, type(result))
+        self.assertEqual(["1", "2"], [r.id for r in results])
+        self.assertEqual(["one", "two"], [r.name for r in results])
+        # Reading the fast-path attributes does not parse the body
+        self.assertIsNot(Test, type(results[0]))
+
+        self.assertEqual("ACTIVE", results[0].status)
+        self.assertIs(Test, type(results[0]))
+        self.assertIsNot(Test, type(results[1]))
+
+        eager = Test.existing(
+            connection=self.cloud, id="2", name="two", status="ERROR"
+        )
+        self.assertEqual(eager, results[1])
+        self.assertIs(Test, type(results[1]))
+        self.assertEqual(eager.to_dict(), results[1].to_dict())
+        self.assertEqual(dict(eager), dict(results[1]))
+
+    def test_list_lazy_custom_parsing(self):
+        class Test(self.test_class):
+            def _consume_attrs(self, mapping, attrs):
+                return super()._consume_attrs(mapping, attrs)
+
+        mock_response = mock.Mock()
+        mock_response.status_code = 200
+        mock_response.links = {}
+        mock_response.json.return_value = {"resources": [{"id": "1"}]}
+        self.session.get.return_value = mock_response
+
+        results = list(Test.list(self.session, lazy=True))
+
+        self.assertIs(Test, type(results[0]))
+        self.assertEqual("1", results[0].id)
+
     def test_list_response_paginated_without_links(self):
         ids = [1, 2]
         mock_response = mock.Mock()
@@ -2670,7 +2775,7 @@ class TestResourceActions(base.TestCase):
 
     @mock.patch.object(resource.Resource, 'list')
     def test_list_dns_with_headers(self, mock_resource_list):
-        dns.v2._base.Resource.list(
+        dns_base.Resource.list(
             self.session,
             project_id='1234',
             all_projects=True,
@@ -2761,6 +2866,109 @@ class TestResourceActions(base.TestCase):
         self.assertEqual(1, len(res))
         self.assertEqual("2", res[0].b)
 
+    def test_list_client_filter_operators(self):
+        mock_response = mock.Mock()
+        mock_response.status_code = 200
+        mock_response.links = {}
+        mock_response.json.return_value = {
+            "resources": [
+                {"id": "1", "name": "web-1", "size": 1, "a": "x"},
+                {"id": "2", "name": "web-2", "size": 5, "a": "y"},
+                {"id": "3", "name": "db-1", "size": 10, "a": "y"},
+                {"id": "4", "name": "web-3", "size": None, "a": "z"},
+            ]
+        }
+
+        class Test(self.test_class):
+            _query_mapping = resource.QueryParameters('a')
+            name = resource.Body("name")
+            size = resource.Body("size", type=int)
+            a = resource.Body("a")
+
+        def _list(**params):
+            self.session.get.reset_mock()
+            self.session.get.side_effect = [mock_response]
+            return [r.id for r in Test.list(self.session, **params)]
+
+        self.assertEqual(['1', '3'], _list(id=resource.In(['1', '3', '5'])))
+        self.assertEqual(['1', '2', '4'], _list(name=resource.Prefix('web-')))
+        self.assertEqual(['2', '3'], _list(size=resource.Range(min=2, max=10)))
+        self.assertEqual(['1', '2'], _list(size=resource.Range(max=9)))
+        self.assertEqual(['2', '4'], _list(name=resource.Regex(r'-[23]$')))
+        self.assertEqual(
+            ['2'],
+            _list(
+                name=resource.Prefix('web'), a=resource.In(['x', 'y']), size=5
+            ),
+        )
+        # Filter objects are never sent to the server, even for parameters
+        # it supports
+        self.session.get.assert_called_once_with(
+            self.base_path,
+            headers={'Accept': 'application/json'},
+            microversion=None,
+            params={},
+        )
+
+    def test_list_client_filter_operator_invalid(self):
+        self.assertRaises(
+            exceptions.InvalidResourceQuery,
+            list,
+            self.test_class.list(self.session, something=resource.Prefix('x')),
+        )
+        self.session.get.assert_not_called()
+
+    def test_list_client_filter_abstract(self):
+        class Incomplete(resource.ListFilter):
+            pass
+
+        self.assertRaises(TypeError, Incomplete)
+
+    def test_list_client_filters_lazy(self):
+        mock_response = mock.Mock()
+        mock_response.status_code = 200
+        mock_response.links = {}
+        mock_response.json.return_value = {
+            "resources": [
+                {"id": "1", "name": "web-1", "a": "x"},
+                {"id": "2", "name": "db-1", "a": "y"},
+            ]
+        }
+        self.session.get.side_effect = [mock_response]
+
+        class Test(self.test_class):
+            name = resource.Body("name")
+            a = resource.Body("a")
+
+        res = list(
+            Test.list(self.session, lazy=True, name=resource.Prefix('web'))
+        )
+
+        self.assertEqual(['1'], [r.id for r in res])
+        # Filtering on name does not parse the resources
+        self.assertIsInstance(res[0], resource._LazyResourceMixin)
+
+    def test_list_filters_logged(self):
+        mock_response = mock.Mock()
+        mock_response.status_code = 200
+        mock_response.links = {}
+        mock_response.json.return_value = {"resources": []}
+        self.session.get.side_effect = [mock_response]
+
+        class Test(self.test_class):
+            _query_mapping = resource.QueryParameters('a')
+            a = resource.Body("a")
+            b = resource.Body("b")
+
+        with self.assertLogs('openstack.resource', 'DEBUG') as logs:
+            list(Test.list(self.session, a='1', b=resource.In(['2']), c=3))
+
+        self.assertIn(
+            "Listing Test with server-side filters ['a'], client-side "
+            "filters ['b'], ignored parameters ['c']",
+            logs.output[0],
+        )
+
     def test_values_as_list_params(self):
         id = 1
         qp = "query param!"
@@ -2914,6 +3122,250 @@ class TestResourceActions(base.TestCase):
             microversion=None,
         )
 
+    def _multi_page_responses(self, count):
+        responses = []
+        for index in range(count):
+            response = mock.Mock()
+            response.status_code = 200
+            response.links = {}
+            response.json.return_value = {
+                "resources": [{"id": index}],
+                "resources_links": [
+                    {
+                        "href": "https://example.com/next-url",
+                        "rel": "next",
+                    }
+                ],
+            }
+            responses.append(response)
+        last = mock.Mock()
+        last.status_code = 200
+        last.links = {}
+        last.json.return_value = {"resources": []}
+        responses.append(last)
+        return responses
+
+    def test_list_multi_page_prefetch(self):
+        self.session.get.side_effect = self._multi_page_responses(4)
+
+        results = self.sot.list(self.session, paginated=True, prefetch=1)
+
+        self.assertEqual(0, next(results).id)
+        # The next page is fetched while the first one is being consumed,
+        # but no further than that.
+        for _ in range(50):
+            if self.session.get.call_count == 2:
+                break
+            time.sleep(0.01)
+        self.assertEqual(2, self.session.get.call_count)
+
+        self.assertEqual([1, 2, 3], [r.id for r in results])
+        self.assertEqual(5, self.session.get.call_count)
+
+    def test_list_multi_page_prefetch_early_exit(self):
+        self.session.get.side_effect = self._multi_page_responses(10)
+
+        results = self.sot.list(self.session, paginated=True, prefetch=2)
+
+        self.assertEqual(0, next(results).id)
+        results.close()
+        time.sleep(0.05)
+        self.assertLessEqual(self.session.get.call_count, 3)
+
+    def test_list_paginated_infinite_loop_prefetch(self):
+        mock_response = mock.Mock()
+        mock_response.status_code = 200
+        mock_response.links = {}
+        mock_response.json.side_effect = [
+            {
+                "resources": [{"id": 1}],
+            },
+            {
+                "resources": [{"id": 1}],
+            },
+        ]
+
+        self.session.get.return_value = mock_response
+
+        class Test(self.test_class):
+            _query_mapping = resource.QueryParameters("limit")
+
+        res = Test.list(self.session, paginated=True, limit=1, prefetch=2)
+
+        self.assertEqual(1, next(res).id)
+        self.assertEqual(1, next(res).id)
+        self.assertRaises(exceptions.SDKException, next, res)
+
+    def test_list_multi_page_stream(self):
+        pages = [
+            {
+                "resources": [{"id": 1}, {"id": 2}],
+                "resources_links": [
+                    {"href": "https://example.com/next-url", "rel": "next"}
+                ],
+            },
+            {"resources": [{"id": 3}]},
+        ]
+        responses = []
+        for page in pages:
+            response = mock.Mock()
+            response.status_code = 200
+            response.links = {}
+            data = json.dumps(page).encode()
+            response.iter_content.return_value = [
+                data[i : i + 7] for i in range(0, len(data), 7)
+            ]
+            responses.append(response)
+        self.session.get.side_effect = responses
+
+        results = list(self.sot.list(self.session, stream=True))
+
+        self.assertEqual([1, 2, 3], [r.id for r in results])
+        self.session.get.assert_has_calls(
+            [
+                mock.call(
+                    self.base_path,
+                    headers={"Accept": "application/json"},
+                    params={},
+                    microversion=None,
+                    stream=True,
+                ),
+                mock.call(
+                    'https://example.com/next-url',
+                    headers={"Accept": "application/json"},
+                    params={},
+                    microversion=None,
+                    stream=True,
+                ),
+            ]
+        )
+        for response in responses[:2]:
+            response.json.assert_not_called()
+            response.close.assert_called_once_with()
+
+    def test_fetch_many(self):
+        def _get(url, **kwargs):
+            if url == 'base_path/missing':
+                raise exceptions.NotFoundException('not found')
+            return FakeResponse({'id': url.rsplit('/', 1)[-1]})
+
+        self.session.get.side_effect = _get
+        existing = self.test_class(id='b')
+
+        results = self.test_class.fetch_many(
+            self.session, ['a', existing, 'missing', 'a'], concurrency=2
+        )
+
+        self.assertEqual(4, len(results))
+        self.assertEqual('a', results[0].id)
+        self.assertEqual('b', results[1].id)
+        self.assertIsInstance(results[2], exceptions.NotFoundException)
+        self.assertIs(results[0], results[3])
+        # Duplicated IDs are only fetched once
+        self.assertEqual(3, self.session.get.call_count)
+        self.session.get.assert_any_call(
+            'base_path/a', microversion=None, params={}, skip_cache=False
+        )
+
+    def test_fetch_many_on_connection_pool(self):
+        self.session.get.side_effect = lambda url, **kwargs: FakeResponse(
+            {'id': url.rsplit('/', 1)[-1]}
+        )
+        # A single worker, taken by the job calling fetch_many
+        pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self.addCleanup(pool.shutdown)
+        self.useFixture(
+            fixtures.MockPatchObject(
+                type(self.cloud),
+                '_pool_executor',
+                new_callable=mock.PropertyMock,
+                return_value=pool,
+            )
+        )
+
+        future = pool.submit(
+            self.test_class.fetch_many, self.session, ['a', 'b', 'c']
+        )
+
+        results = future.result(timeout=10)
+        self.assertEqual(['a', 'b', 'c'], [r.id for r in results])
+
+    def test_fetch_many_list_by_id(self):
+        class Test(self.test_class):
+            _query_mapping = resource.QueryParameters('id')
+
+        list_response = mock.Mock()
+        list_response.status_code = 200
+        list_response.links = {}
+        list_response.json.return_value = {
+            'resources': [{'id': 'a'}, {'id': 'b'}]
+        }
+
+        def _get(url, **kwargs):
+            if url == self.base_path:
+                return list_response
+            return FakeResponse({'id': url.rsplit('/', 1)[-1]})
+
+        self.session.get.side_effect = _get
+
+        results = Test.fetch_many(self.session, ['b', 'c', 'a'])
+
+        self.assertEqual(['b', 'c', 'a'], [r.id for r in results])
+        # a and b come from a single list call, c is fetched on its own
+        self.assertEqual(2, self.session.get.call_count)
+        self.session.get.assert_has_calls(
+            [
+                mock.call(
+                    self.base_path,
+                    headers={'Accept': 'application/json'},
+                    params={'id': ['b', 'c', 'a']},
+                    microversion=None,
+                ),
+                mock.call(
+                    'base_path/c',
+                    microversion=None,
+                    params={},
+                    skip_cache=False,
+                ),
+            ]
+        )
+
+    def test_fetch_many_list_not_filtered(self):
+        class Test(self.test_class):
+            _query_mapping = resource.QueryParameters('id')
+
+        ids = ['id%d' % i for i in range(resource._FETCH_MANY_LIST_SIZE + 1)]
+        list_response = mock.Mock()
+        list_response.status_code = 200
+        list_response.links = {}
+        # The service ignores the filter and returns another resource
+        list_response.json.return_value = {
+            'resources': [{'id': 'id0'}, {'id': 'other'}]
+        }
+
+        def _get(url, **kwargs):
+            if url == self.base_path:
+                return list_response
+            return FakeResponse({'id': url.rsplit('/', 1)[-1]})
+
+        self.session.get.side_effect = _get
+
+        results = Test.fetch_many(self.session, ids, skip_cache=True)
+
+        self.assertEqual(ids, [r.id for r in results])
+        # A single list call, then every other resource is fetched
+        list_calls = [
+            c
+            for c in self.session.get.call_args_list
+            if c.args[0] == self.base_path
+        ]
+        self.assertEqual(1, len(list_calls))
+        self.assertTrue(list_calls[0].kwargs['skip_cache'])
+        self.assertEqual(len(ids), self.session.get.call_count)
+        self.session.get.assert_any_call(
+            'base_path/id1', microversion=None, params={}, skip_cache=True
+        )
+
     def test_list_multi_page_no_early_termination(self):
         # This tests verifies that multipages are not early terminated.
         # APIs can set max_limit to the number of items returned in each
@@ -3450,6 +3902,76 @@ class TestResourceFind(base.TestCase):
                 self.cloud.compute, base_path='/dummy/list'
             )
 
+    def _find_cache_class(self):
+        self.cloud._find_cache = resource._FindCache(60, 10)
+        self.addCleanup(setattr, self.cloud, '_find_cache', None)
+
+        fetched = mock.Mock()
+        fetched.fetch.return_value = 'fetched'
+
+        class Test(resource.Resource):
+            pass
+
+        Test.existing = mock.Mock(
+            side_effect=lambda **kwargs: (
+                fetched if kwargs['id'] == 'abc' else self.Base.existing()
+            )
+        )
+        Test.list = mock.Mock()
+        return Test
+
+    def test_find_cache(self):
+        Test = self._find_cache_class()
+        Test.list.return_value = [Test(id='abc', name='name')]
+
+        self.assertEqual('abc', Test.find(self.cloud.compute, 'name').id)
+        self.assertEqual('fetched', Test.find(self.cloud.compute, 'name'))
+
+        # The name is only looked up once, the ID is then fetched directly
+        Test.list.assert_called_once_with(self.cloud.compute)
+        self.assertEqual(
+            [mock.call(id='name', connection=mock.ANY)]
+            + [mock.call(id='abc', connection=mock.ANY)],
+            Test.existing.call_args_list,
+        )
+
+        # Resources of the same type created through a proxy invalidate it
+        with mock.patch.object(Test, 'create'):
+            self.cloud.compute._create(Test)
+        self.assertEqual('abc', Test.find(self.cloud.compute, 'name').id)
+        self.assertEqual(2, Test.list.call_count)
+
+    def test_find_cache_negative(self):
+        Test = self._find_cache_class()
+        Test.list.return_value = []
+
+        self.assertIsNone(Test.find(self.cloud.compute, 'name'))
+        self.assertRaises(
+            exceptions.ResourceNotFound,
+            Test.find,
+            self.cloud.compute,
+            'name',
+            ignore_missing=False,
+        )
+        Test.list.assert_called_once_with(self.cloud.compute)
+        Test.existing.assert_called_once_with(id='name', connection=mock.ANY)
+
+        with mock.patch.object(
+            resource.time, 'monotonic', return_value=time.monotonic() + 11
+        ):
+            self.assertIsNone(Test.find(self.cloud.compute, 'name'))
+        self.assertEqual(2, Test.list.call_count)
+
+    def test_find_cache_scoped(self):
+        Test = self._find_cache_class()
+        Test.list.return_value = []
+
+        Test.find(self.cloud.compute, 'name')
+        Test.find(self.cloud.compute, 'name', all_projects=True)
+        Test.find(self.cloud.network, 'name')
+
+        self.assertEqual(3, Test.list.call_count)
+
 
 class TestWait(base.TestCase):
     def setUp(self):
@@ -3539,6 +4061,51 @@ class TestWaitForStatus(TestWait):
 
         self.assertEqual(res, result)
 
+    def test_backoff(self):
+        self.cloud.config.config['polling_strategy'] = 'exponential'
+        self.addCleanup(self.cloud.config.config.pop, 'polling_strategy')
+        res = self._fake_resource(['building', 'building', 'active'])
+
+        with mock.patch.object(
+            utils, 'iterate_timeout', wraps=utils.iterate_timeout
+        ) as iterate_timeout:
+            resource.wait_for_status(
+                self.cloud.compute, res, 'active', None, 0.01, 1
+            )
+            resource.wait_for_status(
+                self.cloud.compute,
+                self._fake_resource(['building', 'active']),
+                'active',
+                None,
+                0.01,
+                1,
+                backoff='jitter',
+            )
+
+        self.assertEqual(
+            [utils.ExponentialBackoff, utils.DecorrelatedJitterBackoff],
+            [
+                type(c.kwargs['backoff'])
+                for c in iterate_timeout.call_args_list
+            ],
+        )
+
+    def test_backoff_invalid_config(self):
+        self.cloud.config.config['polling_strategy'] = 'fast'
+        self.addCleanup(self.cloud.config.config.pop, 'polling_strategy')
+        res = self._fake_resource(['building', 'active'])
+
+        self.assertRaises(
+            exceptions.SDKException,
+            resource.wait_for_status,
+            self.cloud.compute,
+            res,
+            'active',
+            None,
+            0.01,
+            1,
+        )
+
     def test_status_match(self):
         status = "loling"
 
@@ -3811,6 +4378,277 @@ class TestWaitForDelete(TestWait):
         )
 
 
+class TestWaitForMany(TestWait):
+    def setUp(self):
+        super().setUp()
+
+        class Test(resource.Resource):
+            base_path = '/things'
+            resources_key = 'things'
+            allow_fetch = True
+            allow_list = True
+            status = resource.Body('status')
+
+            _query_mapping = resource.QueryParameters('id')
+
+        self.test_class = Test
+        self.session = mock.Mock(spec=adapter.Adapter)
+        self.session._get_connection = mock.Mock(return_value=self.cloud)
+        self.session.default_microversion = None
+
+    def _list_response(self, *things):
+        response = mock.Mock()
+        response.status_code = 200
+        response.links = {}
+        response.json.return_value = {'things': list(things)}
+        return response
+
+    def test_wait_for_many(self):
+        resources = [
+            self.test_class(id='a', status='building'),
+            self.test_class(id='b', status='building'),
+            self.test_class(id='c', status='active'),
+        ]
+        self.session.get.side_effect = [
+            self._list_response(
+                {'id': 'a', 'status': 'building'},
+                {'id': 'b', 'status': 'error'},
+            ),
+            self._list_response({'id': 'a', 'status': 'active'}),
+        ]
+        callback = mock.Mock()
+
+        result = resource.wait_for_many(
+            self.session,
+            resources,
+            'ACTIVE',
+            None,
+            interval=0.01,
+            wait=1,
+            callback=callback,
+            list_base_path={self.test_class: '/things/detail'},
+        )
+
+        self.assertEqual('a', result[0].id)
+        self.assertEqual('active', result[0].status)
+        self.assertIsInstance(result[1], exceptions.ResourceFailure)
+        self.assertIs(resources[2], result[2])
+        callback.assert_has_calls(
+            [mock.call(resources[2]), mock.call(result[0])]
+        )
+        # One list call per round, whatever the number of resources
+        self.assertEqual(
+            [
+                mock.call(
+                    '/things/detail',
+                    headers={'Accept': 'application/json'},
+                    params={'id': ['a', 'b']},
+                    microversion=None,
+                    skip_cache=True,
+                ),
+                mock.call(
+                    '/things/detail',
+                    headers={'Accept': 'application/json'},
+                    params={'id': ['a']},
+                    microversion=None,
+                    skip_cache=True,
+                ),
+            ],
+            self.session.get.call_args_list,
+        )
+
+    def test_wait_for_many_no_id_filter(self):
+        class Test(self.test_class):
+            _query_mapping = resource.QueryParameters()
+
+        response = mock.Mock()
+        response.status_code = 200
+        response.headers = {}
+        response.json.return_value = {'id': 'a', 'status': 'active'}
+        self.session.get.return_value = response
+
+        result = resource.wait_for_many(
+            self.session,
+            [Test(id='a', status='building')],
+            'active',
+            None,
+            interval=0.01,
+            wait=1,
+        )
+
+        self.assertEqual('active', result[0].status)
+        # A single resource is fetched rather than paging through the
+        # collection it cannot be filtered from by ID
+        self.session.get.assert_called_once_with(
+            'things/a', microversion=None, params={}, skip_cache=True
+        )
+
+    def _paged_response(self, key, *values):
+        response = mock.Mock()
+        response.status_code = 200
+        response.links = {}
+        response.json.return_value = {key: list(values)}
+        return response
+
+    def test_wait_for_many_volumes(self):
+        # The service does not support microversions
+        self.session.get_endpoint_data.return_value.max_microversion = None
+        volumes = [
+            volume.Volume(id=name, status='creating', project_id='p')
+            for name in ('a', 'b', 'c')
+        ]
+        project = {'os-vol-tenant-attr:tenant_id': 'p'}
+        self.session.get.side_effect = [
+            self._paged_response(
+                'volumes',
+                {'id': 'a', 'status': 'available', **project},
+                {'id': 'b', 'status': 'creating', **project},
+                {'id': 'c', 'status': 'creating', **project},
+            ),
+            # c changed status and is no longer listed
+            self._paged_response(
+                'volumes', {'id': 'b', 'status': 'available', **project}
+            ),
+            FakeResponse({'volume': {'id': 'c', 'status': 'error'}}),
+        ]
+
+        result = resource.wait_for_many(
+            self.session,
+            volumes,
+            'available',
+            ['error'],
+            interval=0.01,
+            wait=10,
+            list_base_path={volume.Volume: '/volumes/detail'},
+        )
+
+        self.assertEqual(['a', 'b'], [r.id for r in result[:2]])
+        self.assertIsInstance(result[2], exceptions.ResourceFailure)
+        # One list call per round, only c is fetched on its own
+        self.assertEqual(
+            [
+                mock.call(
+                    '/volumes/detail',
+                    headers={'Accept': 'application/json'},
+                    params={'project_id': 'p', 'status': 'creating'},
+                    microversion=None,
+                    skip_cache=True,
+                ),
+                mock.call(
+                    '/volumes/detail',
+                    headers={'Accept': 'application/json'},
+                    params={'project_id': 'p', 'status': 'creating'},
+                    microversion=None,
+                    skip_cache=True,
+                ),
+                mock.call(
+                    'volumes/c', microversion=None, params={}, skip_cache=True
+                ),
+            ],
+            self.session.get.call_args_list,
+        )
+
+    def test_wait_for_many_load_balancers(self):
+        load_balancers = [
+            load_balancer.LoadBalancer(
+                id=name, provisioning_status='PENDING_CREATE'
+            )
+            for name in ('a', 'b', 'c')
+        ]
+        load_balancers[2].provisioning_status = 'PENDING_UPDATE'
+        self.session.get.side_effect = [
+            self._paged_response(
+                'loadbalancers',
+                {'id': 'a', 'provisioning_status': 'PENDING_CREATE'},
+                {'id': 'other', 'provisioning_status': 'ACTIVE'},
+                {'id': 'b', 'provisioning_status': 'ACTIVE'},
+                {'id': 'c', 'provisioning_status': 'PENDING_UPDATE'},
+            ),
+            self._paged_response(
+                'loadbalancers',
+                {'id': 'a', 'provisioning_status': 'ACTIVE'},
+                {'id': 'c', 'provisioning_status': 'ACTIVE'},
+            ),
+        ]
+
+        result = resource.wait_for_many(
+            self.session,
+            load_balancers,
+            'ACTIVE',
+            ['ERROR'],
+            interval=0.01,
+            wait=10,
+            attribute='provisioning_status',
+        )
+
+        self.assertEqual(['a', 'b', 'c'], [r.id for r in result])
+        # The pending load balancers have different statuses and projects,
+        # the whole collection is listed once per round
+        self.assertEqual(
+            [
+                mock.call(
+                    '/lbaas/loadbalancers',
+                    headers={'Accept': 'application/json'},
+                    params={},
+                    microversion=None,
+                    skip_cache=True,
+                ),
+            ]
+            * 2,
+            self.session.get.call_args_list,
+        )
+
+    def test_wait_for_many_not_listed(self):
+        res = self.test_class(id='a', status='building')
+        self.session.get.side_effect = [
+            self._list_response(),
+            exceptions.NotFoundException('gone'),
+        ]
+
+        result = resource.wait_for_many(
+            self.session, [res], 'active', None, interval=0.01, wait=1
+        )
+
+        self.assertIsInstance(result[0], exceptions.ResourceFailure)
+        self.assertIn('went away', str(result[0]))
+        self.session.get.assert_called_with(
+            'things/a', microversion=None, params={}, skip_cache=True
+        )
+
+    def test_wait_for_many_timeout(self):
+        responses = iter(
+            [
+                self._list_response(
+                    {'id': 'a', 'status': 'active'},
+                    {'id': 'b', 'status': 'building'},
+                ),
+            ]
+        )
+        self.session.get.side_effect = lambda *args, **kwargs: next(
+            responses,
+            self._list_response({'id': 'b', 'status': 'building'}),
+        )
+
+        exc = self.assertRaises(
+            exceptions.ResourceTimeout,
+            resource.wait_for_many,
+            self.session,
+            [
+                self.test_class(id='a', status='building'),
+                self.test_class(id='b', status='building'),
+            ],
+            'active',
+            None,
+            interval=0.01,
+            wait=0.05,
+        )
+        self.assertEqual(
+            'Timeout waiting for 1 resources to transition to active: '
+            'Test:b',
+            str(exc),
+        )
+
+
 @mock.patch.object(resource.Resource, '_get_microversion', autospec=True)
 class TestAssertMicroversionFor(base.TestCase):
     session = mock.Mock()
@@ -15,12 +15,14 @@
 # under the License.
 
 import itertools
+import json
 import os
 import pprint
 import select
 import socket
 import threading
 import time
+from unittest import mock
 
 import fixtures
 from keystoneauth1 import exceptions
@@ -28,6 +30,9 @@ import prometheus_client
 from requests import exceptions as rexceptions
 import testtools.content
 
+from openstack import _metrics
+from openstack import connection
+from openstack import proxy
 from openstack.tests.unit import base
 
 
@@ -163,6 +168,7 @@ class TestStats(base.TestCase):
         raise Exception("Key %s not found in reported stats" % key)
 
     def assert_prometheus_stat(self, name, value, labels=None):
+        self.assertTrue(_metrics.get_pipeline().flush(timeout=5))
         sample_value = self._registry.get_sample_value(name, labels)
         self.assertEqual(sample_value, value)
 
@@ -382,3 +388,267 @@ class TestNoStats(base.TestCase):
         list(self.cloud.identity.projects())
         self.assert_calls()
         self.assertEqual([], self.statsd.stats)
+
+
+class TestMetricsPipeline(base.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.session = mock.Mock()
+        self.session.get_project_id.return_value = 'project'
+        self.statsd_client = mock.MagicMock()
+        self.pipe = self.statsd_client.pipeline.return_value.__enter__()
+        self.influxdb_client = mock.Mock()
+        self.proxy = proxy.Proxy(
+            self.session,
+            service_type='compute',
+            statsd_client=self.statsd_client,
+            statsd_prefix='openstack.api',
+            influxdb_client=self.influxdb_client,
+            influxdb_config={},
+        )
+
+    def _record(self, status_code=200):
+        return _metrics.Record(
+            proxy=self.proxy,
+            url='https://compute.example.com/v2.1/servers',
+            method='GET',
+            status_code=status_code,
+            elapsed=None if status_code is None else 0.25,
+            failed=status_code is None,
+            timestamp=1700000000.5,
+        )
+
+    def test_batched(self):
+        sot = _metrics.MetricsPipeline()
+        sot._emit([self._record(), self._record(404), self._record(None)])
+
+        # One statsd pipeline and one InfluxDB write for the whole batch
+        self.statsd_client.pipeline.assert_called_once_with()
+        self.pipe.timing.assert_has_calls(
+            [
+                mock.call('openstack.api.compute.GET.servers.200', 250),
+                mock.call('openstack.api.compute.GET.servers.404', 250),
+            ]
+        )
+        self.pipe.incr.assert_has_calls(
+            [
+                mock.call('openstack.api.compute.GET.servers.200'),
+                mock.call('openstack.api.compute.GET.servers.failed'),
+                mock.call('openstack.api.compute.GET.servers.attempted'),
+            ],
+            any_order=True,
+        )
+        self.influxdb_client.write_points.assert_called_once()
+        points = self.influxdb_client.write_points.call_args[0][0]
+        self.assertEqual(3, len(points))
+        self.assertEqual('openstack_api.compute', points[0]['measurement'])
+        self.assertEqual(1700000000500000000, points[0]['time'])
+        self.assertEqual(
+            {'method': 'GET', 'name': 'servers', 'status_code': '200'},
+            points[0]['tags'],
+        )
+        self.assertEqual({'attempted': 1, 'failed': 1}, points[2]['fields'])
+
+    def test_gauge(self):
+        sot = _metrics.MetricsPipeline()
+        sot._emit(
+            [
+                _metrics.Gauge(
+                    proxy=self.proxy,
+                    name='concurrency_limit',
+                    value=5,
+                    timestamp=1700000000,
+                )
+            ]
+        )
+
+        self.pipe.gauge.assert_called_once_with(
+            'openstack.api.compute.concurrency_limit', 5
+        )
+        points = self.influxdb_client.write_points.call_args[0][0]
+        self.assertEqual(
+            [
+                dict(
+                    measurement='openstack_api.compute',
+                    time=1700000000000000000,
+                    tags={},
+                    fields={'concurrency_limit': 5},
+                )
+            ],
+            points,
+        )
+
+    def test_backend_errors(self):
+        self.influxdb_client.write_points.side_effect = Exception('boom')
+        self.pipe.timing.side_effect = Exception('boom')
+        sot = _metrics.MetricsPipeline()
+        sot._emit([self._record()])
+        self.influxdb_client.write_points.assert_called_once()
+
+    def test_overflow(self):
+        sot = _metrics.MetricsPipeline(max_queue_size=2)
+        with mock.patch.object(sot, '_start'):
+            self.assertTrue(sot.submit(self._record()))
+            self.assertTrue(sot.submit(self._record()))
+            self.assertFalse(sot.submit(self._record()))
+            self.assertFalse(sot.submit(self._record()))
+        self.assertEqual(2, sot.dropped)
+        self.assertFalse(sot.flush(timeout=0.01))
+
+        sot._start()
+        self.assertTrue(sot.flush(timeout=5))
+        self.influxdb_client.write_points.assert_called()
+        self.assertEqual(
+            2,
+            sum(
+                len(c[0][0])
+                for c in self.influxdb_client.write_points.call_args_list
+            ),
+        )
+
+    def test_report_stats(self):
+        response = mock.Mock()
+        response.request.url = 'https://compute.example.com/v2.1/servers'
+        response.request.method = 'GET'
+        response.status_code = 200
+        response.elapsed.total_seconds.return_value = 0.5
+        with mock.patch.object(
+            _metrics, 'get_pipeline'
+        ) as get_pipeline, mock.patch.object(
+            time, 'time', return_value=1700000000.5
+        ):
+            self.proxy._report_stats(response)
+        get_pipeline.return_value.submit.assert_called_once_with(
+            _metrics.Record(
+                proxy=self.proxy,
+                url='https://compute.example.com/v2.1/servers',
+                method='GET',
+                status_code=200,
+                elapsed=0.5,
+                failed=False,
+                timestamp=1700000000.5,
+            )
+        )
+
+    def test_report_stats_disabled(self):
+        sot = proxy.Proxy(self.session, service_type='compute')
+        with mock.patch.object(_metrics, 'get_pipeline') as get_pipeline:
+            sot._report_stats(None, 'url', 'GET', Exception())
+        get_pipeline.assert_not_called()
+
+
+class TestLatencyStats(base.TestCase):
+    def test_percentiles(self):
+        sot = _metrics.LatencyRecorder()
+        for ms in range(1, 101):
+            sot.record('compute', 'servers', 'GET', ms / 1000.0, False, 10)
+        sot.record('compute', 'servers', 'GET', None, True)
+        sot.record('compute', 'servers', 'GET', 0.002, True, 5)
+
+        stats = sot.snapshot().as_dict()['compute.GET.servers']
+        self.assertEqual(101, stats['count'])
+        self.assertEqual(2, stats['errors'])
+        self.assertEqual(1005, stats['bytes'])
+        self.assertEqual(1.0, stats['min_ms'])
+        self.assertEqual(100.0, stats['max_ms'])
+        self.assertAlmostEqual(5052 / 101.0, stats['mean_ms'])
+        # Percentiles are estimated within 20%
+        for percent in (50, 90, 99):
+            self.assertLessEqual(percent, stats[f'p{percent}_ms'])
+            self.assertGreaterEqual(
+                percent * 1.2, stats[f'p{percent}_ms'], percent
+            )
+
+    def test_snapshot_reset(self):
+        sot = _metrics.LatencyRecorder()
+        sot.record('compute', 'servers', 'GET', 0.1, False)
+        sot.record('network', 'networks', 'POST', 0.2, False)
+
+        snapshot = sot.snapshot()
+        sot.record('compute', 'servers', 'GET', 0.1, False)
+        # Snapshots are not affected by later requests
+        self.assertEqual(1, snapshot.as_dict()['compute.GET.servers']['count'])
+        self.assertEqual(
+            2,
+            sot.snapshot(reset=True).as_dict()['compute.GET.servers']['count'],
+        )
+        self.assertEqual(0, len(sot.snapshot()))
+
+    def test_export(self):
+        sot = _metrics.LatencyRecorder()
+        sot.record('compute', 'servers', 'GET', 0.25, False, 100)
+        sot.record('compute', 'server', 'DELETE', None, True)
+        snapshot = sot.snapshot()
+
+        self.assertEqual(snapshot.as_dict(), json.loads(snapshot.to_json()))
+        lines = snapshot.to_text().splitlines()
+        self.assertEqual(3, len(lines))
+        self.assertEqual(
+            ['name', 'count', 'errors', 'bytes', 'mean_ms'],
+            lines[0].split()[:5],
+        )
+        self.assertEqual(
+            ['compute.DELETE.server', '0', '1', '0', '-'],
+            lines[1].split()[:5],
+        )
+        self.assertEqual(
+            ['compute.GET.servers', '1', '0', '100', '250.0'],
+            lines[2].split()[:5],
+        )
+
+    def test_connection_stats(self):
+        self.register_uris(
+            [
+                dict(
+                    method='GET',
+                    uri='https://compute.example.com/v2.1/servers',
+                    status_code=200,
+                    json={'servers': []},
+                    headers={'Content-Length': '15'},
+                ),
+                dict(
+                    method='GET',
+                    uri='https://compute.example.com/v2.1/servers',
+                    status_code=500,
+                    json={},
+                ),
+            ]
+        )
+
+        self.cloud.config.config['latency_stats'] = True
+        conn = connection.Connection(config=self.cloud.config)
+
+        conn.compute.get('/servers')
+        conn.compute.get('/servers')
+        self.assert_calls()
+
+        stats = conn.stats(reset=True).as_dict()
+        self.assertEqual(['compute.GET.servers'], list(stats))
+        self.assertEqual(2, stats['compute.GET.servers']['count'])
+        self.assertEqual(1, stats['compute.GET.servers']['errors'])
+        self.assertEqual(17, stats['compute.GET.servers']['bytes'])
+        self.assertEqual({}, conn.stats().as_dict())
+
+    def test_connection_stats_disabled(self):
+        self.register_uris(
+            [
+                dict(
+                    method='GET',
+                    uri='https://compute.example.com/v2.1/servers',
+                    status_code=200,
+                    json={'servers': []},
+                ),
+            ]
+        )
+
+        self.cloud.compute.get('/servers')
+        self.assert_calls()
+
+        self.assertIsNone(self.cloud._latency_stats)
+        self.assertEqual({}, self.cloud.stats().as_dict())
+
+    def test_connection_stats_argument(self):
+        conn = connection.Connection(
+            config=self.cloud.config, latency_stats=True
+        )
+        self.assertIsInstance(conn._latency_stats, _metrics.LatencyRecorder)
@@ -11,9 +11,14 @@
 # under the License.
 
 import concurrent.futures
+import email.utils
 import hashlib
+import itertools
+import json
 import logging
 import sys
+import threading
+import time
 from unittest import mock
 
 import fixtures
@@ -386,3 +391,492 @@ class Test_md5(base.TestCase):
                 ValueError, utils.md5, None, usedforsecurity=True
             )
         self.assertRaises(TypeError, utils.md5, None, usedforsecurity=False)
+
+
+class TestJSONArrayStream(base.TestCase):
+    def _chunks(self, document, size):
+        data = json.dumps(document).encode('utf-8')
+        return [data[i : i + size] for i in range(0, len(data), size)]
+
+    def test_object(self):
+        document = {
+            'links': [{'rel': 'next', 'href': 'https://example.com'}],
+            'resources': [
+                {'id': 1, 'name': 'café', 'size': 12345},
+                {'id': 22, 'enabled': True, 'ratio': 1.5e3},
+                {'id': 333, 'tags': [], 'extra': None},
+            ],
+            'count': 3,
+        }
+        for size in (1, 2, 5, 1024):
+            sot = utils.JSONArrayStream(
+                self._chunks(document, size), 'resources'
+            )
+            self.assertEqual(document['resources'], list(sot))
+            self.assertEqual(
+                {'links': document['links'], 'count': 3}, sot.data
+            )
+
+    def test_items_yielded_before_end(self):
+        chunks = iter([b'{"resources": [{"id": 1}, ', b'{"id": 2}]}'])
+        sot = iter(utils.JSONArrayStream(chunks, 'resources'))
+
+        self.assertEqual({'id': 1}, next(sot))
+        # Only the first chunk was read so far
+        self.assertEqual([b'{"id": 2}]}'], list(chunks))
+
+    def test_list(self):
+        for size in (1, 3, 1024):
+            sot = utils.JSONArrayStream(
+                self._chunks([1, 22, 'x', {'a': [1]}], size)
+            )
+            self.assertEqual([1, 22, 'x', {'a': [1]}], list(sot))
+
+    def test_not_an_array(self):
+        sot = utils.JSONArrayStream([b'{"resources": {"id": 1}}'], 'resources')
+        self.assertEqual([{'id': 1}], list(sot))
+
+    def test_empty(self):
+        sot = utils.JSONArrayStream([b'{"resources": []}'], 'resources')
+        self.assertEqual([], list(sot))
+        self.assertEqual([], list(utils.JSONArrayStream([b'[]'])))
+
+    def test_missing_key(self):
+        sot = utils.JSONArrayStream([b'{"other": []}'], 'resources')
+        self.assertRaises(KeyError, list, sot)
+
+    def test_truncated(self):
+        sot = utils.JSONArrayStream([b'{"resources": [1, 2'], 'resources')
+        self.assertRaises(json.JSONDecodeError, list, sot)
+
+
+class TestBackoff(base.TestCase):
+    def _delays(self, backoff, wait, count=6):
+        return list(itertools.islice(backoff.delays(wait), count))
+
+    def test_abstract(self):
+        self.assertRaises(TypeError, utils.Backoff)
+
+    def test_fixed(self):
+        self.assertEqual([2] * 6, self._delays(utils.FixedBackoff(), 2))
+
+    def test_exponential(self):
+        self.assertEqual(
+            [1, 2, 4, 8, 10, 10],
+            self._delays(utils.ExponentialBackoff(max_wait=10), 1),
+        )
+
+    def test_exponential_wait_above_max(self):
+        self.assertEqual(
+            [5] * 3,
+            self._delays(utils.ExponentialBackoff(max_wait=2), 5, count=3),
+        )
+
+    def test_jitter(self):
+        delays = self._delays(
+            utils.DecorrelatedJitterBackoff(max_wait=10), 1, count=50
+        )
+        for delay in delays:
+            self.assertTrue(1 <= delay <= 10)
+        self.assertGreater(len(set(delays)), 1)
+
+    def test_get_backoff(self):
+        self.assertIsInstance(utils.get_backoff(None), utils.FixedBackoff)
+        self.assertIsInstance(
+            utils.get_backoff('jitter'), utils.DecorrelatedJitterBackoff
+        )
+        backoff = utils.get_backoff({'name': 'exponential', 'max_wait': 5})
+        self.assertIsInstance(backoff, utils.ExponentialBackoff)
+        self.assertEqual(5, backoff.max_wait)
+        self.assertIs(backoff, utils.get_backoff(backoff))
+
+    def test_get_backoff_invalid(self):
+        self.assertRaises(exceptions.SDKException, utils.get_backoff, 'nope')
+        self.assertRaises(
+            exceptions.SDKException,
+            utils.get_backoff,
+            {'name': 'exponential', 'bogus': 1},
+        )
+
+    @mock.patch('time.sleep')
+    def test_iterate_timeout_backoff(self, mock_sleep):
+        iterator = utils.iterate_timeout(
+            60, "test", wait=1, backoff='exponential'
+        )
+        for _ in range(4):
+            next(iterator)
+        self.assertEqual(
+            [mock.call(1.0), mock.call(2.0), mock.call(4.0)],
+            mock_sleep.call_args_list,
+        )
+
+    @mock.patch('time.sleep')
+    def test_iterate_timeout_retry_after(self, mock_sleep):
+        iterator = utils.iterate_timeout(
+            60, "test", wait=1, backoff='retry-after'
+        )
+        next(iterator)
+        utils.note_retry_after('5')
+        next(iterator)
+        next(iterator)
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        self.assertTrue(4 < delays[0] <= 5)
+        # The hint is only honoured once
+        self.assertEqual(1.0, delays[1])
+
+    @mock.patch('time.sleep')
+    def test_iterate_timeout_fixed_ignores_retry_after(self, mock_sleep):
+        iterator = utils.iterate_timeout(60, "test", wait=1)
+        next(iterator)
+        utils.note_retry_after('5')
+        next(iterator)
+        mock_sleep.assert_called_once_with(1.0)
+
+    def test_note_retry_after_date(self):
+        date = email.utils.formatdate(time.time() + 30, usegmt=True)
+        utils.note_retry_after(date)
+        self.assertTrue(25 < utils._pop_retry_after() <= 30)
+        self.assertEqual(0, utils._pop_retry_after())
+
+    def test_note_retry_after_invalid(self):
+        utils.note_retry_after('soon')
+        self.assertEqual(0, utils._pop_retry_after())
+
+
+class TestCacheKeyIndex(base.TestCase):
+    def test_set_operations(self):
+        sot = utils.CacheKeyIndex(['a.1'])
+        sot.add('a.2', 'a')
+        sot.add('a.2', 'a')
+        self.assertIn('a.1', sot)
+        self.assertIn('a.2', sot)
+        self.assertEqual(2, len(sot))
+        self.assertEqual({'a.1', 'a.2'}, set(sot))
+        sot.remove('a.1')
+        sot.discard('a.1')
+        self.assertRaises(KeyError, sot.remove, 'a.1')
+        self.assertEqual(['a.2'], list(sot))
+        sot.clear()
+        self.assertEqual(0, len(sot))
+
+    def test_pop_prefix(self):
+        sot = utils.CacheKeyIndex()
+        sot.add('srv.fake.fake/1.{}', 'srv.fake')
+        sot.add('srv.fake.fake/2.{}', 'srv.fake')
+        sot.add('srv.fake.sub.fake/1/sub.{}', 'srv.fake.sub')
+        sot.add('srv.fakes.fakes.{}', 'srv.fakes')
+        sot.add('srv.other.other.{}', 'srv.other')
+        sot.add('srv.fake.fake/3.{}')
+
+        self.assertEqual(
+            ['srv.fake.sub.fake/1/sub.{}'],
+            sot.pop_prefix('srv.fake.sub'),
+        )
+        # Keys of a bucket named after a shorter prefix are checked one by
+        # one
+        self.assertEqual(
+            ['srv.fake.fake/2.{}'], sot.pop_prefix('srv.fake.fake/2')
+        )
+        self.assertEqual(
+            sorted(
+                [
+                    'srv.fake.fake/1.{}',
+                    'srv.fake.fake/3.{}',
+                    'srv.fakes.fakes.{}',
+                ]
+            ),
+            sorted(sot.pop_prefix('srv.fake')),
+        )
+        self.assertEqual([], sot.pop_prefix('srv.fake'))
+        self.assertEqual(['srv.other.other.{}'], list(sot))
+        self.assertEqual(['srv.other'], sot._prefixes)
+
+    def test_concurrent(self):
+        sot = utils.CacheKeyIndex()
+        removed = []
+
+        def worker(n):
+            for i in range(200):
+                sot.add('srv.r%d.%d.%d' % (n % 4, n, i), 'srv.r%d' % (n % 4))
+                if i % 50 == 0:
+                    removed.extend(sot.pop_prefix('srv.r%d' % (n % 4)))
+
+        with concurrent.futures.ThreadPoolExecutor(8) as executor:
+            list(executor.map(worker, range(8)))
+
+        self.assertEqual(1600, len(removed) + len(sot))
+        self.assertEqual(len(removed), len(set(removed)))
+        self.assertTrue(set(removed).isdisjoint(set(sot)))
+
+
+class TestCanonicalCacheKey(base.TestCase):
+    def test_prefix_and_size(self):
+        key = utils.canonical_cache_key(
+            'compute.servers', 'servers/detail', {'params': {'x': 'y' * 500}}
+        )
+        prefix, _, digest = key.rpartition('.')
+        self.assertEqual('compute.servers', prefix)
+        self.assertEqual(64, len(digest))
+
+    def test_normalized(self):
+        key = utils.canonical_cache_key(
+            'srv.fakes',
+            'fakes',
+            {
+                'params': {'a': 1, 'b': ['x', 'y']},
+                'headers': {'Accept': 'application/json', 'X-Foo': 'bar'},
+                'microversion': None,
+            },
+        )
+        self.assertEqual(
+            key,
+            utils.canonical_cache_key(
+                'srv.fakes',
+                'fakes',
+                {
+                    'headers': {'x-foo': 'bar', 'accept': 'application/json'},
+                    'params': {'b': ['x', 'y'], 'a': 1},
+                },
+            ),
+        )
+        self.assertEqual(
+            utils.canonical_cache_key(
+                'srv.fakes', 'fakes', {'params': [('b', 2), ('a', 1)]}
+            ),
+            utils.canonical_cache_key(
+                'srv.fakes', 'fakes', {'params': [('a', 1), ('b', 2)]}
+            ),
+        )
+
+    def test_distinct(self):
+        keys = {
+            utils.canonical_cache_key('srv.fakes', 'fakes', {}),
+            utils.canonical_cache_key('srv.fakes', 'fakes/1', {}),
+            utils.canonical_cache_key(
+                'srv.fakes', 'fakes', {'params': {'a': 1}}
+            ),
+            utils.canonical_cache_key(
+                'srv.fakes', 'fakes', {'params': {'a': '1'}}
+            ),
+            utils.canonical_cache_key(
+                'srv.fakes', 'fakes', {'params': {'a': [2, 1]}}
+            ),
+            utils.canonical_cache_key(
+                'srv.fakes', 'fakes', {'params': {'a': [1, 2]}}
+            ),
+        }
+        self.assertEqual(6, len(keys))
+
+
+class TestCacheStats(base.TestCase):
+    def test_record(self):
+        sot = utils.CacheStats()
+        sot.record('a', 'hits')
+        sot.record('a', 'hits')
+        sot.record('b', 'evictions', 3)
+        stats = sot.get()
+        self.assertEqual(
+            {
+                'a': {'hits': 2, 'misses': 0, 'evictions': 0},
+                'b': {'hits': 0, 'misses': 0, 'evictions': 3},
+            },
+            stats,
+        )
+        # A copy is returned
+        stats['a']['hits'] = 10
+        self.assertEqual(2, sot.get()['a']['hits'])
+        sot.reset()
+        self.assertEqual({}, sot.get())
+
+
+class TestSingleFlight(base.TestCase):
+    def _run(self, sot, fn, followers=3):
+        release = threading.Event()
+        results = []
+        errors = []
+
+        def blocking():
+            release.wait(10)
+            return fn()
+
+        def call(func):
+            try:
+                results.append(sot.do('key', func))
+            except Exception as e:
+                errors.append(e)
+
+        leader = threading.Thread(target=call, args=(blocking,))
+        leader.start()
+        while not sot.running('key'):
+            time.sleep(0.001)
+        threads = [
+            threading.Thread(target=call, args=(self.fail,))
+            for _ in range(followers)
+        ]
+        for thread in threads:
+            thread.start()
+        while sot._flights['key'].waiters < followers:
+            time.sleep(0.001)
+        release.set()
+        for thread in [leader] + threads:
+            thread.join()
+        self.assertFalse(sot.running('key'))
+        return results, errors
+
+    def test_shared_result(self):
+        sot = utils.SingleFlight()
+        result = object()
+        fn = mock.Mock(return_value=result)
+        results, errors = self._run(sot, fn)
+        fn.assert_called_once_with()
+        self.assertEqual([result] * 4, results)
+        self.assertEqual([], errors)
+        # Calls made once the first one completed run again
+        self.assertIs(result, sot.do('key', fn))
+        self.assertEqual(2, fn.call_count)
+
+    def test_shared_error(self):
+        sot = utils.SingleFlight()
+        error = exceptions.SDKException('boom')
+        results, errors = self._run(sot, mock.Mock(side_effect=error))
+        self.assertEqual([], results)
+        self.assertEqual([error] * 4, errors)
+
+
+class TestAdaptiveConcurrencyLimiter(base.TestCase):
+    def test_additive_increase(self):
+        sot = utils.AdaptiveConcurrencyLimiter(initial=2, maximum=3)
+        with sot:
+            self.assertEqual(1, sot.in_flight)
+            self.assertFalse(sot.success())
+        self.assertEqual(0, sot.in_flight)
+        self.assertFalse(sot.success())
+        self.assertEqual(2, sot.limit)
+        # The limit grows by one every "limit" successes
+        self.assertTrue(sot.success())
+        self.assertEqual(3, sot.limit)
+        for _ in range(10):
+            sot.success()
+        self.assertEqual(3, sot.limit)
+
+    def test_multiplicative_decrease_once(self):
+        sot = utils.AdaptiveConcurrencyLimiter(initial=8)
+        with sot:
+            self.assertTrue(sot.overload())
+        self.assertEqual(4, sot.limit)
+        # Another request started under the previous limit
+        sot._local.epoch = 0
+        self.assertFalse(sot.overload())
+        self.assertEqual(4, sot.limit)
+        with sot:
+            self.assertTrue(sot.overload())
+        self.assertEqual(2, sot.limit)
+
+    def test_minimum(self):
+        sot = utils.AdaptiveConcurrencyLimiter(initial=1)
+        with sot:
+            self.assertFalse(sot.overload())
+        self.assertEqual(1, sot.limit)
+
+    def test_limit_enforced(self):
+        sot = utils.AdaptiveConcurrencyLimiter(initial=2)
+        release = threading.Event()
+        lock = threading.Lock()
+        running = []
+        peak = []
+
+        def worker():
+            with sot:
+                with lock:
+                    running.append(1)
+                    peak.append(len(running))
+                release.wait(10)
+                with lock:
+                    running.pop()
+
+        threads = [threading.Thread(target=worker) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        while sot.in_flight < 2:
+            time.sleep(0.001)
+        time.sleep(0.01)
+        self.assertEqual(2, sot.in_flight)
+        release.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(2, max(peak))
+        self.assertEqual(0, sot.in_flight)
+
+    def test_retry_after(self):
+        sot = utils.AdaptiveConcurrencyLimiter()
+        with sot:
+            sot.overload(retry_after=0.05)
+        start = time.monotonic()
+        with sot:
+            pass
+        self.assertGreaterEqual(time.monotonic() - start, 0.04)
+
+    def test_parse_retry_after(self):
+        self.assertEqual(7, utils.parse_retry_after('7'))
+        self.assertIsNone(utils.parse_retry_after('soon'))
+        self.assertIsNone(utils.parse_retry_after(None))
+
+
+class TestCircuitBreaker(base.TestCase):
+    def test_open_after_failures(self):
+        sot = utils.CircuitBreaker(failure_threshold=2)
+        self.assertTrue(sot.allow())
+        self.assertIsNone(sot.record(failed=True))
+        self.assertIsNone(sot.record(failed=False))
+        self.assertIsNone(sot.record(failed=True))
+        self.assertEqual(sot.OPEN, sot.record(failed=True))
+        self.assertEqual(2, sot.failures)
+        self.assertFalse(sot.allow())
+        self.assertGreater(sot.retry_after, 0)
+
+    @mock.patch.object(time, 'monotonic')
+    def test_half_open_probe(self, monotonic):
+        monotonic.return_value = 100
+        sot = utils.CircuitBreaker(failure_threshold=1, reset_timeout=10)
+        sot.record(failed=True)
+        self.assertEqual(sot.OPEN, sot.state)
+        monotonic.return_value = 110
+        self.assertEqual(sot.HALF_OPEN, sot.state)
+        self.assertEqual(0, sot.retry_after)
+        # Only one request probes the endpoint
+        ticket = sot.allow()
+        self.assertTrue(ticket)
+        self.assertFalse(sot.allow())
+        self.assertEqual(sot.CLOSED, sot.record(failed=False, ticket=ticket))
+        self.assertTrue(sot.allow())
+        self.assertEqual(0, sot.failures)
+
+    @mock.patch.object(time, 'monotonic')
+    def test_half_open_probe_failed(self, monotonic):
+        monotonic.return_value = 100
+        sot = utils.CircuitBreaker(failure_threshold=1, reset_timeout=10)
+        sot.record(failed=True)
+        monotonic.return_value = 110
+        ticket = sot.allow()
+        self.assertTrue(ticket)
+        self.assertEqual(sot.OPEN, sot.record(failed=True, ticket=ticket))
+        self.assertFalse(sot.allow())
+
+    @mock.patch.object(time, 'monotonic')
+    def test_half_open_probe_other_outcome(self, monotonic):
+        monotonic.return_value = 100
+        sot = utils.CircuitBreaker(failure_threshold=1, reset_timeout=10)
+        sot.record(failed=True)
+        monotonic.return_value = 110
+        probe = sot.allow()
+        self.assertTrue(probe)
+        # A request sent before the circuit opened fails meanwhile
+        self.assertEqual(sot.OPEN, sot.record(failed=True, ticket=True))
+        monotonic.return_value = 120
+        # The next half-open period gets its own probe, even though the
+        # previous one still runs
+        ticket = sot.allow()
+        self.assertTrue(ticket)
+        self.assertIsNot(probe, ticket)
+        self.assertFalse(sot.allow())
+        self.assertEqual(sot.CLOSED, sot.record(failed=False, ticket=ticket))
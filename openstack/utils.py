@@ -10,9 +10,15 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import abc
+import bisect
+import codecs
 from collections.abc import Mapping
+import email.utils
 import hashlib
+import json
 import queue
+import random
 import string
 import threading
 import time
@@ -36,13 +42,174 @@ def urljoin(*args):
     return '/'.join(str(a or '').strip('/') for a in args)
 
 
-def iterate_timeout(timeout, message, wait=2):
+class Backoff(abc.ABC):
+    """Polling strategy of :func:`iterate_timeout`
+
+    A strategy produces the successive delays between two polls. Strategies
+    which set ``retry_after`` additionally never poll again before the delay
+    requested by the last ``Retry-After`` header received by the current
+    thread has elapsed.
+    """
+
+    #: Whether Retry-After headers are honoured
+    retry_after = False
+
+    @abc.abstractmethod
+    def delays(self, wait):
+        """Yield the successive delays between polls
+
+        :param float wait: The base delay requested by the caller.
+        """
+
+
+class FixedBackoff(Backoff):
+    """Always wait the same delay between polls"""
+
+    def delays(self, wait):
+        while True:
+            yield wait
+
+
+class RetryAfterBackoff(FixedBackoff):
+    """Wait the same delay between polls unless asked to wait longer"""
+
+    retry_after = True
+
+
+class ExponentialBackoff(Backoff):
+    """Multiply the delay by ``factor`` after every poll, up to ``max_wait``"""
+
+    retry_after = True
+
+    def __init__(self, factor=2.0, max_wait=30.0):
+        self.factor = float(factor)
+        self.max_wait = float(max_wait)
+
+    def delays(self, wait):
+        delay = wait
+        while True:
+            yield min(delay, max(wait, self.max_wait))
+            delay *= self.factor
+
+
+class DecorrelatedJitterBackoff(Backoff):
+    """Pick every delay at random between ``wait`` and thrice the previous one
+
+    Randomizing the delays spreads the polls of many clients waiting on the
+    same event, so that they do not hit the API in lockstep.
+    """
+
+    retry_after = True
+
+    def __init__(self, max_wait=30.0):
+        self.max_wait = float(max_wait)
+
+    def delays(self, wait):
+        delay = wait
+        while True:
+            delay = min(
+                max(wait, self.max_wait), random.uniform(wait, delay * 3)
+            )
+            yield delay
+
+
+#: Polling strategies which can be selected by name
+BACKOFF_STRATEGIES: ty.Dict[str, ty.Type[Backoff]] = {
+    'fixed': FixedBackoff,
+    'retry-after': RetryAfterBackoff,
+    'exponential': ExponentialBackoff,
+    'jitter': DecorrelatedJitterBackoff,
+}
+
+
+def get_backoff(spec):
+    """Build a polling strategy
+
+    :param spec: A :class:`Backoff` instance, the name of a strategy from
+        :data:`BACKOFF_STRATEGIES`, a dict with such a name under the
+        ``name`` key and the arguments of the strategy, or ``None`` for the
+        default fixed delay.
+    :returns: A :class:`Backoff` instance.
+    :raises: :class:`~openstack.exceptions.SDKException` if the strategy is
+        unknown or its arguments are invalid.
+    """
+    if spec is None:
+        return FixedBackoff()
+    if isinstance(spec, Backoff):
+        return spec
+    if isinstance(spec, str):
+        spec = {'name': spec}
+    args = dict(spec)
+    name = args.pop('name', None)
+    try:
+        strategy = BACKOFF_STRATEGIES[name]
+    except KeyError:
+        raise exceptions.SDKException(
+            "Unknown polling strategy {name}. Valid strategies are "
+            "{names}".format(name=name, names=', '.join(BACKOFF_STRATEGIES))
+        )
+    try:
+        return strategy(**args)
+    except (TypeError, ValueError) as e:
+        raise exceptions.SDKException(
+            f"Invalid arguments for polling strategy {name}: {e}"
+        )
+
+
+_retry_after = threading.local()
+
+
+def parse_retry_after(value):
+    """Get the delay requested by a Retry-After header
+
+    :param value: The header value, in the delay-seconds or the HTTP-date
+        form.
+    :returns: The delay in seconds, or None if the value is invalid or the
+        delay already elapsed.
+    """
+    try:
+        delay = float(value)
+    except (TypeError, ValueError):
+        try:
+            date = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if date.tzinfo is None:
+            return None
+        delay = date.timestamp() - time.time()
+    return delay if delay > 0 else None
+
+
+def note_retry_after(value):
+    """Record the value of a Retry-After header for the current thread
+
+    Both the delay-seconds and the HTTP-date forms are accepted, invalid
+    values are ignored.
+    """
+    delay = parse_retry_after(value)
+    if delay:
+        _retry_after.until = time.monotonic() + delay
+
+
+def _pop_retry_after():
+    """Return the seconds left before the recorded Retry-After elapses"""
+    until = getattr(_retry_after, 'until', None)
+    _retry_after.until = None
+    if until is None:
+        return 0
+    return max(0, until - time.monotonic())
+
+
+def iterate_timeout(timeout, message, wait=2, backoff=None):
     """Iterate and raise an exception on timeout.
 
     This is a generator that will continually yield and sleep for
     wait seconds, and if the timeout is reached, will raise an exception
     with <message>.
 
+    :param backoff: The polling strategy deciding how long to sleep between
+        two iterations, see :func:`get_backoff`. Defaults to sleeping
+        ``wait`` seconds every time.
     """
     log = _log.setup_logging('openstack.iterate_timeout')
 
@@ -63,13 +230,21 @@ def iterate_timeout(timeout, message, wait=2):
             " instead".format(wait=wait)
         )
 
+    backoff = get_backoff(backoff)
+    delays = backoff.delays(wait)
+    # Forget any Retry-After which does not concern this loop
+    _pop_retry_after()
+
     start = time.time()
     count = 0
     while (timeout is None) or (time.time() < start + timeout):
         count += 1
         yield count
-        log.debug('Waiting %s seconds', wait)
-        time.sleep(wait)
+        delay = next(delays)
+        if backoff.retry_after:
+            delay = max(delay, _pop_retry_after())
+        log.debug('Waiting %s seconds', delay)
+        time.sleep(delay)
     raise exceptions.ResourceTimeout(message)
 
 
@@ -345,6 +520,463 @@ def _get_file_hashes(filename):
     return (_md5, _sha256)
 
 
+class CacheKeyIndex:
+    """Set of cache keys indexed by prefix
+
+    Keys are stored in buckets named after the prefix they were added with
+    (the key itself when no prefix is given), and the bucket names are kept
+    sorted. :meth:`pop_prefix` therefore only visits the buckets which can
+    hold keys starting with the requested string, instead of every key ever
+    added. All operations are protected by a lock, so the index can be
+    shared between threads.
+    """
+
+    def __init__(self, keys=None):
+        self._lock = threading.Lock()
+        self._buckets: ty.Dict[str, ty.Set[str]] = {}
+        self._prefixes: ty.List[str] = []
+        self._key_prefixes: ty.Dict[str, str] = {}
+        for key in keys or ():
+            self.add(key)
+
+    def __contains__(self, key):
+        return key in self._key_prefixes
+
+    def __len__(self):
+        return len(self._key_prefixes)
+
+    def __iter__(self):
+        with self._lock:
+            keys = list(self._key_prefixes)
+        return iter(keys)
+
+    def add(self, key, prefix=None):
+        """Add a key to the index.
+
+        :param key: The cache key.
+        :param prefix: The prefix of the key used to bucket it. Keys which
+            are invalidated together should share it.
+        """
+        if prefix is None or not key.startswith(prefix):
+            prefix = key
+        with self._lock:
+            if key in self._key_prefixes:
+                return
+            bucket = self._buckets.get(prefix)
+            if bucket is None:
+                bucket = self._buckets[prefix] = set()
+                bisect.insort(self._prefixes, prefix)
+            bucket.add(key)
+            self._key_prefixes[key] = prefix
+
+    def discard(self, key):
+        """Remove a key from the index if it is present."""
+        with self._lock:
+            prefix = self._key_prefixes.pop(key, None)
+            if prefix is None:
+                return
+            bucket = self._buckets[prefix]
+            bucket.discard(key)
+            if not bucket:
+                self._drop_bucket(prefix)
+
+    def remove(self, key):
+        """Remove a key from the index.
+
+        :raises: KeyError if the key is not present.
+        """
+        if key not in self:
+            raise KeyError(key)
+        self.discard(key)
+
+    def clear(self):
+        with self._lock:
+            self._buckets.clear()
+            self._prefixes.clear()
+            self._key_prefixes.clear()
+
+    def pop_prefix(self, prefix):
+        """Remove and return all keys starting with the given string.
+
+        :param prefix: The string the keys to remove start with.
+        :returns: A list of the removed keys.
+        """
+        removed: ty.List[str] = []
+        with self._lock:
+            # Buckets named after a string starting with the prefix are
+            # contiguous in the sorted list and are dropped as a whole.
+            start = bisect.bisect_left(self._prefixes, prefix)
+            end = start
+            while end < len(self._prefixes) and self._prefixes[end].startswith(
+                prefix
+            ):
+                removed.extend(self._buckets.pop(self._prefixes[end]))
+                end += 1
+            del self._prefixes[start:end]
+
+            # Buckets named after a shorter string may still hold some
+            # matching keys, check only those.
+            for length in range(1, len(prefix)):
+                name = prefix[:length]
+                bucket = self._buckets.get(name)
+                if bucket is None:
+                    continue
+                matches = [key for key in bucket if key.startswith(prefix)]
+                bucket.difference_update(matches)
+                removed.extend(matches)
+                if not bucket:
+                    self._drop_bucket(name)
+
+            for key in removed:
+                del self._key_prefixes[key]
+        return removed
+
+    def _drop_bucket(self, prefix):
+        del self._buckets[prefix]
+        index = bisect.bisect_left(self._prefixes, prefix)
+        del self._prefixes[index]
+
+
+def _canonical_cache_value(value, lower_keys=False):
+    if isinstance(value, Mapping):
+        return {
+            (str(k).lower() if lower_keys else str(k)): _canonical_cache_value(
+                v
+            )
+            for k, v in value.items()
+        }
+    if isinstance(value, (set, frozenset)):
+        return sorted(_canonical_cache_value(v) for v in value)
+    if isinstance(value, (list, tuple)):
+        return [_canonical_cache_value(v) for v in value]
+    if isinstance(value, bytes):
+        return value.decode('utf-8', 'backslashreplace')
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return repr(value)
+
+
+def canonical_cache_key(prefix, url, request_kwargs):
+    """Build the cache key of an API request
+
+    The URL and the request arguments are normalized, so that equivalent
+    requests get the same key regardless of the ordering of their
+    parameters or the case of their header names, and hashed into a fixed
+    size digest. The human readable prefix is kept in front of the digest
+    so that the keys of a resource can be invalidated together.
+
+    :param prefix: The cache key prefix of the resource.
+    :param url: The URL of the request.
+    :param request_kwargs: The keyword arguments of the request.
+    :returns: A key of the form ``<prefix>.<sha256 hexdigest>``.
+    """
+    canonical = {}
+    for name, value in request_kwargs.items():
+        if value is None:
+            continue
+        if name == 'params' and not isinstance(value, Mapping):
+            # A list of (name, value) pairs. The order of pairs with
+            # distinct names does not matter.
+            value = sorted(
+                _canonical_cache_value(list(value)), key=lambda p: repr(p[:1])
+            )
+        elif name == 'headers':
+            value = _canonical_cache_value(value, lower_keys=True)
+        else:
+            value = _canonical_cache_value(value)
+        canonical[name] = value
+    payload = json.dumps(
+        [url, canonical], sort_keys=True, separators=(',', ':'), default=repr
+    )
+    digest = hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    return '.'.join([prefix, digest])
+
+
+class CacheStats:
+    """Counters of the API response cache, per cache key prefix
+
+    Safe for concurrent use.
+    """
+
+    COUNTERS = ('hits', 'misses', 'evictions')
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: ty.Dict[str, ty.Dict[str, int]] = {}
+
+    def record(self, prefix, counter, count=1):
+        """Increment a counter of a prefix.
+
+        :param prefix: The cache key prefix.
+        :param counter: One of :attr:`COUNTERS`.
+        :param count: The increment.
+        """
+        with self._lock:
+            counters = self._counters.get(prefix)
+            if counters is None:
+                counters = self._counters[prefix] = dict.fromkeys(
+                    self.COUNTERS, 0
+                )
+            counters[counter] += count
+
+    def get(self):
+        """Return a copy of the counters, keyed by prefix."""
+        with self._lock:
+            return {
+                prefix: dict(counters)
+                for prefix, counters in self._counters.items()
+            }
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Run concurrent calls sharing a key only once
+
+    The first caller for a key runs the function, callers arriving while it
+    runs wait for it and get the same result, or the same exception. Safe
+    for concurrent use.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights: ty.Dict[ty.Hashable, _Flight] = {}
+
+    def running(self, key):
+        """Whether a call for the key is in progress."""
+        return key in self._flights
+
+    def do(self, key, fn, *args, **kwargs):
+        """Call ``fn(*args, **kwargs)`` unless a call for the key is running.
+
+        :param key: The key identifying identical calls.
+        :param fn: The function to call.
+        :returns: The result of the call, possibly made by another thread.
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+            else:
+                flight.waiters += 1
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+        try:
+            flight.result = fn(*args, **kwargs)
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return flight.result
+
+
+class AdaptiveConcurrencyLimiter:
+    """Concurrency limit adjusted to the load of a service
+
+    The limit follows an additive increase, multiplicative decrease scheme:
+    it grows by one every ``limit`` successful requests and is multiplied by
+    ``decrease_factor`` when the service reports being overloaded. Only the
+    first overload signal of requests started under the same limit shrinks
+    it, so that a burst of failures shrinks it only once. A ``Retry-After``
+    delay sent with an overload signal holds back all new requests.
+
+    Use it as a context manager around each request, then report the
+    outcome with :meth:`success` or :meth:`overload` from the same thread.
+    """
+
+    def __init__(
+        self, initial=10, minimum=1, maximum=100, decrease_factor=0.5
+    ):
+        self.minimum = max(1, int(minimum))
+        self.maximum = max(self.minimum, int(maximum))
+        self._limit = float(min(max(initial, self.minimum), self.maximum))
+        self._decrease_factor = decrease_factor
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        self._epoch = 0
+        self._blocked_until = 0.0
+        self._local = threading.local()
+
+    @property
+    def limit(self):
+        """The current number of requests allowed to run concurrently."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self):
+        """The number of requests currently running."""
+        return self._in_flight
+
+    def __enter__(self):
+        with self._cond:
+            while True:
+                delay = self._blocked_until - time.monotonic()
+                if delay > 0:
+                    self._cond.wait(delay)
+                elif self._in_flight >= int(self._limit):
+                    self._cond.wait()
+                else:
+                    break
+            self._in_flight += 1
+            self._local.epoch = self._epoch
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify()
+
+    def success(self):
+        """Report a request the service handled.
+
+        :returns: Whether the limit changed.
+        """
+        with self._cond:
+            before = int(self._limit)
+            self._limit = min(self.maximum, self._limit + 1 / self._limit)
+            changed = int(self._limit) != before
+            if changed:
+                self._cond.notify()
+        return changed
+
+    def overload(self, retry_after=None):
+        """Report a request rejected or timed out because of the load.
+
+        :param retry_after: The number of seconds the service asked to wait
+            before sending new requests, if any.
+        :returns: Whether the limit changed.
+        """
+        with self._cond:
+            before = int(self._limit)
+            if getattr(self._local, 'epoch', self._epoch) == self._epoch:
+                self._limit = max(
+                    self.minimum, self._limit * self._decrease_factor
+                )
+                self._epoch += 1
+            if retry_after:
+                self._blocked_until = max(
+                    self._blocked_until, time.monotonic() + retry_after
+                )
+            self._cond.notify_all()
+            return int(self._limit) != before
+
+
+class CircuitBreaker:
+    """Stop sending requests to an endpoint which keeps failing
+
+    The circuit opens after ``failure_threshold`` consecutive failures, and
+    requests are then refused without reaching the endpoint. Once
+    ``reset_timeout`` seconds elapsed the circuit is half-open: a single
+    request is let through to probe the endpoint, which closes the circuit
+    if it succeeds and opens it again otherwise.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half-open'
+
+    def __init__(self, failure_threshold=5, reset_timeout=30):
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = None
+        # The ticket of the request probing the endpoint, if any
+        self._probe = None
+
+    def _state(self):
+        if self._opened_at is None:
+            return self.CLOSED
+        if time.monotonic() - self._opened_at < self.reset_timeout:
+            return self.OPEN
+        return self.HALF_OPEN
+
+    @property
+    def state(self):
+        """The state of the circuit: closed, open or half-open."""
+        with self._lock:
+            return self._state()
+
+    @property
+    def failures(self):
+        """The number of consecutive failures."""
+        return self._failures
+
+    @property
+    def retry_after(self):
+        """The number of seconds before the circuit is half-open."""
+        with self._lock:
+            if self._opened_at is None:
+                return 0
+            return max(
+                0, self._opened_at + self.reset_timeout - time.monotonic()
+            )
+
+    def allow(self):
+        """Check whether a request may be sent.
+
+        While the circuit is half-open, only the first caller is allowed to
+        send a request, until the outcome of that request is recorded or the
+        circuit opens again.
+
+        :returns: A ticket to pass to :meth:`record` with the outcome of the
+            request if it may be sent, else False.
+        """
+        with self._lock:
+            state = self._state()
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and self._probe is None:
+                self._probe = object()
+                return self._probe
+            return False
+
+    def record(self, failed, ticket=None):
+        """Record the outcome of a request.
+
+        :param failed: Whether the endpoint failed to handle the request.
+        :param ticket: The ticket returned by :meth:`allow` for the request.
+            Only the outcome of the probing request lets another request
+            probe the endpoint.
+        :returns: The new state of the circuit if it changed, else None.
+        """
+        with self._lock:
+            before = self._state()
+            if ticket is not None and ticket is self._probe:
+                self._probe = None
+            if not failed:
+                self._failures = 0
+                self._opened_at = None
+            else:
+                self._failures += 1
+                if before == self.HALF_OPEN or (
+                    before == self.CLOSED
+                    and self._failures >= self.failure_threshold
+                ):
+                    self._opened_at = time.monotonic()
+                    # A probe still running was let through before, the
+                    # next half-open period gets its own
+                    self._probe = None
+            after = self._state()
+        return after if after != before else None
+
+
 class TinyDAG:
     """Tiny DAG
 
@@ -451,6 +1083,139 @@ class TinyDAG:
         return len(self._done) == self.size()
 
 
+class JSONArrayStream:
+    """Incrementally decode the items of a JSON array from a byte stream.
+
+    Iterating over the object yields the items of the array one by one as
+    soon as they have been received, so that neither the whole document nor
+    the whole array has to be kept in memory. The array is either the
+    document itself, or the ``key`` member of a top level object. Any other
+    members of that object are collected in :attr:`data`, which is complete
+    once iteration has finished.
+
+    If the selected value is not an array it is yielded as the only item.
+
+    :param chunks: Iterable of ``bytes`` chunks, e.g.
+        :meth:`requests.Response.iter_content`.
+    :param str key: Name of the member of the top level object holding the
+        array, or ``None`` if the document is the array.
+    """
+
+    _WHITESPACE = ' \t\n\r'
+
+    def __init__(self, chunks, key=None):
+        self.key = key
+        self.data: ty.Any = None
+        self._chunks = iter(chunks)
+        self._decoder = json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+
+    def _read(self):
+        """Append the next chunk to the buffer, return False on EOF"""
+        if self._eof:
+            return False
+        # Drop what was already parsed so the buffer does not keep growing
+        self._buffer = self._buffer[self._pos :]
+        self._pos = 0
+        for chunk in self._chunks:
+            if chunk:
+                self._buffer += self._text.decode(chunk)
+                return True
+        self._buffer += self._text.decode(b'', final=True)
+        self._eof = True
+        return False
+
+    def _peek(self):
+        """Skip whitespace and return the next character ('' at EOF)"""
+        while True:
+            while (
+                self._pos < len(self._buffer)
+                and self._buffer[self._pos] in self._WHITESPACE
+            ):
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._read():
+                return ''
+
+    def _expect(self, chars):
+        char = self._peek()
+        if not char or char not in chars:
+            raise json.JSONDecodeError(
+                'Expecting one of %r' % chars, self._buffer, self._pos
+            )
+        self._pos += 1
+        return char
+
+    def _value(self):
+        """Decode the next complete JSON value"""
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._read():
+                    raise
+                continue
+            # A number (or literal) ending at the buffer boundary might
+            # continue in the next chunk.
+            if end == len(self._buffer) and self._read():
+                continue
+            self._pos = end
+            return value
+
+    def _array(self):
+        if self._peek() != '[':
+            yield self._value()
+            return
+        self._pos += 1
+        if self._peek() == ']':
+            self._pos += 1
+            return
+        while True:
+            yield self._value()
+            if self._expect(',]') == ']':
+                return
+
+    def __iter__(self):
+        if self.key is None:
+            if self._peek() == '[':
+                self.data = []
+                yield from self._array()
+            else:
+                self.data = self._value()
+                yield self.data
+            return
+
+        if self._peek() != '{':
+            # Not an object, behave like indexing the decoded document
+            self.data = self._value()
+            yield from self.data[self.key]
+            return
+
+        self._pos += 1
+        self.data = {}
+        found = False
+        if self._peek() == '}':
+            self._pos += 1
+        else:
+            while True:
+                name = self._value()
+                self._expect(':')
+                if name == self.key:
+                    found = True
+                    yield from self._array()
+                else:
+                    self.data[name] = self._value()
+                if self._expect(',}') == '}':
+                    break
+        if not found:
+            raise KeyError(self.key)
+
+
 # Importing Munch is a relatively expensive operation (0.3s) while we do not
 # really even need much of it. Before we can rework all places where we rely on
 # it we can have a reduced version.
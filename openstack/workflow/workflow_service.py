@@ -11,12 +11,11 @@
 # under the License.
 
 from openstack import service_description
-from openstack.workflow.v2 import _proxy
 
 
 class WorkflowService(service_description.ServiceDescription):
     """The workflow service."""
 
     supported_versions = {
-        '2': _proxy.Proxy,
+        '2': 'openstack.workflow.v2._proxy.Proxy',
     }
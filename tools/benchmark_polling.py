@@ -0,0 +1,146 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Compare the polling strategies of ``utils.iterate_timeout``.
+
+A local fake API serves jobs which complete after a random delay. Many
+clients wait for their own job concurrently, each polling the API with
+``utils.iterate_timeout`` like the resource waiters do, and the total
+number of requests is reported together with how late clients noticed that
+their job completed.
+
+Usage::
+
+    python tools/benchmark_polling.py [--clients N] [--min-duration S]
+        [--max-duration S] [--interval S] [--retry-after S]
+        [--strategy NAME ...]
+"""
+
+import argparse
+import http.server
+import json
+import random
+import statistics
+import threading
+import time
+
+import requests
+
+from openstack import utils
+
+
+class FakeAPI(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, durations, retry_after):
+        super().__init__(('127.0.0.1', 0), FakeHandler)
+        self.retry_after = retry_after
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.start = time.monotonic()
+        self.ready = [self.start + duration for duration in durations]
+
+
+class FakeHandler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests += 1
+        job = int(self.path.rsplit('/', 1)[-1])
+        done = time.monotonic() >= server.ready[job]
+        body = json.dumps({'status': 'done' if done else 'running'})
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        if not done and server.retry_after:
+            self.send_header('Retry-After', str(server.retry_after))
+        self.end_headers()
+        self.wfile.write(body.encode())
+
+    def log_message(self, *args):
+        pass
+
+
+def run(strategy, args):
+    durations = [
+        random.uniform(args.min_duration, args.max_duration)
+        for _ in range(args.clients)
+    ]
+    api = FakeAPI(durations, args.retry_after)
+    threading.Thread(target=api.serve_forever, daemon=True).start()
+    url = 'http://127.0.0.1:%d/jobs/' % api.server_address[1]
+    delays = []
+
+    def client(job):
+        session = requests.Session()
+        for _ in utils.iterate_timeout(
+            args.timeout, 'Timeout', wait=args.interval, backoff=strategy
+        ):
+            response = session.get(url + str(job))
+            if 'Retry-After' in response.headers:
+                utils.note_retry_after(response.headers['Retry-After'])
+            if response.json()['status'] == 'done':
+                delays.append(time.monotonic() - api.ready[job])
+                return
+
+    threads = [
+        threading.Thread(target=client, args=(job,))
+        for job in range(args.clients)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    api.shutdown()
+    api.server_close()
+
+    delays.sort()
+    print(
+        '%-12s requests: %6d (%5.1f/client)  detection delay: '
+        'mean %5.2fs p95 %5.2fs max %5.2fs'
+        % (
+            strategy,
+            api.requests,
+            api.requests / args.clients,
+            statistics.mean(delays),
+            delays[int(len(delays) * 0.95) - 1],
+            delays[-1],
+        )
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--clients', type=int, default=200)
+    parser.add_argument('--min-duration', type=float, default=1.0)
+    parser.add_argument('--max-duration', type=float, default=10.0)
+    parser.add_argument('--interval', type=float, default=0.5)
+    parser.add_argument('--timeout', type=float, default=120.0)
+    parser.add_argument(
+        '--retry-after',
+        type=int,
+        default=0,
+        help='Send this Retry-After value with responses of pending jobs',
+    )
+    parser.add_argument(
+        '--strategy',
+        action='append',
+        choices=sorted(utils.BACKOFF_STRATEGIES),
+        help='Strategy to measure, may be repeated (default: all)',
+    )
+    args = parser.parse_args()
+
+    for strategy in args.strategy or list(utils.BACKOFF_STRATEGIES):
+        run(strategy, args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Measure how fast Resource objects can be built from API responses.
+
+This mimics what ``Resource.list`` does for every element of a page, i.e.
+calling ``Resource.existing`` with the raw JSON body of a resource, and
+reports the number of objects constructed per second.
+
+Usage::
+
+    python tools/benchmark_resource.py [--count N] [--repeat N]
+"""
+
+import argparse
+import time
+
+from openstack.compute.v2 import server
+from openstack.network.v2 import port
+
+
+PORT = {
+    'admin_state_up': True,
+    'allowed_address_pairs': [],
+    'binding:host_id': 'compute-1',
+    'binding:profile': {},
+    'binding:vif_details': {'port_filter': True},
+    'binding:vif_type': 'ovs',
+    'binding:vnic_type': 'normal',
+    'created_at': '2024-01-01T00:00:00Z',
+    'description': '',
+    'device_id': '5e3898d7-11be-483e-9732-b2f5eccd2b2e',
+    'device_owner': 'compute:nova',
+    'extra_dhcp_opts': [],
+    'fixed_ips': [
+        {
+            'ip_address': '10.0.0.5',
+            'subnet_id': 'a0304c3a-4f08-4c43-88af-d796509c97d2',
+        }
+    ],
+    'id': '46d4bfb9-b26e-41f3-bd2e-e6dcc1ccedb2',
+    'mac_address': 'fa:16:3e:23:fd:d7',
+    'name': 'port-1',
+    'network_id': 'a87cc70a-3e15-4acf-8205-9b711a3531b7',
+    'port_security_enabled': True,
+    'project_id': '7e02058126cc4950b75f9970368ba177',
+    'revision_number': 1,
+    'security_groups': ['f0ac4394-7e4a-4409-9701-ba8be283dbc3'],
+    'status': 'ACTIVE',
+    'tags': [],
+    'tenant_id': '7e02058126cc4950b75f9970368ba177',
+    'updated_at': '2024-01-01T00:00:00Z',
+}
+
+SERVER = {
+    'OS-DCF:diskConfig': 'AUTO',
+    'OS-EXT-AZ:availability_zone': 'nova',
+    'OS-EXT-STS:power_state': 1,
+    'OS-EXT-STS:task_state': None,
+    'OS-EXT-STS:vm_state': 'active',
+    'OS-SRV-USG:launched_at': '2024-01-01T00:00:00.000000',
+    'accessIPv4': '',
+    'accessIPv6': '',
+    'addresses': {
+        'private': [
+            {
+                'OS-EXT-IPS-MAC:mac_addr': 'fa:16:3e:23:fd:d7',
+                'OS-EXT-IPS:type': 'fixed',
+                'addr': '10.0.0.5',
+                'version': 4,
+            }
+        ]
+    },
+    'config_drive': '',
+    'created': '2024-01-01T00:00:00Z',
+    'flavor': {'id': '1', 'links': []},
+    'hostId': '2091634baaccdc4c5a1d57069c833e402921df696b7f970791b12ec6',
+    'id': '5e3898d7-11be-483e-9732-b2f5eccd2b2e',
+    'image': {'id': '70a599e0-31e7-49b7-b260-868f441e862b', 'links': []},
+    'key_name': None,
+    'links': [],
+    'metadata': {'My Server Name': 'Apache1'},
+    'name': 'new-server-test',
+    'os-extended-volumes:volumes_attached': [],
+    'progress': 0,
+    'security_groups': [{'name': 'default'}],
+    'status': 'ACTIVE',
+    'tenant_id': '6f70656e737461636b20342065766572',
+    'updated': '2024-01-01T00:00:00Z',
+    'user_id': 'fake',
+}
+
+
+def _bench(resource_cls, body, count, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(count):
+            resource_cls.existing(**body)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return count / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    for resource_cls, body in ((port.Port, PORT), (server.Server, SERVER)):
+        rate = _bench(resource_cls, body, args.count, args.repeat)
+        print(f'{resource_cls.__name__:>10}: {rate:10.0f} objects/sec')
+
+
+if __name__ == '__main__':
+    main()